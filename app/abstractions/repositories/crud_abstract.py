@@ -11,6 +11,14 @@ class ReadableRepository(ABC, Generic[T, F]):
     def get_by_id(self, obj_id: int) -> T | None:
         pass
 
+    @abstractmethod
+    def get_many(self, obj_ids: list) -> dict:
+        pass
+
+    @abstractmethod
+    def prefetch(self, obj_ids: list) -> None:
+        pass
+
     @abstractmethod
     def get_all(
         self, offset: int = 0, limit: int = 100, sort: S | None = None
@@ -35,6 +43,24 @@ class FilterableRepository(ABC, Generic[T, F]):
     ) -> list[T]:
         pass
 
+    @abstractmethod
+    def get_filtered_rows(
+        self, filter: F, offset: int = 0, limit: int = 100, sort: S | None = None
+    ) -> list:
+        pass
+
+    @abstractmethod
+    def get_filtered_rows_page(
+        self, filter: F, offset: int = 0, limit: int = 100, sort: S | None = None
+    ) -> tuple[list, bool]:
+        pass
+
+    @abstractmethod
+    def get_filtered_rows_with_count(
+        self, filter: F, offset: int = 0, limit: int = 100, sort: S | None = None
+    ) -> tuple[list, int]:
+        pass
+
     @abstractmethod
     def count(self, filter: F):
         pass
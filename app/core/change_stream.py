@@ -0,0 +1,272 @@
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Callable, Iterator, Protocol
+from loguru import logger
+from sqlalchemy import Connection, inspect
+from sqlalchemy.orm import object_session
+from app.core.metrics import register_metrics
+from app.utils.filters.filter_matcher import FilterMatcher
+from app.utils.uuid7 import uuid7
+
+# Identifica a este proceso para descartar sus propias notificaciones
+ORIGIN = uuid7().hex
+
+
+class ChangeEvent:
+    """Cambio confirmado (commit) sobre una entidad"""
+
+    __slots__ = ("id", "type", "model", "entity_id", "data", "origin")
+
+    def __init__(
+        self,
+        type: str,
+        model: str,
+        entity_id: str,
+        data: dict[str, Any] | None,
+        id: str | None = None,
+        origin: str = ORIGIN,
+    ):
+        self.id = id or uuid7().hex
+        self.type = type
+        self.model = model
+        self.entity_id = entity_id
+        self.data = data
+        self.origin = origin
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "model": self.model,
+            "entity_id": self.entity_id,
+            "data": self.data,
+            "origin": self.origin,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "ChangeEvent":
+        return cls(
+            type=payload["type"],
+            model=payload["model"],
+            entity_id=payload["entity_id"],
+            data=payload.get("data"),
+            id=payload.get("id"),
+            origin=payload.get("origin", ""),
+        )
+
+    def to_sse(self) -> str:
+        data = json.dumps({"entity_id": self.entity_id, "data": self.data})
+        return f"id: {self.id}\nevent: {self.type}\ndata: {data}\n\n"
+
+
+class ChangeBridge(Protocol):
+    """Reparte los eventos al resto de procesos"""
+
+    def send(self, event: ChangeEvent, connection: Connection) -> None:
+        """Envía el evento en la transacción (`connection`) que confirma el cambio"""
+        ...
+
+
+class ChangeSubscription:
+    """
+    Cola de eventos de un suscriptor, ligada a su bucle de eventos.
+
+    La cola es acotada: si el cliente no consume a tiempo se marca como
+    desbordada y el stream se cierra para que el cliente se resincronice, en
+    lugar de perder eventos en silencio.
+    """
+
+    __slots__ = ("model", "loop", "queue", "overflowed")
+
+    def __init__(self, model: str, loop: asyncio.AbstractEventLoop, max_queue: int):
+        self.model = model
+        self.loop = loop
+        self.queue: asyncio.Queue[ChangeEvent] = asyncio.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def offer(self, event: ChangeEvent) -> None:
+        """Encola el evento (se ejecuta en el bucle del suscriptor)"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self, timeout: float) -> ChangeEvent | None:
+        """Siguiente evento o None si no llega ninguno en `timeout` segundos"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ChangeBroadcaster:
+    """
+    Difusor en proceso de cambios confirmados.
+
+    Los repositorios publican desde los hilos del pool tras el commit; cada
+    suscriptor recibe el evento en su propio bucle mediante
+    call_soon_threadsafe. Con un puente configurado (LISTEN/NOTIFY) los
+    eventos llegan también a los suscriptores de otros workers.
+    """
+
+    def __init__(self):
+        self._subscriptions: set[ChangeSubscription] = set()
+        self._listeners: dict[str, list[Callable[[ChangeEvent], None]]] = {}
+        self._lock = threading.Lock()
+        self.bridge: ChangeBridge | None = None
+        self.published = 0
+        self.received = 0
+        self.overflows = 0
+
+    @property
+    def active(self) -> bool:
+        """Hay alguien a quien entregar eventos (suscriptores o puente)"""
+        return bool(self._subscriptions) or self.bridge is not None
+
+    @contextmanager
+    def subscribe(self, model: str, max_queue: int) -> Iterator[ChangeSubscription]:
+        """Registra un suscriptor; debe llamarse desde su bucle de eventos"""
+        subscription = ChangeSubscription(model, asyncio.get_running_loop(), max_queue)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                self._subscriptions.discard(subscription)
+            if subscription.overflowed:
+                self.overflows += 1
+
+    def add_listener(self, model: str, listener: Callable[[ChangeEvent], None]) -> None:
+        """
+        Registra una función que recibe, en el hilo que lo entrega, cada evento
+        de `model` (p. ej. para invalidar cachés). No activa la publicación:
+        sin suscriptores ni puente, publish_change no genera eventos.
+        """
+        with self._lock:
+            self._listeners.setdefault(model, []).append(listener)
+
+    def publish(self, event: ChangeEvent) -> None:
+        """
+        Entrega localmente un cambio ya confirmado; el puente lo recibió antes
+        del commit (ver stage_change).
+        """
+        self.published += 1
+        self.deliver(event)
+
+    def deliver(self, event: ChangeEvent) -> None:
+        """Entrega el evento a los suscriptores de este proceso"""
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions if s.model == event.model]
+            listeners = list(self._listeners.get(event.model, ()))
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"Change listener error: {e}")
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # Bucle ya cerrado: el suscriptor se está desconectando
+                pass
+
+    def receive(self, event: ChangeEvent) -> None:
+        """Entrada del puente: descarta los eventos publicados por este proceso"""
+        if event.origin == ORIGIN:
+            return
+        self.received += 1
+        self.deliver(event)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "subscribers": len(self._subscriptions),
+            "published": self.published,
+            "received": self.received,
+            "overflows": self.overflows,
+            "bridge": type(self.bridge).__name__ if self.bridge else None,
+        }
+
+
+broadcaster = ChangeBroadcaster()
+register_metrics("change_stream", broadcaster.metrics)
+
+
+def stage_change(
+    type: str, model_class: type, entity: Any, connection: Connection
+) -> ChangeEvent | None:
+    """
+    Prepara el evento de un cambio aún sin confirmar; no hace nada si nadie
+    escucha.
+
+    `entity` es la entidad (se vuelca la sesión para leer los valores del
+    servidor) o un diccionario ya serializado (p. ej. la copia de una entidad
+    borrada). Con puente, el evento se envía en `connection`, la de la
+    transacción del cambio: PostgreSQL solo entrega el NOTIFY si hay commit
+    y no hace falta otra conexión del pool. Tras el commit, publish_change
+    lo entrega en este proceso.
+    """
+    if not broadcaster.active:
+        return None
+    if not isinstance(entity, dict):
+        session = object_session(entity)
+        session.flush()
+        expired = inspect(entity).expired_attributes
+        if expired:
+            # p. ej. updated_at tras un UPDATE con onupdate en SQL
+            session.refresh(entity, list(expired))
+        entity = entity.model_dump(mode="json")
+    event = ChangeEvent(
+        type=type,
+        model=model_class.__name__,
+        entity_id=str(entity["id"]),
+        data=entity,
+    )
+    bridge = broadcaster.bridge
+    if bridge is not None:
+        bridge.send(event, connection)
+    return event
+
+
+def publish_change(event: ChangeEvent | None) -> None:
+    """Entrega en este proceso un cambio preparado con stage_change y ya confirmado"""
+    if event is not None:
+        broadcaster.publish(event)
+
+
+async def stream_changes(
+    model_class: type,
+    filter_model: Any,
+    keepalive: float,
+    max_queue: int,
+    is_disconnected: Callable[[], Any] | None = None,
+) -> AsyncIterator[str]:
+    """
+    Genera los eventos SSE de los cambios de `model_class` que cumplen el
+    filtro, evaluado en Python sobre los datos del evento.
+
+    Cada `keepalive` segundos sin eventos envía un comentario para que los
+    proxies no cierren la conexión.
+    """
+    with broadcaster.subscribe(model_class.__name__, max_queue) as subscription:
+        yield ": connected\n\n"
+        while True:
+            event = await subscription.get(keepalive)
+            if subscription.overflowed:
+                yield "event: overflow\ndata: {}\n\n"
+                return
+            if event is None:
+                if is_disconnected is not None and await is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            # Sin datos (payload recortado por el puente) solo se puede
+            # entregar a quien no filtra
+            if event.data is None:
+                if getattr(filter_model, "filters", None):
+                    continue
+            elif not FilterMatcher.matches(filter_model, event.data):
+                continue
+            yield event.to_sse()
@@ -1,8 +1,8 @@
 import os
 from functools import lru_cache
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -36,6 +36,140 @@ class Settings(BaseSettings):
 
     version: str = Field(default="0.1.0", alias="VERSION")
 
+    # Arranque: "create_all" crea las tablas que falten; "verify" solo comprueba
+    # con una consulta que la base está en la revisión head de alembic
+    db_startup_mode: Literal["create_all", "verify"] = Field(
+        default="create_all", alias="DB_STARTUP_MODE"
+    )
+    alembic_config: str = Field(default="alembic.ini", alias="ALEMBIC_CONFIG")
+    db_prewarm_connections: int = Field(default=0, ge=0, alias="DB_PREWARM_CONNECTIONS")
+    startup_budget_ms: int = Field(default=2000, alias="STARTUP_BUDGET_MS")
+    import_budget_ms: int = Field(default=1500, alias="IMPORT_BUDGET_MS")
+
+    # Servidor de producción (python -m app.server)
+    server_host: str = Field(default="0.0.0.0", alias="HOST")
+    server_port: int = Field(default=8000, alias="PORT")
+    web_concurrency: int = Field(default=1, ge=1, alias="WEB_CONCURRENCY")
+    graceful_shutdown_timeout: int = Field(
+        default=30, ge=0, alias="GRACEFUL_SHUTDOWN_TIMEOUT"
+    )
+    # Conexiones totales a la base entre todos los workers (< max_connections)
+    db_max_connections: int = Field(default=20, ge=1, alias="DB_MAX_CONNECTIONS")
+    # psycopg3 (postgresql+psycopg://): ejecuciones de una misma sentencia en
+    # una conexión antes de prepararla en el servidor
+    db_prepare_threshold: int = Field(default=2, ge=0, alias="DB_PREPARE_THRESHOLD")
+    # Detrás de PgBouncer en modo transacción: sin sentencias preparadas
+    db_pgbouncer: bool = Field(default=False, alias="DB_PGBOUNCER")
+    # Perfil de producción para archivos SQLite (sqlite:///ruta.db): WAL,
+    # mmap, un escritor y varios lectores por worker y checkpoints periódicos
+    sqlite_profile: bool = Field(default=True, alias="SQLITE_PROFILE")
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000, ge=0, alias="SQLITE_BUSY_TIMEOUT_MS"
+    )
+    sqlite_cache_size_mb: int = Field(default=16, ge=1, alias="SQLITE_CACHE_SIZE_MB")
+    sqlite_mmap_size_mb: int = Field(default=256, ge=0, alias="SQLITE_MMAP_SIZE_MB")
+    sqlite_checkpoint_interval: float = Field(
+        default=60, ge=0, alias="SQLITE_CHECKPOINT_INTERVAL"
+    )
+    # Hilos para rutas y dependencias síncronas (AnyIO usa 40 por defecto)
+    thread_pool_size: int = Field(default=40, ge=1, alias="THREAD_POOL_SIZE")
+
+    # Límite de cada consulta (ms, 0 sin límite); las rutas pueden sustituirlo
+    statement_timeout_ms: int = Field(default=5000, ge=0, alias="STATEMENT_TIMEOUT_MS")
+
+    # Límites de los listados; rechazan la consulta con 400 antes de ejecutarla
+    query_max_filter_terms: int = Field(
+        default=20, ge=1, alias="QUERY_MAX_FILTER_TERMS"
+    )
+    query_max_sort_terms: int = Field(default=5, ge=1, alias="QUERY_MAX_SORT_TERMS")
+    query_max_in_list: int = Field(default=10_000, ge=1, alias="QUERY_MAX_IN_LIST")
+    query_max_offset: int = Field(default=10_000, ge=0, alias="QUERY_MAX_OFFSET")
+    # Coste máximo estimado por EXPLAIN (unidades del planificador de Postgres,
+    # 0 sin límite): por encima, la página se rechaza y el COUNT se sustituye
+    # por la estimación de filas. Se estima una vez por forma de consulta.
+    query_max_cost: float = Field(default=100_000, ge=0, alias="QUERY_MAX_COST")
+    query_guard_cache_size: int = Field(
+        default=1024, ge=1, alias="QUERY_GUARD_CACHE_SIZE"
+    )
+
+    # COUNT del listado en paralelo a la página, en otra conexión del pool;
+    # desactívalo si el pool va justo (cada listado ocupa dos conexiones)
+    parallel_count: bool = Field(default=True, alias="PARALLEL_COUNT")
+
+    # Control de admisión: {"prefijo de ruta": peticiones simultáneas}; vacío lo
+    # desactiva. Ej: ADMISSION_LIMITS='{"/test": 32}'
+    admission_limits: dict[str, int] = Field(default={}, alias="ADMISSION_LIMITS")
+    admission_queue_size: int = Field(default=100, ge=0, alias="ADMISSION_QUEUE_SIZE")
+    admission_queue_timeout_ms: int = Field(
+        default=1000, ge=0, alias="ADMISSION_QUEUE_TIMEOUT_MS"
+    )
+    admission_adaptive: bool = Field(default=False, alias="ADMISSION_ADAPTIVE")
+    admission_target_latency_ms: int = Field(
+        default=250, ge=1, alias="ADMISSION_TARGET_LATENCY_MS"
+    )
+
+    # Límite por cliente y ruta con cubos de tokens (capacidad = ráfaga)
+    rate_limit_enabled: bool = Field(default=False, alias="RATE_LIMIT_ENABLED")
+    rate_limit_capacity: int = Field(default=60, ge=1, alias="RATE_LIMIT_CAPACITY")
+    rate_limit_refill_rate: float = Field(
+        default=1.0, gt=0, alias="RATE_LIMIT_REFILL_RATE"
+    )
+    # "memory" solo sirve con un worker; "redis" comparte los cubos
+    rate_limit_backend: Literal["memory", "redis"] = Field(
+        default="memory", alias="RATE_LIMIT_BACKEND"
+    )
+    rate_limit_redis_url: str = Field(
+        default="redis://localhost:6379/0", alias="RATE_LIMIT_REDIS_URL"
+    )
+
+    # Compresión de respuestas (zstd y brotli solo si están instalados)
+    compression_enabled: bool = Field(default=True, alias="COMPRESSION_ENABLED")
+    compression_min_size: int = Field(default=1024, ge=0, alias="COMPRESSION_MIN_SIZE")
+    compression_gzip_level: int = Field(
+        default=6, ge=1, le=9, alias="COMPRESSION_GZIP_LEVEL"
+    )
+    compression_brotli_quality: int = Field(
+        default=4, ge=0, le=11, alias="COMPRESSION_BROTLI_QUALITY"
+    )
+    compression_zstd_level: int = Field(
+        default=3, ge=1, le=22, alias="COMPRESSION_ZSTD_LEVEL"
+    )
+
+    # Particionado mensual por created_at (modelos PartitionedSQLModel)
+    partition_months_ahead: int = Field(default=3, ge=0, alias="PARTITION_MONTHS_AHEAD")
+    partition_id_skew_hours: int = Field(
+        default=24, ge=0, alias="PARTITION_ID_SKEW_HOURS"
+    )
+
+    # Group commit de altas concurrentes (POST /test/heroes en ráfagas)
+    write_coalescing: bool = Field(default=False, alias="WRITE_COALESCING")
+    write_coalesce_max_batch: int = Field(
+        default=64, ge=1, alias="WRITE_COALESCE_MAX_BATCH"
+    )
+    write_coalesce_max_delay_ms: float = Field(
+        default=2.0, ge=0, alias="WRITE_COALESCE_MAX_DELAY_MS"
+    )
+
+    # Stream de cambios (SSE); el puente LISTEN/NOTIFY reparte entre workers
+    change_stream_bridge: bool = Field(default=False, alias="CHANGE_STREAM_BRIDGE")
+    change_stream_channel: str = Field(
+        default="entity_changes",
+        pattern=r"^[a-z_][a-z0-9_]*$",
+        alias="CHANGE_STREAM_CHANNEL",
+    )
+    change_stream_queue_size: int = Field(
+        default=256, ge=1, alias="CHANGE_STREAM_QUEUE_SIZE"
+    )
+    change_stream_keepalive: float = Field(
+        default=15.0, gt=0, alias="CHANGE_STREAM_KEEPALIVE"
+    )
+
+    # Réplica columnar en memoria (ColumnarReplicaRepository): segundos máximos
+    # sin recargar aunque no se haya visto ningún cambio (0 = solo al cambiar)
+    columnar_replica_max_age: float = Field(
+        default=30, ge=0, alias="COLUMNAR_REPLICA_MAX_AGE"
+    )
+
     @field_validator("debug", mode="before")
     @classmethod
     def parse_debug(cls, v: Any) -> bool:
@@ -44,6 +178,44 @@ class Settings(BaseSettings):
             return v.lower() in ("true", "1", "yes")
         return bool(v)
 
+    @field_validator("admission_limits")
+    @classmethod
+    def check_admission_limits(cls, v: dict[str, int]) -> dict[str, int]:
+        """Cada grupo debe admitir al menos una petición simultánea"""
+        invalid = {prefix: limit for prefix, limit in v.items() if limit < 1}
+        if invalid:
+            raise ValueError(f"ADMISSION_LIMITS values must be >= 1: {invalid}")
+        return v
+
+    @model_validator(mode="after")
+    def check_connection_budget(self) -> "Settings":
+        """Cada worker necesita al menos una conexión de pool más las auxiliares"""
+        per_worker = 1 + self.db_auxiliary_connections
+        if self.db_max_connections < self.web_concurrency * per_worker:
+            raise ValueError(
+                f"DB_MAX_CONNECTIONS={self.db_max_connections} cannot serve "
+                f"WEB_CONCURRENCY={self.web_concurrency} workers with "
+                f"{per_worker} connection(s) each"
+            )
+        return self
+
+    @property
+    def db_auxiliary_connections(self) -> int:
+        """
+        Conexiones por worker abiertas fuera del pool: la de LISTEN del puente
+        de cambios. El COUNT paralelo, el NOTIFY (en la conexión de la
+        sesión) y el lote del group commit salen del propio pool.
+        """
+        return 1 if self.change_stream_bridge else 0
+
+    @property
+    def db_pool_size(self) -> int:
+        """Tamaño del pool de cada worker para no superar db_max_connections"""
+        return (
+            self.db_max_connections // self.web_concurrency
+            - self.db_auxiliary_connections
+        )
+
     model_config = SettingsConfigDict(
         env_file=get_env_file(),
         env_file_encoding="utf-8",
@@ -0,0 +1,17 @@
+import sys
+
+from loguru import logger
+
+from app.core.config import Settings
+
+LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+
+
+def configure_logging(settings: Settings) -> None:
+    """Sustituye el handler por defecto de loguru según la configuración"""
+    logger.remove()
+    logger.add(sys.stderr, level=settings.log_level.upper(), format=LOG_FORMAT)
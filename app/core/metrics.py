@@ -0,0 +1,20 @@
+from typing import Any, Callable
+
+MetricsCollector = Callable[[], dict[str, Any]]
+
+_collectors: dict[str, MetricsCollector] = {}
+
+
+def register_metrics(name: str, collector: MetricsCollector) -> None:
+    """Registra una fuente de métricas que se expone en GET /metrics"""
+    _collectors[name] = collector
+
+
+def collect_metrics() -> dict[str, dict[str, Any]]:
+    """
+    Devuelve las métricas de todas las fuentes registradas.
+
+    Se llama desde el bucle de eventos: las fuentes pueden leer estado ligado
+    al bucle (p. ej. el limitador de hilos de AnyIO).
+    """
+    return {name: collector() for name, collector in _collectors.items()}
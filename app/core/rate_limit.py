@@ -0,0 +1,210 @@
+import math
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Callable
+
+from fastapi import Depends, Request
+
+from app.core.config import get_settings
+from app.exceptions.rate_limit import RateLimitExceededException
+
+RATE_LIMIT_STATE_KEY = "rate_limit"
+
+# Cubo de tokens atómico en Redis: el estado es un hash {tokens, ts} con TTL
+# igual al tiempo de rellenar el cubo, así los clientes inactivos desaparecen
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(tokens)}
+"""
+
+
+class RateLimitResult:
+    """Resultado de consumir tokens de un cubo"""
+
+    __slots__ = ("allowed", "limit", "tokens", "refill_rate", "cost")
+
+    def __init__(
+        self, allowed: bool, limit: int, tokens: float, refill_rate: float, cost: int
+    ):
+        self.allowed = allowed
+        self.limit = limit
+        self.tokens = tokens
+        self.refill_rate = refill_rate
+        self.cost = cost
+
+    @property
+    def retry_after(self) -> float:
+        """Segundos hasta tener tokens suficientes para la petición"""
+        return max(0.0, (self.cost - self.tokens) / self.refill_rate)
+
+    def headers(self) -> list[tuple[bytes, bytes]]:
+        """Cabeceras RateLimit-* (y Retry-After si se ha rechazado)"""
+        reset = math.ceil((self.limit - self.tokens) / self.refill_rate)
+        headers = [
+            (b"ratelimit-limit", str(self.limit).encode()),
+            (b"ratelimit-remaining", str(math.floor(self.tokens)).encode()),
+            (b"ratelimit-reset", str(reset).encode()),
+        ]
+        if not self.allowed:
+            headers.append(
+                (b"retry-after", str(max(1, math.ceil(self.retry_after))).encode())
+            )
+        return headers
+
+
+class RateLimitBackend(ABC):
+    """Almacén del estado de los cubos de tokens"""
+
+    def __init__(self, capacity: int, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+
+    @abstractmethod
+    async def consume(self, key: str, cost: int) -> RateLimitResult:
+        """Consume `cost` tokens del cubo `key` si hay suficientes"""
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Cubos de tokens en memoria del proceso.
+
+    Solo es correcto con un worker: con varios, cada uno tiene sus propios
+    cubos y el límite efectivo se multiplica por el número de workers.
+    """
+
+    def __init__(self, capacity: int, refill_rate: float, max_keys: int = 100_000):
+        super().__init__(capacity, refill_rate)
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, cost: int) -> RateLimitResult:
+        now = monotonic()
+        tokens, updated_at = self._buckets.pop(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_rate)
+
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return RateLimitResult(allowed, self.capacity, tokens, self.refill_rate, cost)
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Cubos de tokens compartidos entre workers en un servidor Redis.
+
+    `client` es un cliente asíncrono con la API de redis-py (`eval`); el
+    cubo se actualiza de forma atómica con TOKEN_BUCKET_SCRIPT usando el
+    reloj del servidor, así que los workers no necesitan relojes sincronizados.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        capacity: int,
+        refill_rate: float,
+        prefix: str = "ratelimit:",
+    ):
+        super().__init__(capacity, refill_rate)
+        self.client = client
+        self.prefix = prefix
+
+    async def consume(self, key: str, cost: int) -> RateLimitResult:
+        allowed, tokens = await self.client.eval(
+            TOKEN_BUCKET_SCRIPT,
+            1,
+            self.prefix + key,
+            self.capacity,
+            self.refill_rate,
+            cost,
+        )
+        return RateLimitResult(
+            bool(int(allowed)), self.capacity, float(tokens), self.refill_rate, cost
+        )
+
+
+@lru_cache
+def get_rate_limit_backend() -> RateLimitBackend | None:
+    """Backend configurado en Settings, o None si el límite está desactivado"""
+    settings = get_settings()
+    if not settings.rate_limit_enabled:
+        return None
+    if settings.rate_limit_backend == "redis":
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "RATE_LIMIT_BACKEND=redis requires the 'redis' package"
+            ) from exc
+        return RedisRateLimitBackend(
+            Redis.from_url(settings.rate_limit_redis_url),
+            settings.rate_limit_capacity,
+            settings.rate_limit_refill_rate,
+        )
+    return InMemoryRateLimitBackend(
+        settings.rate_limit_capacity, settings.rate_limit_refill_rate
+    )
+
+
+def client_identity(request: Request) -> str:
+    """Identidad del cliente: su IP (uvicorn aplica X-Forwarded-For)"""
+    return request.client.host if request.client else "anonymous"
+
+
+def list_query_cost(request: Request) -> int:
+    """Coste en tokens de un listado: sin filtros el count recorre toda la tabla"""
+    include_total = request.query_params.get("include_total", "true").lower()
+    counts = include_total not in ("false", "0", "no", "off")
+    return 5 if counts and not request.query_params.get("filter") else 2
+
+
+def rate_limit(cost: int | Callable[[Request], int] = 1):
+    """
+    Dependencia que limita la ruta por cliente con un coste en tokens.
+
+    `cost` puede ser fijo o una función de la petición, para cobrar más por
+    las consultas caras (p. ej. un listado sin filtros que cuenta la tabla).
+    El resultado queda en el estado de la petición para que
+    RateLimitHeadersMiddleware añada las cabeceras a la respuesta.
+    """
+
+    async def check_rate_limit(
+        request: Request,
+        backend: RateLimitBackend | None = Depends(get_rate_limit_backend),
+    ):
+        if backend is None:
+            return
+        tokens = cost(request) if callable(cost) else cost
+        # Un coste mayor que el cubo no pasaría nunca
+        tokens = min(tokens, backend.capacity)
+        key = (
+            f"{client_identity(request)}:{request.method}:{request.scope['route'].path}"
+        )
+
+        result = await backend.consume(key, tokens)
+        setattr(request.state, RATE_LIMIT_STATE_KEY, result)
+        if not result.allowed:
+            raise RateLimitExceededException(result.retry_after)
+
+    return Depends(check_rate_limit)
@@ -0,0 +1,108 @@
+import threading
+from time import monotonic
+from typing import Any
+
+from anyio import CapacityLimiter, to_thread
+from fastapi import Request
+
+from app.core.metrics import register_metrics
+
+# Límites superiores (ms) de los intervalos del histograma de espera
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000)
+
+# Claves de request.state (scope["state"]) con el inicio y la espera medida
+THREAD_WAIT_STARTED = "thread_wait_started"
+THREAD_WAIT_MS = "thread_wait_ms"
+
+
+def configure_thread_limiter(total_tokens: int) -> CapacityLimiter:
+    """
+    Fija el tamaño del pool de hilos del bucle de eventos actual.
+
+    Las rutas y dependencias síncronas de FastAPI se ejecutan en el pool de
+    hilos de AnyIO; se ajusta el número de tokens de su limitador por
+    defecto. Se llama una vez al arrancar, desde el lifespan.
+    """
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = total_tokens
+    return limiter
+
+
+class ThreadWaitStats:
+    """
+    Esperas por un hilo libre de las peticiones: número, total, máximo e
+    histograma acumulado (como los de Prometheus: `le_10` cuenta las
+    esperas de 10 ms o menos).
+    """
+
+    def __init__(self, buckets_ms: tuple[int, ...] = WAIT_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._bucket_counts = [0] * len(buckets_ms)
+
+    def record(self, seconds: float) -> None:
+        """Anota una espera; se llama desde los hilos del pool"""
+        elapsed_ms = seconds * 1000
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            for index, bound in enumerate(self.buckets_ms):
+                if elapsed_ms <= bound:
+                    self._bucket_counts[index] += 1
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            histogram = {
+                f"le_{bound}": count
+                for bound, count in zip(self.buckets_ms, self._bucket_counts)
+            }
+            histogram["le_inf"] = self.waits
+            return {
+                "waits": self.waits,
+                "wait_ms_total": round(self.wait_seconds_total * 1000, 3),
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+                "wait_ms_histogram": histogram,
+            }
+
+
+thread_wait_stats = ThreadWaitStats()
+
+
+async def start_thread_wait(request: Request) -> None:
+    """
+    Dependencia asíncrona: se ejecuta en el bucle de eventos justo antes de
+    que la petición pida un hilo, y anota el instante.
+    """
+    setattr(request.state, THREAD_WAIT_STARTED, monotonic())
+
+
+def measure_thread_wait(request: Request) -> None:
+    """
+    Dependencia síncrona: se ejecuta ya en un hilo del pool, así que el
+    tiempo desde start_thread_wait es lo que la petición esperó por él.
+    """
+    started = getattr(request.state, THREAD_WAIT_STARTED, None)
+    if started is None:
+        return
+    seconds = monotonic() - started
+    setattr(request.state, THREAD_WAIT_MS, seconds * 1000)
+    thread_wait_stats.record(seconds)
+
+
+def thread_pool_metrics() -> dict[str, Any]:
+    """Estado del pool de hilos del bucle de eventos actual"""
+    statistics = to_thread.current_default_thread_limiter().statistics()
+    return {
+        "size": statistics.total_tokens,
+        "active": statistics.borrowed_tokens,
+        # Peticiones esperando un hilo libre: la cola invisible del pool
+        "queued": statistics.tasks_waiting,
+        **thread_wait_stats.metrics(),
+    }
+
+
+register_metrics("thread_pool", thread_pool_metrics)
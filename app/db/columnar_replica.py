@@ -0,0 +1,442 @@
+import threading
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from time import monotonic, perf_counter
+from typing import Any, Callable
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import String, cast
+from sqlmodel import Session, select
+
+from app.core.change_stream import broadcaster
+from app.core.config import get_settings
+from app.core.metrics import register_metrics
+from app.enums.filter import FilterOperator
+from app.enums.sort import SortDirection
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dependencia opcional
+    np = None
+
+config = get_settings()
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+# NaT de NumPy: el menor int64
+_NAT = -(2**63)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _column_kind(column) -> str:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return "object"
+    # bool antes que int: bool es subclase de int
+    for kind, types in (
+        ("bool", bool),
+        ("int", int),
+        ("float", float),
+        ("str", str),
+        ("datetime", datetime),
+        ("uuid", UUID),
+    ):
+        if issubclass(python_type, types):
+            return kind
+    return "object"
+
+
+class ColumnarColumn:
+    """
+    Valores de una columna en un array NumPy más una máscara de NULL.
+
+    Los NULL se guardan con un valor de relleno (0, "", NaT...) y quedan
+    fuera de toda comparación por la máscara, como en SQL. Los UUID se
+    guardan como 16 bytes, en el mismo orden que en la base de datos, y se
+    leen como texto: crear un objeto UUID por fila era la mayor parte de la
+    carga.
+    """
+
+    __slots__ = ("kind", "data", "nulls", "_order", "_ranks", "_text")
+
+    def __init__(self, kind: str, values: list):
+        self.kind = kind
+        self.nulls = np.fromiter(
+            (value is None for value in values), dtype=bool, count=len(values)
+        )
+        if kind == "int":
+            self.data = np.array([v or 0 for v in values], dtype=np.int64)
+        elif kind == "float":
+            self.data = np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+        elif kind == "bool":
+            self.data = np.array([bool(v) for v in values], dtype=bool)
+        elif kind == "str":
+            self.data = np.array(["" if v is None else v for v in values], dtype=str)
+        elif kind == "datetime":
+            # Microsegundos desde 1970 con aritmética de timedelta: unas cinco
+            # veces más rápido que convertir los objetos datetime con NumPy
+            self.data = np.fromiter(
+                (
+                    _NAT if v is None else (_naive_utc(v) - _EPOCH) // _MICROSECOND
+                    for v in values
+                ),
+                dtype=np.int64,
+                count=len(values),
+            ).view("datetime64[us]")
+        elif kind == "uuid":
+            # Llegan como texto (hex o forma canónica): una sola conversión
+            # para toda la columna en lugar de un objeto UUID por fila
+            digits = "".join("0" * 32 if v is None else str(v) for v in values)
+            self.data = np.frombuffer(
+                bytes.fromhex(digits.replace("-", "")), dtype="S16"
+            )
+        else:
+            self.data = np.array(values, dtype=object)
+        self._order = None
+        self._ranks = None
+        self._text = None
+
+    def values(self, positions) -> list:
+        """Valores de Python de las filas indicadas (None para NULL)"""
+        items = self.data[positions].tolist()
+        if self.kind == "uuid":
+            # NumPy recorta los bytes nulos finales de los valores "S"
+            items = [UUID(bytes=item.ljust(16, b"\0")) for item in items]
+        nulls = self.nulls[positions].tolist()
+        return [None if null else item for item, null in zip(items, nulls)]
+
+    def coerce(self, value: Any) -> Any:
+        """
+        Convierte un valor del filtro al tipo del array.
+
+        Raises:
+            TypeError, ValueError: si no es comparable con la columna
+        """
+        if self.kind in ("int", "float"):
+            if not isinstance(value, (int, float)):
+                raise TypeError(value)
+            return value
+        if self.kind == "str":
+            return str(value)
+        if self.kind == "datetime":
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            if not isinstance(value, datetime):
+                raise TypeError(value)
+            return np.datetime64(_naive_utc(value), "us")
+        if self.kind == "uuid":
+            return (value if isinstance(value, UUID) else UUID(str(value))).bytes
+        return value
+
+    def compare(self, op: Callable, value: Any):
+        try:
+            return op(self.data, self.coerce(value)) & ~self.nulls
+        except (TypeError, ValueError):
+            # Tipos no comparables (p. ej. texto frente a número): no coincide
+            return np.zeros(len(self.nulls), dtype=bool)
+
+    def isin(self, values: list):
+        coerced = []
+        for value in values:
+            # Un decimal no puede ser igual a ningún entero de la columna
+            if self.kind == "int" and isinstance(value, float):
+                if not value.is_integer():
+                    continue
+            try:
+                coerced.append(self.coerce(value))
+            except (TypeError, ValueError):
+                continue
+        if not coerced:
+            return np.zeros(len(self.nulls), dtype=bool)
+        # Sin forzar el dtype de la columna, que recortaría los valores (p. ej.
+        # textos más largos que los de la columna): NumPy elige uno común
+        return np.isin(self.data, np.array(coerced))
+
+    def contains(self, value: Any):
+        """LIKE '%valor%' sin distinguir mayúsculas, como ilike"""
+        if self._text is None:
+            if self.kind == "str":
+                text = self.data
+            else:
+                positions = np.arange(len(self.nulls))
+                text = np.array([str(v) for v in self.values(positions)], dtype=str)
+            self._text = np.char.lower(text)
+        return (np.char.find(self._text, str(value).lower()) >= 0) & ~self.nulls
+
+    def order(self, nulls_first: bool):
+        """Posiciones en orden ascendente (índice ordenado, se calcula una vez)"""
+        if self._order is None:
+            valid = np.flatnonzero(~self.nulls)
+            order = valid[np.argsort(self.data[valid], kind="stable")]
+            nulls = np.flatnonzero(self.nulls)
+            self._order = np.concatenate(
+                (nulls, order) if nulls_first else (order, nulls)
+            )
+        return self._order
+
+    def ranks(self, nulls_first: bool):
+        """Posición de cada fila en el orden; los valores iguales comparten rango"""
+        if self._ranks is None:
+            order = self.order(nulls_first)
+            valid = order[~self.nulls[order]]
+            values = self.data[valid]
+            distinct = np.ones(len(valid), dtype=bool)
+            distinct[1:] = values[1:] != values[:-1]
+            ranks = np.empty(len(order), dtype=np.int64)
+            ranks[valid] = np.cumsum(distinct)
+            ranks[self.nulls] = 0 if nulls_first else len(valid) + 1
+            self._ranks = ranks
+        return self._ranks
+
+
+class ColumnarSnapshot:
+    """
+    Copia inmutable de una tabla en columnas NumPy.
+
+    Evalúa los operadores de filtro con máscaras vectorizadas y el orden con
+    los índices ordenados de cada columna (un criterio) o lexsort sobre sus
+    rangos (varios). Los NULL se ordenan como en la base de datos de origen:
+    primero en ASC en SQLite y últimos en PostgreSQL.
+    """
+
+    operator_map: dict[FilterOperator, Callable] = {
+        FilterOperator.EQ: lambda column, value: column.compare(np.equal, value),
+        FilterOperator.NE: lambda column, value: column.compare(np.not_equal, value),
+        FilterOperator.GT: lambda column, value: column.compare(np.greater, value),
+        FilterOperator.GE: lambda column, value: column.compare(
+            np.greater_equal, value
+        ),
+        FilterOperator.LT: lambda column, value: column.compare(np.less, value),
+        FilterOperator.LE: lambda column, value: column.compare(np.less_equal, value),
+        FilterOperator.LIKE: lambda column, value: column.contains(value),
+        FilterOperator.IN: lambda column, value: column.isin(value) & ~column.nulls,
+        FilterOperator.NOT_IN: lambda column, value: ~column.isin(value)
+        & ~column.nulls,
+        FilterOperator.BETWEEN: lambda column, value: column.compare(
+            np.greater_equal, value[0]
+        )
+        & column.compare(np.less_equal, value[1]),
+        FilterOperator.IS_NULL: lambda column, value: column.nulls.copy(),
+        FilterOperator.IS_NOT_NULL: lambda column, value: ~column.nulls,
+    }
+
+    def __init__(
+        self,
+        columns: dict[str, ColumnarColumn],
+        size: int,
+        row_class: type,
+        nulls_first: bool,
+    ):
+        self.columns = columns
+        self.size = size
+        self.row_class = row_class
+        self.nulls_first = nulls_first
+
+    @classmethod
+    def load(
+        cls, session: Session, model_class: type, row_class: type
+    ) -> "ColumnarSnapshot":
+        """Lee la tabla completa y la convierte en columnas"""
+        table_columns = list(model_class.__table__.columns)
+        kinds = [_column_kind(column) for column in table_columns]
+        selected = [
+            cast(column, String) if kind == "uuid" else column
+            for column, kind in zip(table_columns, kinds)
+        ]
+        rows = session.exec(select(*selected)).all()
+        values = list(zip(*rows)) if rows else [()] * len(table_columns)
+        columns = {
+            column.key: ColumnarColumn(kind, list(column_values))
+            for column, kind, column_values in zip(table_columns, kinds, values)
+        }
+        nulls_first = session.get_bind().dialect.name != "postgresql"
+        return cls(columns, len(rows), row_class, nulls_first)
+
+    def mask(self, filter_model: Any):
+        """Filas que cumplen todas las condiciones (None si no hay filtro)"""
+        mask = None
+        for field_enum, operator, value in getattr(filter_model, "filters", None) or []:
+            column = self.columns.get(field_enum.value)
+            if column is None:
+                logger.warning(f"Invalid filter field ignored: {field_enum.value}")
+                continue
+            condition = self.operator_map.get(operator)
+            if condition is None:
+                logger.warning(f"Unsupported operator: {operator.value}")
+                continue
+            matches = condition(column, value)
+            mask = matches if mask is None else mask & matches
+        return mask
+
+    def ordered(self, mask, sorts: list[tuple[str, bool]]):
+        """
+        Posiciones de las filas de `mask` en el orden pedido.
+
+        Args:
+            sorts: Lista de (columna, descendente)
+        """
+        sorts = [(name, desc) for name, desc in sorts if name in self.columns]
+        if not sorts:
+            return np.arange(self.size) if mask is None else np.flatnonzero(mask)
+
+        if len(sorts) == 1:
+            name, desc = sorts[0]
+            order = self.columns[name].order(self.nulls_first)
+            if desc:
+                order = order[::-1]
+            return order if mask is None else order[mask[order]]
+
+        candidates = np.arange(self.size) if mask is None else np.flatnonzero(mask)
+        keys = []
+        # lexsort ordena por la última clave primero
+        for name, desc in reversed(sorts):
+            ranks = self.columns[name].ranks(self.nulls_first)[candidates]
+            keys.append(-ranks if desc else ranks)
+        return candidates[np.lexsort(keys)]
+
+    def page(
+        self,
+        filter_model: Any,
+        sorts: list[tuple[str, bool]],
+        offset: int,
+        limit: int,
+    ) -> tuple[list, int]:
+        """Filas de la página y total filtrado"""
+        mask = self.mask(filter_model)
+        total = self.size if mask is None else int(np.count_nonzero(mask))
+        positions = self.ordered(mask, sorts)[offset : offset + limit]
+        return self.rows(positions), total
+
+    def count(self, filter_model: Any) -> int:
+        mask = self.mask(filter_model)
+        return self.size if mask is None else int(np.count_nonzero(mask))
+
+    def rows(self, positions) -> list:
+        values = [column.values(positions) for column in self.columns.values()]
+        return [self.row_class(*row) for row in zip(*values)]
+
+
+def sort_keys(sort_model: Any, default_sort: str | None) -> list[tuple[str, bool]]:
+    """Criterios (columna, descendente) como los aplica GenericSortStrategy"""
+    sorts = getattr(sort_model, "sorts", None)
+    if sorts:
+        return [
+            (field_enum.value, direction == SortDirection.DESC)
+            for field_enum, direction in sorts
+        ]
+    return [(default_sort, False)] if default_sort else []
+
+
+class ColumnarReplica:
+    """
+    Réplica en memoria de una tabla, por worker.
+
+    Se carga entera en la primera lectura y se vuelve a cargar en la
+    siguiente lectura tras un cambio: las escrituras del repositorio la
+    invalidan en este proceso y los eventos del change stream (con el puente
+    LISTEN/NOTIFY) en el resto. COLUMNAR_REPLICA_MAX_AGE acota además cuánto
+    puede tardar en verse un cambio hecho fuera de la aplicación.
+
+    Pensada para tablas pequeñas de referencia muy leídas: cada cambio cuesta
+    releer la tabla completa.
+    """
+
+    def __init__(self, model_class: type, max_age: float):
+        if np is None:
+            raise RuntimeError("ColumnarReplica requires the 'numpy' package")
+        self.model_class = model_class
+        self.max_age = max_age
+        self.row_class = namedtuple(
+            f"{model_class.__name__}Row",
+            [column.key for column in model_class.__table__.columns],
+        )
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._snapshot: ColumnarSnapshot | None = None
+        self._version = 0
+        self._loaded_version = -1
+        self._loaded_at = 0.0
+        self.refreshes = 0
+        self.invalidations = 0
+        self.last_refresh_ms = 0.0
+        broadcaster.add_listener(model_class.__name__, lambda event: self.invalidate())
+
+    def invalidate(self) -> None:
+        """Marca la copia como obsoleta; se recarga en la siguiente lectura"""
+        with self._lock:
+            self._version += 1
+            self.invalidations += 1
+
+    def snapshot(self, session: Session) -> ColumnarSnapshot:
+        """Copia vigente, recargándola con `session` si está obsoleta"""
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh():
+            return snapshot
+        # Una sola recarga a la vez: el resto espera y usa su resultado
+        with self._load_lock:
+            if self._snapshot is not None and self._is_fresh():
+                return self._snapshot
+            # La versión se lee antes de cargar: un cambio durante la carga
+            # deja la copia obsoleta y la siguiente lectura vuelve a cargar
+            version = self._version
+            start = perf_counter()
+            snapshot = ColumnarSnapshot.load(session, self.model_class, self.row_class)
+            self.last_refresh_ms = (perf_counter() - start) * 1000
+            self._snapshot = snapshot
+            self._loaded_version = version
+            self._loaded_at = monotonic()
+            self.refreshes += 1
+        logger.debug(
+            f"Columnar replica of {self.model_class.__name__} loaded: "
+            f"{snapshot.size} rows in {self.last_refresh_ms:.1f} ms"
+        )
+        return snapshot
+
+    def _is_fresh(self) -> bool:
+        if self._loaded_version != self._version:
+            return False
+        return not self.max_age or monotonic() - self._loaded_at < self.max_age
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "rows": self._snapshot.size if self._snapshot else 0,
+            "refreshes": self.refreshes,
+            "invalidations": self.invalidations,
+            "last_refresh_ms": round(self.last_refresh_ms, 2),
+        }
+
+
+_replicas: dict[type, ColumnarReplica] = {}
+_replicas_lock = threading.Lock()
+
+
+def get_replica(model_class: type) -> ColumnarReplica:
+    """Réplica del modelo en este proceso (se crea en el primer uso)"""
+    replica = _replicas.get(model_class)
+    if replica is None:
+        with _replicas_lock:
+            replica = _replicas.get(model_class)
+            if replica is None:
+                replica = _replicas[model_class] = ColumnarReplica(
+                    model_class, config.columnar_replica_max_age
+                )
+    return replica
+
+
+def replica_metrics() -> dict[str, Any]:
+    return {
+        model_class.__name__: replica.metrics()
+        for model_class, replica in list(_replicas.items())
+    }
+
+
+register_metrics("columnar_replica", replica_metrics)
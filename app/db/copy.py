@@ -0,0 +1,82 @@
+import re
+
+from sqlalchemy import Connection, Table, insert
+from sqlalchemy.dialects import postgresql
+
+_TYPE_SUFFIX = re.compile(r"\(.*\)$")
+
+
+def _copy_type_name(column) -> str:
+    """Nombre del tipo de Postgres de una columna para COPY binario"""
+    name = column.type.compile(dialect=postgresql.dialect()).lower()
+    # psycopg resuelve los alias SQL (integer, character varying...) pero no
+    # la longitud: VARCHAR(255) -> varchar
+    return _TYPE_SUFFIX.sub("", name).strip()
+
+
+def _copy_statement(dialect, table: Table, columns: list) -> str:
+    """COPY binario con la tabla y las columnas entrecomilladas por el dialecto"""
+    preparer = dialect.identifier_preparer
+    return (
+        f"COPY {preparer.format_table(table)} "
+        f"({', '.join(preparer.format_column(column) for column in columns)}) "
+        "FROM STDIN (FORMAT BINARY)"
+    )
+
+
+def supports_binary_copy(connection: Connection) -> bool:
+    return (
+        connection.dialect.name == "postgresql"
+        and connection.dialect.driver == "psycopg"
+    )
+
+
+def _with_python_defaults(table: Table, rows: list[dict]) -> list[dict]:
+    """
+    Completa las columnas que faltan con su valor por defecto de Python
+    (p. ej. el id UUIDv7); COPY solo aplica los del servidor.
+    """
+    defaults = {
+        column.name: column.default
+        for column in table.columns
+        if column.name not in rows[0]
+        and column.default is not None
+        and (column.default.is_scalar or column.default.is_callable)
+    }
+    if not defaults:
+        return rows
+
+    def value(default):
+        # Los callables de SQLAlchemy reciben el contexto de ejecución
+        return default.arg(None) if default.is_callable else default.arg
+
+    return [
+        {**row, **{name: value(default) for name, default in defaults.items()}}
+        for row in rows
+    ]
+
+
+def copy_rows(connection: Connection, table: Table, rows: list[dict]) -> int:
+    """
+    Inserta filas en bloque y devuelve cuántas se han insertado.
+
+    Con psycopg3 usa COPY ... FROM STDIN en formato binario: sin SQL por
+    fila y sin conversión a texto. Las columnas que no vienen en las filas
+    toman su valor por defecto de Python (se calcula aquí) o del servidor.
+    Con otros drivers recurre a un INSERT con executemany.
+    """
+    if not rows:
+        return 0
+    if not supports_binary_copy(connection):
+        connection.execute(insert(table), rows)
+        return len(rows)
+
+    rows = _with_python_defaults(table, rows)
+    names = list(rows[0])
+    columns = [table.columns[name] for name in names]
+    cursor = connection.connection.dbapi_connection.cursor()
+    with cursor.copy(_copy_statement(connection.dialect, table, columns)) as copy:
+        copy.set_types([_copy_type_name(column) for column in columns])
+        for row in rows:
+            copy.write_row([row[name] for name in names])
+    return len(rows)
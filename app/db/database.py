@@ -1,19 +1,122 @@
+from functools import cached_property
 from app.core.config import get_settings
+from app.db.entity_loader import EntityLoader, ENTITY_LOADER_KEY
+from app.db.sqlite_profile import (
+    RoutingSession,
+    SQLiteProfile,
+    configure_connections,
+    is_sqlite_file,
+)
+from sqlalchemy import make_url
+from sqlalchemy.pool import QueuePool
 from sqlmodel import create_engine, SQLModel, Session
+from loguru import logger
 
 config = get_settings()
 
 
 class Database:
-    def __init__(self, url: str):
-        self.engine = create_engine(url)
+    def __init__(
+        self,
+        url: str,
+        pool_size: int | None = None,
+        prepare_threshold: int | None = None,
+        pgbouncer: bool = False,
+        sqlite_profile: SQLiteProfile | None = None,
+    ):
+        self.url = url
+        self.pool_size = pool_size
+        self.prepare_threshold = prepare_threshold
+        self.pgbouncer = pgbouncer
+        # Solo para archivos SQLite: en memoria cada motor sería otra base
+        self.sqlite_profile = sqlite_profile if is_sqlite_file(url) else None
+
+    @cached_property
+    def engine(self):
+        """Motor principal; con el perfil SQLite, el único escritor"""
+        # Se crea en el primer uso: create_engine importa el driver (psycopg2/psycopg)
+        engine = create_engine(self.url, **self.engine_options())
+        if self.sqlite_profile:
+            configure_connections(engine, self.sqlite_profile)
+        return engine
+
+    @cached_property
+    def read_engine(self):
+        """Motor de las lecturas: el principal salvo con el perfil SQLite"""
+        if not self.sqlite_profile:
+            return self.engine
+        engine = create_engine(self.url, **self.engine_options(read_only=True))
+        configure_connections(engine, self.sqlite_profile, read_only=True)
+        return engine
+
+    def engine_options(self, read_only: bool = False) -> dict:
+        """Argumentos de create_engine según la URL y la configuración"""
+        options = {}
+        if self.sqlite_profile:
+            # Un solo escritor por proceso: las escrituras esperan turno en el
+            # pool en lugar de reintentar el bloqueo de SQLite. Los lectores
+            # usan el tamaño de pool del worker
+            options.update(
+                poolclass=QueuePool,
+                pool_size=(self.pool_size or 5) if read_only else 1,
+                max_overflow=0,
+                pool_timeout=self.sqlite_profile.busy_timeout_ms / 1000,
+            )
+        elif self.pool_size and not self.url.startswith("sqlite"):
+            # Sin overflow: pool_size es el máximo real de conexiones del worker
+            options.update(pool_size=self.pool_size, max_overflow=0, pool_pre_ping=True)
+
+        if make_url(self.url).get_driver_name() == "psycopg":
+            # psycopg3 prepara en el servidor las sentencias que se repiten
+            # prepare_threshold veces en una conexión (listado, count, get_by_id).
+            # PgBouncer en modo transacción no conserva sentencias preparadas
+            # entre transacciones, así que con él se desactivan (None)
+            threshold = None if self.pgbouncer else self.prepare_threshold
+            options["connect_args"] = {"prepare_threshold": threshold}
+        return options
+
+    def dispose(self):
+        """Cierra las conexiones del pool (si el engine llegó a crearse)"""
+        if "read_engine" in self.__dict__ and self.read_engine is not self.engine:
+            self.read_engine.dispose()
+        if "engine" in self.__dict__:
+            self.engine.dispose()
 
     def create_db_and_tables(self):
         SQLModel.metadata.create_all(self.engine)
 
+    def new_session(self) -> Session:
+        """Sesión sobre el motor principal o, con el perfil SQLite, con rutas"""
+        if self.sqlite_profile:
+            return RoutingSession(self.engine, self.read_engine)
+        return Session(self.engine)
+
     def get_session(self):
-        with Session(self.engine) as session:
-            yield session
+        with self.new_session() as session:
+            loader = EntityLoader()
+            session.info[ENTITY_LOADER_KEY] = loader
+            try:
+                yield session
+            finally:
+                if loader.queries_saved:
+                    logger.debug(
+                        f"Entity loader: {loader.queries_executed} queries executed, "
+                        f"{loader.queries_saved} queries saved"
+                    )
 
 
-db = Database(config.database_url)
+db = Database(
+    config.database_url,
+    pool_size=config.db_pool_size,
+    prepare_threshold=config.db_prepare_threshold,
+    pgbouncer=config.db_pgbouncer,
+    sqlite_profile=(
+        SQLiteProfile(
+            busy_timeout_ms=config.sqlite_busy_timeout_ms,
+            cache_size_mb=config.sqlite_cache_size_mb,
+            mmap_size_mb=config.sqlite_mmap_size_mb,
+        )
+        if config.sqlite_profile
+        else None
+    ),
+)
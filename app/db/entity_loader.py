@@ -0,0 +1,105 @@
+from collections import defaultdict
+from typing import Any, Callable, Iterable
+from uuid import UUID
+
+from sqlmodel import Session
+
+ENTITY_LOADER_KEY = "entity_loader"
+
+BatchFn = Callable[[list[UUID]], dict[UUID, Any]]
+
+
+class EntityLoader:
+    """
+    Cargador de entidades con ámbito de petición (patrón DataLoader).
+
+    Agrupa en una sola consulta los ids pendientes de un mismo modelo: los
+    que se encolan con schedule (BaseRepository.prefetch) se resuelven junto
+    al primero que se pide. Las entidades encontradas quedan en el identity
+    map de la sesión, que es quien las reutiliza (y las recarga si un commit
+    las expira); el cargador solo memoriza los ids que no existen.
+
+    `queries_baseline` cuenta las consultas que habría hecho el mismo código
+    sin el cargador (una por get_by_id de una entidad que no está en la
+    sesión) y `queries_executed` las que se hicieron de verdad; ambas las
+    anota el repositorio.
+    """
+
+    def __init__(self):
+        self._pending: dict[type, dict[UUID, None]] = defaultdict(dict)
+        self._missing: dict[type, set[UUID]] = defaultdict(set)
+        # Cargados por adelantado y aún no pedidos
+        self._prefetched: dict[type, set[UUID]] = defaultdict(set)
+        self.queries_baseline = 0
+        self.queries_executed = 0
+
+    def schedule(self, model_class: type, entity_ids: Iterable[UUID]) -> None:
+        """Encola ids para resolverlos juntos en la próxima carga del modelo"""
+        missing = self._missing[model_class]
+        pending = self._pending[model_class]
+        for entity_id in entity_ids:
+            if entity_id not in missing:
+                pending[entity_id] = None
+
+    def load(self, model_class: type, entity_id: UUID, batch_fn: BatchFn) -> Any:
+        """Devuelve la entidad cargándola junto al resto de pendientes"""
+        return self.load_many(model_class, [entity_id], batch_fn).get(entity_id)
+
+    def load_many(
+        self, model_class: type, entity_ids: list[UUID], batch_fn: BatchFn
+    ) -> dict[UUID, Any]:
+        """Devuelve las entidades encontradas con una sola llamada a batch_fn"""
+        self.schedule(model_class, entity_ids)
+        pending = list(self._pending.pop(model_class, {}))
+        found = batch_fn(pending) if pending else {}
+        self._missing[model_class].update(
+            entity_id for entity_id in pending if entity_id not in found
+        )
+        requested = set(entity_ids)
+        self._prefetched[model_class].update(
+            entity_id
+            for entity_id in pending
+            if entity_id in found and entity_id not in requested
+        )
+        return {
+            entity_id: found[entity_id]
+            for entity_id in entity_ids
+            if entity_id in found
+        }
+
+    def take_prefetched(self, model_class: type, entity_id: UUID) -> bool:
+        """Si la entidad está en la sesión solo porque se cargó por adelantado"""
+        prefetched = self._prefetched[model_class]
+        if entity_id in prefetched:
+            prefetched.discard(entity_id)
+            return True
+        return False
+
+    def record_baseline(self, count: int = 1) -> None:
+        """Anota las consultas que se habrían hecho sin el cargador"""
+        self.queries_baseline += count
+
+    def record_queries(self, count: int = 1) -> None:
+        """Anota las consultas ejecutadas por la función de carga"""
+        self.queries_executed += count
+
+    @property
+    def queries_saved(self) -> int:
+        """Consultas evitadas respecto a hacer cada búsqueda por separado"""
+        return max(0, self.queries_baseline - self.queries_executed)
+
+    def prime(self, model_class: type, entity_id: UUID, entity: Any) -> None:
+        """Registra una entidad conocida (p. ej. recién creada)"""
+        self._missing[model_class].discard(entity_id)
+        self._pending[model_class].pop(entity_id, None)
+
+    def forget(self, model_class: type, entity_id: UUID) -> None:
+        """Marca una entidad como inexistente (p. ej. tras borrarla)"""
+        self._missing[model_class].add(entity_id)
+        self._pending[model_class].pop(entity_id, None)
+
+
+def get_entity_loader(session: Session) -> EntityLoader | None:
+    """Obtiene el cargador asociado a la sesión, si existe"""
+    loader = session.info.get(ENTITY_LOADER_KEY)
+    return loader if isinstance(loader, EntityLoader) else None
@@ -0,0 +1,102 @@
+import json
+from typing import Any, Iterable
+
+from sqlalchemy import String, any_, all_, bindparam, cast
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+from sqlalchemy.types import Boolean, TypeDecorator, TypeEngine
+
+
+class InListValues(TypeDecorator):
+    """
+    Lista de valores enviada como un único parámetro.
+
+    En PostgreSQL es un ARRAY del tipo de la columna y en SQLite texto JSON,
+    convirtiendo antes cada elemento igual que lo haría la columna (p. ej.
+    UUID -> hex de 32 caracteres). En otros motores se expande como un IN
+    normal y cada elemento usa el tipo de la columna.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def __init__(self, item_type: TypeEngine):
+        super().__init__()
+        self.item_type = item_type
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.ARRAY(self.item_type))
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(self.item_type)
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != "sqlite":
+            return value
+        process = self.item_type.dialect_impl(dialect).bind_processor(dialect)
+        items = [process(item) for item in value] if process else list(value)
+        return json.dumps(items, default=str)
+
+
+class in_list(ColumnElement):
+    """
+    `column IN (...)` con la lista en un único parámetro.
+
+    `column.in_(values)` genera un parámetro por elemento: con miles de ids
+    el SQL crece con la lista, cada longitud es una sentencia distinta para
+    las sentencias preparadas y SQLite rechaza más de 32766 parámetros.
+    Aquí el SQL es el mismo para cualquier longitud:
+
+    - PostgreSQL: `column = ANY(CAST(:values AS tipo[]))`
+    - SQLite: `column IN (SELECT value FROM json_each(:values))`
+    """
+
+    type = Boolean()
+    inherit_cache = True
+    # Es una condición: sin esto, los motores sin booleano nativo añaden "= 1"
+    _is_implicitly_boolean = True
+
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("values", InternalTraversal.dp_clauseelement),
+        ("negate", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, column: ColumnElement, values: Iterable[Any], negate=False):
+        self.column = column
+        self.values = bindparam(
+            None, list(values), type_=InListValues(column.type), unique=True
+        )
+        self.negate = negate
+
+    def __invert__(self):
+        return in_list(self.column, self.values.value, negate=not self.negate)
+
+
+@compiles(in_list)
+def _in_list_default(element, compiler, **kw):
+    # Otros motores: IN expandido sobre el mismo parámetro
+    condition = element.column.in_(element.values)
+    return compiler.process(~condition if element.negate else condition, **kw)
+
+
+@compiles(in_list, "postgresql")
+def _in_list_postgresql(element, compiler, **kw):
+    array = cast(element.values, postgresql.ARRAY(element.column.type))
+    if element.negate:
+        condition = element.column != all_(array)
+    else:
+        condition = element.column == any_(array)
+    return compiler.process(condition, **kw)
+
+
+@compiles(in_list, "sqlite")
+def _in_list_sqlite(element, compiler, **kw):
+    operator = "NOT IN" if element.negate else "IN"
+    return (
+        f"{compiler.process(element.column, **kw)} {operator} "
+        f"(SELECT value FROM json_each({compiler.process(element.values, **kw)}))"
+    )
@@ -0,0 +1,115 @@
+import json
+import select
+import threading
+from typing import Any
+from loguru import logger
+from sqlalchemy import Connection, Engine, text
+from app.core.change_stream import ChangeBroadcaster, ChangeEvent
+
+# PostgreSQL rechaza payloads de NOTIFY de 8000 bytes o más
+MAX_PAYLOAD_BYTES = 7900
+
+
+class PostgresNotifyBridge:
+    """
+    Puente LISTEN/NOTIFY para repartir los eventos entre workers.
+
+    `send` hace NOTIFY en la conexión de la transacción que confirma el
+    cambio, así que solo se entrega si hay commit; un hilo dedicado escucha
+    el canal con una conexión propia (fuera del pool, cuenta para
+    DB_MAX_CONNECTIONS) y entrega al difusor los eventos de otros procesos.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        broadcaster: ChangeBroadcaster,
+        channel: str,
+        poll_interval: float = 1.0,
+        reconnect_delay: float = 2.0,
+    ):
+        self.engine = engine
+        self.broadcaster = broadcaster
+        self.channel = channel
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def encode(event: ChangeEvent) -> str:
+        payload = json.dumps(event.to_dict(), default=str)
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            # Sin datos los suscriptores remotos con filtro descartan el evento
+            payload = json.dumps({**event.to_dict(), "data": None}, default=str)
+        return payload
+
+    def send(self, event: ChangeEvent, connection: Connection) -> None:
+        connection.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": self.channel, "payload": self.encode(event)},
+        )
+
+    def handle(self, payload: str) -> None:
+        try:
+            event = ChangeEvent.from_dict(json.loads(payload))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed change notification: {e}")
+            return
+        self.broadcaster.receive(event)
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="change-stream-listener", daemon=True
+        )
+        self._thread.start()
+        self.broadcaster.bridge = self
+
+    def stop(self) -> None:
+        if self.broadcaster.bridge is self:
+            self.broadcaster.bridge = None
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
+
+    def _connect(self) -> Any:
+        # Conexión DBAPI directa: no retiene una conexión del pool para siempre
+        cargs, cparams = self.engine.dialect.create_connect_args(self.engine.url)
+        connection = self.engine.dialect.dbapi.connect(*cargs, **cparams)
+        connection.autocommit = True
+        cursor = connection.cursor()
+        cursor.execute(f'LISTEN "{self.channel}"')
+        cursor.close()
+        return connection
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            connection = None
+            try:
+                connection = self._connect()
+                logger.debug(f"Listening for change events on '{self.channel}'")
+                self._listen(connection)
+            except Exception as e:
+                logger.warning(f"Change stream listener error: {e}")
+                self._stop.wait(self.reconnect_delay)
+            finally:
+                if connection is not None:
+                    connection.close()
+
+    def _listen(self, connection: Any) -> None:
+        if hasattr(connection, "poll"):
+            # psycopg2: las notificaciones se acumulan tras poll()
+            while not self._stop.is_set():
+                ready, _, _ = select.select([connection], [], [], self.poll_interval)
+                if not ready:
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    self.handle(connection.notifies.pop(0).payload)
+        else:
+            # psycopg 3: generador con timeout (>= 3.2)
+            while not self._stop.is_set():
+                for notify in connection.notifies(timeout=self.poll_interval):
+                    self.handle(notify.payload)
@@ -0,0 +1,44 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+
+from sqlalchemy import Engine
+from sqlalchemy.pool import QueuePool
+from sqlmodel import Session
+
+from app.core.config import get_settings
+
+config = get_settings()
+
+# Un hilo por conexión del pool: más hilos solo esperarían una conexión
+_executor = ThreadPoolExecutor(
+    max_workers=config.db_pool_size, thread_name_prefix="parallel-query"
+)
+
+
+def can_run_concurrently(engine: Engine) -> bool:
+    """
+    Indica si merece la pena lanzar una consulta en otra conexión.
+
+    Requiere PARALLEL_COUNT activo, un QueuePool (SQLite en memoria comparte
+    una única conexión) y alguna conexión libre: con el pool agotado la
+    consulta paralela solo competiría con otras peticiones.
+    """
+    if not config.parallel_count:
+        return False
+    pool = engine.pool
+    return isinstance(pool, QueuePool) and pool.checkedout() < pool.size()
+
+
+def scalar_in_new_session(engine: Engine, statement) -> Future:
+    """
+    Ejecuta una consulta escalar en una sesión propia en segundo plano.
+
+    Copia el contexto para que la sesión herede el plazo de la petición
+    (statement timeout).
+    """
+
+    def run():
+        with Session(engine) as session:
+            return session.exec(statement).one()
+
+    return _executor.submit(copy_context().run, run)
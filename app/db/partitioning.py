@@ -0,0 +1,239 @@
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Protocol
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import Engine, MetaData, Table, text
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import get_settings
+from app.enums.filter import FilterOperator
+from app.utils.uuid7 import uuid7_datetime
+
+config = get_settings()
+
+
+class SupportsExecute(Protocol):
+    """Conexión de SQLAlchemy u `op` de alembic"""
+
+    def execute(self, statement: Any) -> Any: ...
+
+
+def is_partitioned(model_class: type) -> bool:
+    return getattr(model_class, "__partition_column__", None) is not None
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    month_index = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(table_name: str, month: date) -> str:
+    return f"{table_name}_p{month:%Y%m}"
+
+
+def id_time_check_name(table_name: str) -> str:
+    return f"{table_name}_id_time"
+
+
+def id_time_check_sql(
+    partition_column: str = "created_at", skew_hours: int | None = None
+) -> str:
+    """
+    Condición de CHECK que ata la columna de partición a la marca de tiempo
+    del id UUIDv7 (±PARTITION_ID_SKEW_HOURS).
+
+    Es lo que hace correctas las cotas de partition_bounds: una fila cuyo
+    created_at se aleje de su id más que el margen se rechaza al insertarla
+    en lugar de quedar fuera de las búsquedas por id. Los ids de otras
+    versiones no se comprueban (tampoco dan cotas).
+    """
+    skew = config.partition_id_skew_hours if skew_hours is None else skew_hours
+    id_time = (
+        "(to_timestamp(('x' || translate(left(id::text, 13), '-', ''))"
+        "::bit(48)::bigint / 1000.0) AT TIME ZONE 'UTC')"
+    )
+    return (
+        f"substr(id::text, 15, 1) <> '7' OR {partition_column} BETWEEN "
+        f"{id_time} - interval '{skew} hours' AND {id_time} + interval '{skew} hours'"
+    )
+
+
+def create_partition_sql(table_name: str, month: date) -> str:
+    """DDL de la partición mensual que contiene `month`"""
+    start = month_start(month)
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(table_name, start)}" '
+        f'PARTITION OF "{table_name}" '
+        f"FOR VALUES FROM ('{start}') TO ('{add_months(start, 1)}')"
+    )
+
+
+def attach_partition_sql(table_name: str, partition_table: str, month: date) -> str:
+    """DDL para adjuntar una tabla ya cargada como partición de `month`"""
+    start = month_start(month)
+    return (
+        f'ALTER TABLE "{table_name}" ATTACH PARTITION "{partition_table}" '
+        f"FOR VALUES FROM ('{start}') TO ('{add_months(start, 1)}')"
+    )
+
+
+def create_partitions(
+    executor: SupportsExecute,
+    table_name: str,
+    start: date,
+    months_ahead: int,
+    today: date | None = None,
+) -> list[str]:
+    """
+    Crea (si no existen) las particiones desde el mes de `start` hasta
+    `months_ahead` meses después del actual.
+
+    Sirve tanto con una conexión como con `op` de alembic:
+        create_partitions(op, "hero", date(2025, 1, 1), months_ahead=3)
+
+    Returns:
+        Nombres de las particiones cubiertas
+    """
+    month = month_start(start)
+    last = add_months(month_start(today or date.today()), months_ahead)
+    names = []
+    while month <= last:
+        executor.execute(text(create_partition_sql(table_name, month)))
+        names.append(partition_name(table_name, month))
+        month = add_months(month, 1)
+    return names
+
+
+def attach_partition(
+    executor: SupportsExecute, table_name: str, partition_table: str, month: date
+) -> None:
+    """
+    Adjunta una tabla cargada aparte (p. ej. con COPY) como partición.
+
+    Con un CHECK equivalente al rango creado antes, PostgreSQL no necesita
+    recorrer la tabla para validarla al adjuntarla. La partición debe tener
+    además el CHECK de id_time_check_sql de la tabla padre: se añaden los dos
+    en la misma sentencia, con un único recorrido, y ese se conserva.
+    """
+    start = month_start(month)
+    executor.execute(
+        text(
+            f'ALTER TABLE "{partition_table}" ADD CONSTRAINT '
+            f"\"{partition_table}_range\" CHECK (created_at >= '{start}' "
+            f"AND created_at < '{add_months(start, 1)}'), "
+            f'ADD CONSTRAINT "{id_time_check_name(table_name)}" '
+            f"CHECK ({id_time_check_sql()})"
+        )
+    )
+    executor.execute(text(attach_partition_sql(table_name, partition_table, month)))
+    executor.execute(
+        text(
+            f'ALTER TABLE "{partition_table}" DROP CONSTRAINT "{partition_table}_range"'
+        )
+    )
+
+
+def partitioned_tables(metadata: MetaData) -> list[Table]:
+    """Tablas declaradas con PARTITION BY (p. ej. las de PartitionedSQLModel)"""
+    return [
+        table
+        for table in metadata.sorted_tables
+        if table.dialect_options["postgresql"].get("partition_by")
+    ]
+
+
+def ensure_partitions(engine: Engine, metadata: MetaData) -> int:
+    """
+    Crea por adelantado las particiones de los próximos PARTITION_MONTHS_AHEAD
+    meses de cada tabla particionada. Solo en PostgreSQL.
+
+    Returns:
+        Número de particiones comprobadas
+    """
+    tables = partitioned_tables(metadata)
+    if engine.dialect.name != "postgresql" or not tables:
+        return 0
+    ensured = 0
+    with engine.begin() as connection:
+        for table in tables:
+            ensured += len(
+                create_partitions(
+                    connection, table.name, date.today(), config.partition_months_ahead
+                )
+            )
+    logger.debug(f"Ensured {ensured} table partitions")
+    return ensured
+
+
+def _id_time_range(
+    operator: FilterOperator, value: Any
+) -> tuple[datetime | None, datetime | None] | None:
+    """Intervalo de creación implicado por una condición sobre un id UUIDv7"""
+    values = value if isinstance(value, (list, tuple)) else [value]
+    try:
+        times = [
+            uuid7_datetime(v if isinstance(v, UUID) else UUID(str(v))) for v in values
+        ]
+    except ValueError:
+        return None
+    if not times or None in times:
+        return None
+
+    if operator in (FilterOperator.EQ, FilterOperator.IN):
+        return min(times), max(times)
+    if operator in (FilterOperator.GT, FilterOperator.GE):
+        return times[0], None
+    if operator in (FilterOperator.LT, FilterOperator.LE):
+        return None, times[0]
+    return None
+
+
+def partition_bounds(
+    model_class: type, filters: Iterable[tuple]
+) -> list[ColumnElement]:
+    """
+    Condiciones sobre created_at deducidas de los filtros por id.
+
+    Los ids son UUIDv7 y el CHECK de id_time_check_sql garantiza que el
+    created_at de cada fila está a menos de PARTITION_ID_SKEW_HOURS de la
+    marca de tiempo de su id, así que añadirlas no cambia el resultado y
+    permite a PostgreSQL descartar las particiones de otros meses. Solo se
+    aplican a modelos particionados.
+    """
+    if not is_partitioned(model_class):
+        return []
+
+    lower: datetime | None = None
+    upper: datetime | None = None
+    for field_enum, operator, value in filters:
+        if getattr(field_enum, "value", field_enum) != "id":
+            continue
+        bounds = _id_time_range(operator, value)
+        if bounds is None:
+            continue
+        low, high = bounds
+        if low is not None:
+            lower = low if lower is None else max(lower, low)
+        if high is not None:
+            upper = high if upper is None else min(upper, high)
+
+    skew = timedelta(hours=config.partition_id_skew_hours)
+    column = getattr(model_class, model_class.__partition_column__)
+    conditions = []
+    if lower is not None:
+        conditions.append(column >= lower - skew)
+    if upper is not None:
+        conditions.append(column <= upper + skew)
+    return conditions
+
+
+def partition_bounds_for_ids(
+    model_class: type, entity_ids: list[UUID]
+) -> list[ColumnElement]:
+    """Igual que partition_bounds para una búsqueda por lista de ids"""
+    return partition_bounds(model_class, [("id", FilterOperator.IN, entity_ids)])
@@ -0,0 +1,250 @@
+import json
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, NamedTuple
+
+from loguru import logger
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.base import Executable
+from sqlmodel import Session
+
+from app.core.config import get_settings
+from app.core.metrics import register_metrics
+from app.enums.filter import FilterOperator
+from app.exceptions.query import QueryTooExpensiveException
+
+config = get_settings()
+
+# Las estimaciones caducan: las tablas crecen y los planes cambian con ellas
+ESTIMATE_TTL_SECONDS = 300
+
+
+def explain_sql(query: Executable, dialect: Dialect) -> tuple[str, Any]:
+    """
+    `EXPLAIN (FORMAT JSON)` de una consulta, sin ejecutarla (PostgreSQL).
+
+    Se compila la consulta y se envía su SQL con exec_driver_sql: así las
+    columnas de la consulta (p. ej. UUID) no se aplican al resultado, que es
+    la columna "QUERY PLAN". Los parámetros pasan por los procesadores de
+    su tipo, como al ejecutarla.
+    """
+    compiled = query.compile(
+        dialect=dialect, compile_kwargs={"render_postcompile": True}
+    )
+    params = {}
+    for name, value in compiled.params.items():
+        bind = compiled.binds.get(name)
+        process = (
+            bind.type.dialect_impl(dialect).bind_processor(dialect)
+            if bind is not None
+            else None
+        )
+        params[name] = process(value) if process else value
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    return f"EXPLAIN (FORMAT JSON) {compiled.string}", params
+
+
+class QueryEstimate(NamedTuple):
+    """Coste total del plan y filas estimadas del nodo raíz"""
+
+    cost: float
+    rows: int
+
+
+def parse_plan(plan: Any) -> QueryEstimate:
+    """Extrae la estimación de la salida de EXPLAIN (FORMAT JSON)"""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    root = plan[0]["Plan"]
+    return QueryEstimate(cost=float(root["Total Cost"]), rows=int(root["Plan Rows"]))
+
+
+def _filter_shape(filter_model: Any) -> tuple:
+    """
+    Campos y operadores del filtro, sin los valores.
+
+    La longitud de las listas IN cuenta por órdenes de magnitud: 10 o
+    10.000 ids no cuestan lo mismo.
+    """
+    shape = []
+    for field_enum, operator, value in getattr(filter_model, "filters", None) or []:
+        size = len(value).bit_length() if isinstance(value, (list, tuple)) else 0
+        shape.append((field_enum.value, operator.value, size))
+    return tuple(shape)
+
+
+def _sort_shape(sort_model: Any) -> tuple:
+    return tuple(
+        (field_enum.value, direction.value)
+        for field_enum, direction in getattr(sort_model, "sorts", None) or []
+    )
+
+
+class QueryGuard:
+    """
+    Rechaza los listados demasiado caros antes de ejecutarlos.
+
+    Primero aplica límites estáticos (número de filtros y de criterios de
+    orden, longitud de las listas IN y profundidad del OFFSET). Después, en
+    PostgreSQL, estima el coste con EXPLAIN: una vez por forma de consulta
+    (modelo, campos y operadores del filtro, orden y magnitud del OFFSET),
+    cacheado durante ESTIMATE_TTL_SECONDS.
+
+    Una página por encima de QUERY_MAX_COST se rechaza; un COUNT por encima
+    se sustituye por las filas estimadas por el planificador.
+    """
+
+    def __init__(self, cache_size: int):
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._estimates: OrderedDict[tuple, tuple[float, QueryEstimate]] = OrderedDict()
+        self.explains = 0
+        self.cache_hits = 0
+        self.rejected = 0
+        self.estimated_counts = 0
+
+    def check_filter(self, filter_model: Any) -> None:
+        """Límites estáticos del filtro"""
+        filters = getattr(filter_model, "filters", None) or []
+        if len(filters) > config.query_max_filter_terms:
+            self._reject(
+                f"{len(filters)} filter terms (limit {config.query_max_filter_terms})"
+            )
+        for field_enum, operator, value in filters:
+            if (
+                operator in (FilterOperator.IN, FilterOperator.NOT_IN)
+                and len(value) > config.query_max_in_list
+            ):
+                self._reject(
+                    f"{len(value):,} values in '{field_enum.value}:{operator.value}' "
+                    f"(limit {config.query_max_in_list:,})"
+                )
+
+    def check_page_limits(
+        self, filter_model: Any, sort_model: Any, offset: int
+    ) -> None:
+        """Límites estáticos de una página: filtro, criterios de orden y OFFSET"""
+        self.check_filter(filter_model)
+        sorts = getattr(sort_model, "sorts", None) or []
+        if len(sorts) > config.query_max_sort_terms:
+            self._reject(
+                f"{len(sorts)} sort terms (limit {config.query_max_sort_terms})"
+            )
+        if offset > config.query_max_offset:
+            self._reject(
+                f"offset {offset:,} exceeds {config.query_max_offset:,}; "
+                "narrow the results with filters instead of paging deeper"
+            )
+
+    def check_page(
+        self,
+        session: Session,
+        model_class: type,
+        filter_model: Any,
+        sort_model: Any,
+        offset: int,
+        query: Executable,
+    ) -> None:
+        """Límites estáticos y coste estimado de una página del listado"""
+        self.check_page_limits(filter_model, sort_model, offset)
+
+        shape = (
+            model_class,
+            "page",
+            _filter_shape(filter_model),
+            _sort_shape(sort_model),
+            offset.bit_length(),
+        )
+        estimate = self._estimate(session, shape, query)
+        if estimate and config.query_max_cost and estimate.cost > config.query_max_cost:
+            self._reject(
+                f"estimated cost {estimate.cost:,.0f} exceeds {config.query_max_cost:,.0f} "
+                f"(about {estimate.rows:,} rows); add a filter or sort by an indexed field"
+            )
+
+    def estimated_count(
+        self, session: Session, model_class: type, filter_model: Any, query: Executable
+    ) -> int | None:
+        """
+        Filas estimadas si contar el filtro supera QUERY_MAX_COST; None si se
+        puede ejecutar el COUNT exacto.
+
+        Args:
+            query: SELECT filtrado sin agregar; sus filas estimadas son el total
+        """
+        self.check_filter(filter_model)
+        shape = (model_class, "count", _filter_shape(filter_model))
+        estimate = self._estimate(session, shape, query)
+        if (
+            estimate is None
+            or not config.query_max_cost
+            or estimate.cost <= config.query_max_cost
+        ):
+            return None
+        self.estimated_counts += 1
+        logger.info(
+            f"Estimated count for {model_class.__name__} "
+            f"(cost {estimate.cost:,.0f}): {estimate.rows:,} rows"
+        )
+        return estimate.rows
+
+    def _estimate(
+        self, session: Session, shape: tuple, query: Executable
+    ) -> QueryEstimate | None:
+        if not config.query_max_cost:
+            return None
+        if session.get_bind().dialect.name != "postgresql":
+            return None
+
+        now = monotonic()
+        with self._lock:
+            cached = self._estimates.get(shape)
+            if cached and now - cached[0] < ESTIMATE_TTL_SECONDS:
+                self._estimates.move_to_end(shape)
+                self.cache_hits += 1
+                return cached[1]
+
+        try:
+            # En un savepoint: si EXPLAIN falla, la transacción sigue utilizable
+            with session.begin_nested():
+                connection = session.connection()
+                sql, params = explain_sql(query, connection.dialect)
+                plan = connection.exec_driver_sql(sql, params).scalar_one()
+            estimate = parse_plan(plan)
+        except (SQLAlchemyError, KeyError, IndexError, ValueError) as e:
+            # Sin estimación no se bloquea: quedan los límites estáticos
+            logger.warning(f"Query cost estimate failed: {str(e)}")
+            return None
+
+        with self._lock:
+            self.explains += 1
+            self._estimates[shape] = (now, estimate)
+            self._estimates.move_to_end(shape)
+            while len(self._estimates) > self.cache_size:
+                self._estimates.popitem(last=False)
+        return estimate
+
+    def _reject(self, reason: str) -> None:
+        self.rejected += 1
+        logger.warning(f"Query rejected: {reason}")
+        raise QueryTooExpensiveException(reason)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._estimates.clear()
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "cached_shapes": len(self._estimates),
+            "explains": self.explains,
+            "cache_hits": self.cache_hits,
+            "rejected": self.rejected,
+            "estimated_counts": self.estimated_counts,
+        }
+
+
+query_guard = QueryGuard(config.query_guard_cache_size)
+register_metrics("query_guard", query_guard.metrics)
@@ -0,0 +1,211 @@
+import threading
+from typing import Any, NamedTuple
+
+from loguru import logger
+from sqlalchemy import Engine, event, make_url
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session
+
+from app.core.metrics import register_metrics
+
+# PRAGMA optimize cada tantos checkpoints (una vez por hora con 60 s)
+OPTIMIZE_EVERY_CHECKPOINTS = 60
+
+
+class SQLiteProfile(NamedTuple):
+    """Ajustes de las conexiones a un archivo SQLite en producción"""
+
+    busy_timeout_ms: int = 5000
+    cache_size_mb: int = 16
+    mmap_size_mb: int = 256
+
+    def pragmas(self, read_only: bool = False) -> list[str]:
+        """
+        PRAGMAs que se aplican a cada conexión nueva.
+
+        - WAL: los lectores no bloquean al escritor ni al revés.
+        - synchronous=NORMAL: en WAL no hay fsync por commit, solo en los
+          checkpoints; un corte de luz puede perder los últimos commits pero
+          no corromper la base.
+        - busy_timeout: otro proceso con el bloqueo de escritura hace esperar
+          en lugar de fallar con "database is locked".
+        - cache_size (negativo = KiB) y mmap_size: páginas en memoria por
+          conexión y lecturas directas del page cache del sistema.
+        """
+        pragmas = [
+            "journal_mode=WAL",
+            "synchronous=NORMAL",
+            f"busy_timeout={self.busy_timeout_ms}",
+            f"cache_size=-{self.cache_size_mb * 1024}",
+            f"mmap_size={self.mmap_size_mb * 1024 * 1024}",
+            "temp_store=MEMORY",
+        ]
+        if read_only:
+            # Una escritura enviada por error al motor de lectura falla en
+            # lugar de competir por el bloqueo con el escritor
+            pragmas.append("query_only=ON")
+        return pragmas
+
+
+def is_sqlite_file(url: str) -> bool:
+    """True si la URL es un archivo SQLite (no una base en memoria)"""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def configure_connections(
+    engine: Engine, profile: SQLiteProfile, read_only: bool = False
+) -> None:
+    """Aplica los PRAGMAs del perfil a cada conexión que abra el motor"""
+    pragmas = profile.pragmas(read_only)
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(f"PRAGMA {pragma}")
+        finally:
+            cursor.close()
+
+
+class RoutingSession(Session):
+    """
+    Sesión con un escritor y varios lectores.
+
+    SQLite admite un único escritor a la vez: las escrituras (flush e
+    INSERT/UPDATE/DELETE explícitos) usan el motor de escritura, con una sola
+    conexión, y las lecturas el de lectura, con varias. En WAL cada lector ve
+    los commits anteriores a su consulta.
+
+    Una vez que la transacción ha escrito, el resto de sus consultas van al
+    escritor para ver sus propios cambios sin confirmar; al terminar la
+    transacción se vuelve a leer de los lectores.
+    """
+
+    def __init__(self, writer: Engine, reader: Engine, **kwargs: Any):
+        super().__init__(writer, **kwargs)
+        self.reader = reader
+        # La transacción en curso ha usado el escritor
+        self._wrote = False
+
+    def get_bind(self, mapper=None, *, clause=None, bind=None, **kwargs):
+        if bind is not None:
+            self._wrote = self._wrote or bind is self.bind
+            return bind
+        if isinstance(clause, UpdateBase):
+            self._wrote = True
+        return self.bind if self._wrote else self.reader
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _route_flush_to_writer(session: RoutingSession, flush_context, instances) -> None:
+    # Solo se emite si hay cambios pendientes: el flush y lo que siga en la
+    # transacción usan el escritor
+    session._wrote = True
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_writes(session: RoutingSession, transaction) -> None:
+    # Solo al terminar la transacción raíz, no un savepoint
+    if transaction.parent is None:
+        session._wrote = False
+
+
+class WALCheckpointer:
+    """
+    Mantenimiento periódico de un archivo SQLite en WAL.
+
+    SQLite solo hace checkpoint automático al confirmar, cuando el WAL supera
+    1000 páginas, y nunca si siempre hay lectores abiertos: el WAL crece y
+    cada lectura recorre más índice del WAL. Un hilo hace cada `interval`
+    segundos un checkpoint PASSIVE (no espera a lectores ni escritores) y, de
+    vez en cuando, `PRAGMA optimize` para refrescar las estadísticas del
+    planificador. Al parar deja el WAL vacío con un checkpoint TRUNCATE.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        interval: float,
+        optimize_every: int = OPTIMIZE_EVERY_CHECKPOINTS,
+    ):
+        self.engine = engine
+        self.interval = interval
+        self.optimize_every = optimize_every
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.checkpoints = 0
+        self.optimizations = 0
+        self.wal_pages = 0
+        self.checkpointed_pages = 0
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sqlite-wal-checkpointer", daemon=True
+        )
+        self._thread.start()
+        register_metrics("sqlite_wal", self.metrics)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+        try:
+            self.checkpoint("TRUNCATE")
+            self.optimize()
+        except Exception as e:
+            logger.warning(f"Final SQLite checkpoint failed: {e}")
+
+    def checkpoint(self, mode: str = "PASSIVE") -> tuple[int, int, int]:
+        """
+        Ejecuta `PRAGMA wal_checkpoint(mode)`.
+
+        Returns:
+            (busy, páginas en el WAL, páginas copiadas a la base)
+        """
+        busy, wal_pages, checkpointed = self._pragma(f"wal_checkpoint({mode})")
+        self.checkpoints += 1
+        self.wal_pages = wal_pages
+        self.checkpointed_pages = checkpointed
+        return busy, wal_pages, checkpointed
+
+    def optimize(self) -> None:
+        self._pragma("optimize")
+        self.optimizations += 1
+
+    def _pragma(self, pragma: str) -> Any:
+        # Conexión DBAPI del pool de escritura, en autocommit (pysqlite no
+        # abre transacción para PRAGMA): el checkpoint no compite con un BEGIN
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            try:
+                return cursor.execute(f"PRAGMA {pragma}").fetchone()
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.checkpoint()
+                if self.checkpoints % self.optimize_every == 0:
+                    self.optimize()
+            except Exception as e:
+                logger.warning(f"SQLite checkpoint failed: {e}")
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "checkpoints": self.checkpoints,
+            "optimizations": self.optimizations,
+            "wal_pages": self.wal_pages,
+            "checkpointed_pages": self.checkpointed_pages,
+        }
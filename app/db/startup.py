@@ -0,0 +1,132 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from loguru import logger
+from sqlalchemy import Engine, text
+from sqlalchemy.pool import QueuePool
+from sqlmodel import SQLModel, Session, select
+
+from app.core.config import Settings
+from app.db.database import Database
+from app.db.partitioning import ensure_partitions, partitioned_tables
+from app.repositories.base_repository import BaseRepository
+
+
+class SchemaOutOfDateError(RuntimeError):
+    """La base de datos no está en la revisión head de alembic"""
+
+    def __init__(self, current: str | None, expected: str | None):
+        super().__init__(
+            f"Database schema revision is {current!r}, expected {expected!r}. "
+            "Run 'alembic upgrade head' before starting the application."
+        )
+
+
+def get_alembic_head(config_path: str) -> str | None:
+    """Lee la revisión head de los ficheros de migración (sin tocar la base)"""
+    # Importación diferida: alembic solo hace falta en el modo "verify"
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(Config(config_path)).get_current_head()
+
+
+def verify_schema(engine: Engine, expected_head: str | None) -> None:
+    """Comprueba con una sola consulta que la base está en la revisión esperada"""
+    with engine.connect() as connection:
+        try:
+            current = connection.execute(
+                text("SELECT version_num FROM alembic_version")
+            ).scalar()
+        except Exception:
+            current = None
+    if current != expected_head:
+        raise SchemaOutOfDateError(current, expected_head)
+
+
+def prewarm_pool(engine: Engine, connections: int) -> None:
+    """Abre `connections` conexiones del pool en paralelo y las devuelve al pool"""
+    pool_capacity = engine.pool.size() if isinstance(engine.pool, QueuePool) else 1
+    connections = min(connections, pool_capacity)
+    # Cada hilo retiene su conexión hasta que todas estén abiertas
+    barrier = threading.Barrier(connections)
+
+    def open_connection():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            barrier.wait(timeout=30)
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        for future in [executor.submit(open_connection) for _ in range(connections)]:
+            future.result()
+
+
+def warm_statements(engine: Engine) -> int:
+    """
+    Precalienta las sentencias habituales de cada repositorio (listado ORM,
+    listado Core y count) con la API pública.
+
+    Los listados se ejecutan con LIMIT 0 en una transacción que se deshace:
+    el límite es un parámetro, así que quedan en la caché del engine con la
+    misma clave que las consultas reales sin leer filas. El count solo se
+    compila (un COUNT real recorrería la tabla en cada arranque).
+
+    Returns:
+        Número de sentencias precalentadas
+    """
+    warmed = 0
+    with Session(engine) as session:
+        for repository_class in BaseRepository.registry:
+            repository = repository_class(session)
+            model_class = repository.model_class
+            columns = model_class.__table__.columns
+            for query in (select(model_class), select(*columns)):
+                statement = repository._build_filtered_query(query, None, None)
+                session.execute(statement.offset(0).limit(0)).all()
+                warmed += 1
+            repository._build_count_query(None).compile(dialect=engine.dialect)
+            warmed += 1
+        session.rollback()
+    return warmed
+
+
+@contextmanager
+def _timed(timings: dict[str, float], phase: str):
+    start = time.perf_counter()
+    yield
+    timings[phase] = (time.perf_counter() - start) * 1000
+
+
+def prepare_database(database: Database, settings: Settings) -> dict[str, float]:
+    """
+    Prepara la base de datos al arrancar un worker.
+
+    Returns:
+        Duración en milisegundos de cada fase
+    """
+    timings: dict[str, float] = {}
+
+    with _timed(timings, "schema"):
+        if settings.db_startup_mode == "verify":
+            verify_schema(database.engine, get_alembic_head(settings.alembic_config))
+        else:
+            database.create_db_and_tables()
+
+    if partitioned_tables(SQLModel.metadata):
+        with _timed(timings, "partitions"):
+            ensure_partitions(database.engine, SQLModel.metadata)
+
+    if settings.db_prewarm_connections:
+        with _timed(timings, "pool"):
+            prewarm_pool(database.read_engine, settings.db_prewarm_connections)
+
+    with _timed(timings, "statements"):
+        # Las lecturas usan read_engine: es su caché la que hay que llenar
+        warm_statements(database.read_engine)
+
+    for phase, elapsed in timings.items():
+        logger.info(f"Startup phase '{phase}' took {elapsed:.1f} ms")
+
+    return timings
@@ -0,0 +1,114 @@
+import sqlite3
+from contextvars import ContextVar
+from time import monotonic
+
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool
+
+# Código SQLSTATE de Postgres para query_canceled (statement_timeout)
+QUERY_CANCELED = "57014"
+# Instrucciones de la VM de SQLite entre comprobaciones del plazo
+SQLITE_PROGRESS_STEPS = 1000
+
+
+class QueryDeadline:
+    """
+    Plazo de las consultas de una petición.
+
+    Combina el statement timeout del servidor (Settings o el de la ruta) con
+    el presupuesto que indica el cliente en la cabecera de plazo; gana el
+    que vence antes y se recuerda cuál fue para elegir 503 o 504.
+    """
+
+    __slots__ = ("started", "timeout", "client_deadline")
+
+    def __init__(self, timeout: float | None, client_budget: float | None = None):
+        self.started = monotonic()
+        self.timeout = timeout
+        self.client_deadline = (
+            self.started + client_budget if client_budget is not None else None
+        )
+
+    @property
+    def server_deadline(self) -> float | None:
+        return self.started + self.timeout if self.timeout else None
+
+    @property
+    def deadline(self) -> float | None:
+        deadlines = [d for d in (self.server_deadline, self.client_deadline) if d]
+        return min(deadlines) if deadlines else None
+
+    @property
+    def client_bound(self) -> bool:
+        """True si el plazo del cliente vence antes que el del servidor"""
+        return (
+            self.client_deadline is not None and self.deadline == self.client_deadline
+        )
+
+    def remaining_ms(self) -> int | None:
+        deadline = self.deadline
+        if deadline is None:
+            return None
+        # Nunca 0: en Postgres statement_timeout = 0 desactiva el límite
+        return max(1, int((deadline - monotonic()) * 1000))
+
+
+query_deadline: ContextVar[QueryDeadline | None] = ContextVar(
+    "query_deadline", default=None
+)
+
+
+def statement_timeout(timeout_ms: int):
+    """
+    Dependencia que sustituye el statement timeout por defecto de la ruta.
+
+    Es asíncrona a propósito: se ejecuta en la tarea de la petición, de modo
+    que el cambio es visible en los hilos donde corren rutas y dependencias
+    síncronas.
+    """
+
+    async def set_statement_timeout():
+        deadline = query_deadline.get()
+        if deadline is not None:
+            deadline.timeout = timeout_ms / 1000
+
+    return Depends(set_statement_timeout)
+
+
+def is_statement_timeout(exc: DBAPIError) -> bool:
+    """Indica si el error es una consulta cancelada por el plazo"""
+    orig = exc.orig
+    # psycopg3 expone el SQLSTATE como sqlstate; psycopg2 como pgcode
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    if sqlstate == QUERY_CANCELED:
+        return True
+    return isinstance(orig, sqlite3.OperationalError) and "interrupted" in str(orig)
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(session, transaction, connection):
+    deadline = query_deadline.get()
+    if deadline is None or deadline.deadline is None:
+        return
+
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        # SET LOCAL: el límite muere con la transacción, no con la conexión
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {deadline.remaining_ms()}"
+        )
+    elif dialect == "sqlite":
+        expires_at = deadline.deadline
+        connection.connection.dbapi_connection.set_progress_handler(
+            lambda: monotonic() > expires_at, SQLITE_PROGRESS_STEPS
+        )
+
+
+@event.listens_for(Pool, "checkin")
+def _clear_sqlite_progress_handler(dbapi_connection, connection_record):
+    # El manejador se queda en la conexión: se retira al devolverla al pool
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.set_progress_handler(None, 0)
@@ -0,0 +1,208 @@
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from time import monotonic
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import QueuePool
+from sqlmodel import Session
+
+from app.core.change_stream import broadcaster, publish_change, stage_change
+from app.core.config import get_settings
+from app.core.metrics import register_metrics
+from app.db.statement_timeout import query_deadline
+from app.exceptions.database import StatementTimeoutException
+
+config = get_settings()
+
+
+class _Batch:
+    """Inserciones pendientes de un mismo motor y modelo"""
+
+    __slots__ = ("entities", "futures", "closed", "flushing")
+
+    def __init__(self):
+        self.entities: list[Any] = []
+        self.futures: list[Future] = []
+        # Se activa cuando el lote se llena: el líder no espera al plazo
+        self.closed = threading.Event()
+        # Se activa (bajo el cerrojo) cuando el líder empieza a insertarlo
+        self.flushing = False
+
+
+class WriteCoalescer:
+    """
+    Agrupa las altas concurrentes en una sola transacción (group commit).
+
+    El primer hilo que llega abre un lote y actúa de líder: espera como mucho
+    `max_delay` segundos (o a que haya `max_batch` filas) y, cuando termina el
+    commit anterior, inserta el lote en una sesión propia y completa el futuro
+    de cada llamante. Así N altas simultáneas pagan un único commit (un fsync)
+    y el lote crece solo cuando los commits se encolan; la espera añadida es
+    `max_delay` más, como mucho, el commit que ya estaba en curso.
+
+    Si el commit del lote falla, cada fila se reintenta en su propia
+    transacción para que cada llamante reciba su fila o su propio error. Cada
+    llamante espera como mucho el plazo de su petición (StatementTimeout):
+    si vence antes de que el líder empiece a insertar, su fila sale del lote;
+    si el commit ya está en curso, espera a su resultado para no responder
+    con un error por una fila que sí se inserta (y se duplicaría al
+    reintentar).
+    """
+
+    def __init__(self, max_batch: int, max_delay: float):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._batches: dict[tuple[Engine, type], _Batch] = {}
+        self._flush_locks: dict[tuple[Engine, type], threading.Lock] = {}
+        self.batches = 0
+        self.rows = 0
+        self.fallbacks = 0
+
+    def create(self, engine: Engine, entity: Any) -> Any:
+        """Inserta la entidad con el siguiente lote y la devuelve desligada"""
+        key = (engine, type(entity))
+        future: Future = Future()
+        with self._lock:
+            batch = self._batches.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._batches[key] = _Batch()
+            batch.entities.append(entity)
+            batch.futures.append(future)
+            if len(batch.entities) >= self.max_batch:
+                del self._batches[key]
+                batch.closed.set()
+
+        if leader:
+            try:
+                batch.closed.wait(self.max_delay)
+                # Un solo commit en curso por motor y modelo: mientras espera,
+                # el lote sigue abierto y acumula las altas que llegan
+                with self._flush_lock(key):
+                    self._close(key, batch, flushing=True)
+                    self._flush(engine, batch)
+            finally:
+                # Si el líder sale con algo que _flush no captura (p. ej. una
+                # cancelación), ningún llamante se queda esperando su futuro
+                self._close(key, batch)
+                for pending in batch.futures:
+                    if not pending.done():
+                        pending.set_exception(
+                            RuntimeError("Group commit leader exited before commit")
+                        )
+
+        deadline = query_deadline.get()
+        remaining = deadline.deadline if deadline else None
+        if remaining is not None:
+            remaining = max(0.0, remaining - monotonic())
+        try:
+            # Como mucho lo que queda del plazo de la petición
+            return future.result(timeout=remaining)
+        except FutureTimeoutError:
+            if self._withdraw(batch, future):
+                raise StatementTimeoutException(client_deadline=deadline.client_bound)
+        # El líder ya está insertando la fila: su resultado es el de la petición
+        return future.result()
+
+    def _close(
+        self, key: tuple[Engine, type], batch: _Batch, flushing: bool = False
+    ) -> None:
+        """Retira el lote para que las altas siguientes abran otro"""
+        with self._lock:
+            if self._batches.get(key) is batch:
+                del self._batches[key]
+            batch.flushing = batch.flushing or flushing
+
+    def _withdraw(self, batch: _Batch, future: Future) -> bool:
+        """Saca la fila del lote si el líder aún no ha empezado a insertarlo"""
+        with self._lock:
+            if batch.flushing:
+                return False
+            index = batch.futures.index(future)
+            del batch.entities[index]
+            del batch.futures[index]
+            return True
+
+    def _flush_lock(self, key: tuple[Engine, type]) -> threading.Lock:
+        with self._lock:
+            return self._flush_locks.setdefault(key, threading.Lock())
+
+    def _flush(self, engine: Engine, batch: _Batch) -> None:
+        self.batches += 1
+        self.rows += len(batch.entities)
+        try:
+            self._insert(engine, batch.entities)
+        except SQLAlchemyError as e:
+            logger.warning(
+                f"Group commit of {len(batch.entities)} rows failed, "
+                f"retrying one by one: {e}"
+            )
+            self.fallbacks += 1
+            for entity, future in zip(batch.entities, batch.futures):
+                try:
+                    self._insert(engine, [entity])
+                    future.set_result(entity)
+                except Exception as row_error:
+                    future.set_exception(row_error)
+            return
+        except Exception as e:
+            for future in batch.futures:
+                future.set_exception(e)
+            return
+
+        for entity, future in zip(batch.entities, batch.futures):
+            future.set_result(entity)
+
+    @staticmethod
+    def _insert(engine: Engine, entities: list[Any]) -> None:
+        # Sin expirar al confirmar: los llamantes leen sus filas ya desligadas
+        # (los valores por defecto del servidor llegan con RETURNING)
+        with Session(engine, expire_on_commit=False) as session:
+            session.add_all(entities)
+            events = []
+            if broadcaster.active:
+                # Los NOTIFY van en la transacción del lote
+                connection = session.connection()
+                events = [
+                    stage_change("created", type(entity), entity, connection)
+                    for entity in entities
+                ]
+            session.commit()
+        for event in events:
+            publish_change(event)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "avg_batch_size": round(self.rows / self.batches, 2) if self.batches else 0,
+            "fallbacks": self.fallbacks,
+        }
+
+
+_coalescer = WriteCoalescer(
+    max_batch=config.write_coalesce_max_batch,
+    max_delay=config.write_coalesce_max_delay_ms / 1000,
+)
+register_metrics("write_coalescer", _coalescer.metrics)
+
+
+def get_write_coalescer(session: Session) -> WriteCoalescer | None:
+    """
+    Devuelve el agrupador si puede usarse para un alta en esta sesión.
+
+    Requiere WRITE_COALESCING activo, un QueuePool (SQLite en memoria
+    comparte una única conexión entre hilos) y una sesión sin cambios
+    pendientes, que de otro modo se confirmarían junto al alta.
+    """
+    if not config.write_coalescing:
+        return None
+    if not isinstance(session.get_bind().pool, QueuePool):
+        return None
+    if session.new or session.dirty or session.deleted:
+        return None
+    return _coalescer
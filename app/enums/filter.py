@@ -13,5 +13,6 @@ class FilterOperator(str, Enum):
     LIKE = "like"  # Contains (case insensitive)
     IN = "in"  # In list
     NOT_IN = "not_in"  # Not in list
+    BETWEEN = "between"  # Between two values (inclusive)
     IS_NULL = "is_null"  # Is null
     IS_NOT_NULL = "is_not_null"  # Is not null
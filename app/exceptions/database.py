@@ -0,0 +1,10 @@
+from app.exceptions.base import AppException
+
+
+class StatementTimeoutException(AppException):
+    def __init__(self, client_deadline: bool = False):
+        # 504 si se agotó el plazo del cliente; 503 si el límite del servidor
+        if client_deadline:
+            super().__init__("Request deadline exceeded", status_code=504)
+        else:
+            super().__init__("Database query timed out", status_code=503)
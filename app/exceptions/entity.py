@@ -0,0 +1,7 @@
+from app.exceptions.base import AppException
+from uuid import UUID
+
+
+class EntityNotFoundException(AppException):
+    def __init__(self, model_name: str, entity_id: UUID):
+        super().__init__(f"{model_name} with id {entity_id} not found", status_code=404)
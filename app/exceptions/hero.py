@@ -1,7 +1,7 @@
-from app.exceptions.base import AppException
+from app.exceptions.entity import EntityNotFoundException
 from uuid import UUID
 
 
-class HeroNotFoundException(AppException):
+class HeroNotFoundException(EntityNotFoundException):
     def __init__(self, hero_id: UUID):
-        super().__init__(f"Hero with id {hero_id} not found", status_code=404)
+        super().__init__("Hero", hero_id)
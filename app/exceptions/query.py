@@ -0,0 +1,8 @@
+from app.exceptions.base import AppException
+
+
+class QueryTooExpensiveException(AppException):
+    """Consulta rechazada por los límites de QUERY_MAX_* o por su coste estimado"""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Query rejected: {reason}", status_code=400)
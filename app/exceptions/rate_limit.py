@@ -0,0 +1,10 @@
+from app.exceptions.base import AppException
+
+
+class RateLimitExceededException(AppException):
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(
+            f"Rate limit exceeded, retry in {retry_after:.0f} seconds",
+            status_code=429,
+        )
@@ -1,24 +1,38 @@
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.db.database import db
+from app.db.startup import prepare_database
+from app.db.notify_bridge import PostgresNotifyBridge
+from app.db.sqlite_profile import WALCheckpointer
+from app.core.change_stream import broadcaster
 from app.routes.test import test_router
+from app.routes.heroes import heroes_router
+from app.routes.metrics import metrics_router
+from app.middleware.admission import AdmissionControlMiddleware
+from app.middleware.thread_pool import ThreadWaitHeaderMiddleware
+from app.middleware.rate_limit import RateLimitHeadersMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.deadline import DeadlineMiddleware
+from app.db.statement_timeout import is_statement_timeout, query_deadline
+from app.exceptions.database import StatementTimeoutException
+from sqlalchemy.exc import DBAPIError
+from app.core.thread_pool import (
+    configure_thread_limiter,
+    measure_thread_wait,
+    start_thread_wait,
+)
 from app.exceptions.base import AppException
 from app.utils.response import ResponseBuilder
 from app.core.config import get_settings
+from app.core.logging import configure_logging
 from loguru import logger
 import traceback
-import sys
 
 config = get_settings()
-
-logger.remove()
-logger.add(
-    sys.stderr,
-    level=config.log_level.upper(),
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-)
+# Antes de cualquier log: lo emitido al importar también usa el formato y nivel
+configure_logging(config)
 
 
 @asynccontextmanager
@@ -27,15 +41,56 @@ async def lifespan(app: FastAPI):
     logger.debug(f"Environment: {config.model_config.get('env_file', 'default')}")
     logger.debug(f"Debug mode: {config.debug}")
     logger.debug(f"Log level: {config.log_level}")
-    db.create_db_and_tables()
+    logger.debug(f"CORS enabled for origins: {', '.join(config.cors_origins)}")
+    configure_thread_limiter(config.thread_pool_size)
+    app.state.startup_timings = prepare_database(db, config)
+    bridge = None
+    if config.change_stream_bridge and db.url.startswith("postgresql"):
+        bridge = PostgresNotifyBridge(
+            db.engine, broadcaster, channel=config.change_stream_channel
+        )
+        bridge.start()
+    checkpointer = None
+    if db.sqlite_profile and config.sqlite_checkpoint_interval:
+        checkpointer = WALCheckpointer(db.engine, config.sqlite_checkpoint_interval)
+        checkpointer.start()
     yield
+    # uvicorn ya ha drenado las peticiones en curso al llegar aquí
     logger.debug("Shutting down application")
+    if bridge is not None:
+        bridge.stop()
+    if checkpointer is not None:
+        checkpointer.stop()
+    db.dispose()
 
 
 app = FastAPI(
-    lifespan=lifespan, title=config.app_name, debug=config.debug, version=config.version
+    lifespan=lifespan,
+    title=config.app_name,
+    debug=config.debug,
+    version=config.version,
+    # Miden la espera de cada petición por un hilo del pool (en este orden)
+    dependencies=[Depends(start_thread_wait), Depends(measure_thread_wait)],
 )
 
+if config.debug:
+    app.add_middleware(ThreadWaitHeaderMiddleware)
+
+app.add_middleware(RateLimitHeadersMiddleware)
+
+app.add_middleware(DeadlineMiddleware, timeout_ms=config.statement_timeout_ms)
+
+if config.admission_limits:
+    # Delante del pool de hilos: las peticiones rechazadas no ocupan hilos
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limits=config.admission_limits,
+        queue_size=config.admission_queue_size,
+        queue_timeout=config.admission_queue_timeout_ms / 1000,
+        adaptive=config.admission_adaptive,
+        target_latency=config.admission_target_latency_ms / 1000,
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=config.cors_origins,
@@ -44,7 +99,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-logger.debug(f"CORS enabled for origins: {', '.join(config.cors_origins)}")
+if config.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=config.compression_min_size,
+        levels={
+            "gzip": config.compression_gzip_level,
+            "br": config.compression_brotli_quality,
+            "zstd": config.compression_zstd_level,
+        },
+    )
 
 
 @app.exception_handler(RequestValidationError)
@@ -69,6 +133,23 @@ async def app_exception_handler(request: Request, exc: AppException):
     )
 
 
+@app.exception_handler(DBAPIError)
+async def database_error_handler(request: Request, exc: DBAPIError):
+    """Traduce las consultas canceladas por el plazo a 503/504"""
+    if not is_statement_timeout(exc):
+        # El resto de errores de base de datos siguen al manejador global
+        raise exc
+
+    deadline = query_deadline.get()
+    logger.warning(f"Statement timeout on {request.url.path}")
+    return await app_exception_handler(
+        request,
+        StatementTimeoutException(
+            client_deadline=bool(deadline and deadline.client_bound)
+        ),
+    )
+
+
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
     """Maneja ValueError (errores de validación de negocio)"""
@@ -93,6 +174,8 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 app.include_router(test_router)
+app.include_router(heroes_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
@@ -0,0 +1,216 @@
+import math
+from collections import deque
+from time import monotonic
+from typing import Any
+
+import anyio
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import register_metrics
+from app.utils.response import ResponseBuilder
+
+# Suavizado de la latencia observada (media móvil exponencial)
+LATENCY_ALPHA = 0.2
+# Factor de reducción multiplicativa del modo adaptativo
+DECREASE_FACTOR = 0.9
+
+
+class AdmissionRejected(Exception):
+    """La petición no puede admitirse antes del plazo de la cola"""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+
+
+class AdmissionGroup:
+    """
+    Límite de concurrencia de un grupo de rutas con cola acotada.
+
+    Admite hasta `limit` peticiones simultáneas; el resto espera en una cola
+    FIFO de como mucho `queue_size` peticiones y `queue_timeout` segundos. Si
+    la espera estimada (posición en la cola / límite × latencia media) supera
+    el plazo, la petición se rechaza sin llegar a encolarse.
+
+    En modo adaptativo el límite sigue un esquema AIMD: crece 1/limit por cada
+    respuesta por debajo de `target_latency` y se multiplica por 0.9 (como
+    mucho una vez por latencia media) cuando la latencia supera el objetivo.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        queue_size: int,
+        queue_timeout: float,
+        adaptive: bool = False,
+        target_latency: float = 0.25,
+        min_limit: int = 1,
+    ):
+        self.max_limit = limit
+        # Con menos de una petición admitida el grupo no avanzaría nunca
+        self.min_limit = max(1, min(min_limit, limit))
+        self.limit: float = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.adaptive = adaptive
+        self.target_latency = target_latency
+
+        self.in_flight = 0
+        self.latency: float | None = None
+        self.admitted = 0
+        self.rejected = 0
+        self._waiters: deque[anyio.Event] = deque()
+        self._last_decrease = 0.0
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < math.floor(self.limit)
+
+    def estimated_wait(self, position: int) -> float:
+        """Segundos estimados hasta admitir la petición en `position` de la cola"""
+        return (position + 1) / math.floor(self.limit) * (self.latency or 0.0)
+
+    def _reject(self, retry_after: float) -> AdmissionRejected:
+        self.rejected += 1
+        return AdmissionRejected(retry_after)
+
+    async def acquire(self) -> None:
+        if self._has_capacity() and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return
+
+        position = len(self._waiters)
+        if position >= self.queue_size:
+            raise self._reject(self.queue_timeout)
+        estimated = self.estimated_wait(position)
+        if estimated > self.queue_timeout:
+            raise self._reject(estimated)
+
+        event = anyio.Event()
+        self._waiters.append(event)
+        try:
+            with anyio.move_on_after(self.queue_timeout):
+                await event.wait()
+        except BaseException:
+            # Cancelada mientras esperaba (p. ej. el cliente se desconectó)
+            self._abandon(event)
+            raise
+        if not event.is_set():
+            self._waiters.remove(event)
+            raise self._reject(self.queue_timeout)
+
+        # _wake_waiters() ya ha reservado el hueco para esta petición
+        self.admitted += 1
+
+    def release(self, latency: float) -> None:
+        self.in_flight -= 1
+        self._observe(latency)
+        self._wake_waiters()
+
+    def _abandon(self, event: anyio.Event) -> None:
+        if event.is_set():
+            self.in_flight -= 1
+            self._wake_waiters()
+        else:
+            self._waiters.remove(event)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._has_capacity():
+            self.in_flight += 1
+            self._waiters.popleft().set()
+
+    def _observe(self, latency: float) -> None:
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += LATENCY_ALPHA * (latency - self.latency)
+
+        if not self.adaptive:
+            return
+        now = monotonic()
+        if self.latency > self.target_latency:
+            if now - self._last_decrease >= self.latency:
+                self.limit = max(self.min_limit, self.limit * DECREASE_FACTOR)
+                self._last_decrease = now
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "limit": math.floor(self.limit),
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "latency_ms": round((self.latency or 0.0) * 1000, 3),
+        }
+
+
+def is_event_stream(scope: Scope) -> bool:
+    """
+    Las conexiones SSE duran lo que quiera el cliente y no consumen hilos ni
+    conexiones: no deben ocupar una plaza del grupo.
+    """
+    accept = dict(scope.get("headers", [])).get(b"accept", b"")
+    return b"text/event-stream" in accept
+
+
+class AdmissionControlMiddleware:
+    """
+    Middleware ASGI de control de admisión por grupo de rutas.
+
+    Cada grupo se identifica por un prefijo de ruta (gana el más largo); las
+    rutas fuera de cualquier grupo (p. ej. /health) no se limitan. Las
+    peticiones rechazadas reciben un 503 con Retry-After sin llegar a ocupar
+    hilos ni conexiones a la base de datos.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limits: dict[str, int],
+        queue_size: int = 100,
+        queue_timeout: float = 1.0,
+        adaptive: bool = False,
+        target_latency: float = 0.25,
+    ):
+        self.app = app
+        self.groups = {
+            prefix: AdmissionGroup(
+                limit, queue_size, queue_timeout, adaptive, target_latency
+            )
+            for prefix, limit in sorted(limits.items(), key=lambda i: -len(i[0]))
+        }
+        register_metrics("admission", self.metrics)
+
+    def group_for(self, path: str) -> AdmissionGroup | None:
+        for prefix, group in self.groups.items():
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return group
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        group = self.group_for(scope["path"]) if scope["type"] == "http" else None
+        if group is None or is_event_stream(scope):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await group.acquire()
+        except AdmissionRejected as exc:
+            response = ResponseBuilder.error(
+                errors=["Server is overloaded, retry later"],
+                message="Service Unavailable",
+                status_code=503,
+            )
+            response.headers["Retry-After"] = str(max(1, math.ceil(exc.retry_after)))
+            await response(scope, receive, send)
+            return
+
+        start = monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            group.release(monotonic() - start)
+
+    def metrics(self) -> dict[str, Any]:
+        return {prefix: group.metrics() for prefix, group in self.groups.items()}
@@ -0,0 +1,39 @@
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.db.statement_timeout import QueryDeadline, query_deadline
+
+DEADLINE_HEADER = "x-request-timeout-ms"
+
+
+class DeadlineMiddleware:
+    """
+    Middleware ASGI que fija el plazo de las consultas de cada petición.
+
+    Parte del statement timeout por defecto y lo reduce al presupuesto que
+    envía el cliente en X-Request-Timeout-Ms (milisegundos restantes), para
+    no seguir consultando cuando el cliente ya ha dejado de esperar.
+    """
+
+    def __init__(self, app: ASGIApp, timeout_ms: int):
+        self.app = app
+        self.timeout = timeout_ms / 1000 if timeout_ms else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client_budget = None
+        raw_budget = Headers(scope=scope).get(DEADLINE_HEADER)
+        if raw_budget is not None:
+            try:
+                client_budget = max(0.0, float(raw_budget) / 1000)
+            except ValueError:
+                pass
+
+        token = query_deadline.set(QueryDeadline(self.timeout, client_budget))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            query_deadline.reset(token)
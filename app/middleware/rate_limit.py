@@ -0,0 +1,30 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.rate_limit import RATE_LIMIT_STATE_KEY
+
+
+class RateLimitHeadersMiddleware:
+    """
+    Middleware ASGI que añade las cabeceras RateLimit-* a la respuesta.
+
+    La dependencia rate_limit deja el resultado en el estado de la petición;
+    así las cabeceras llegan también a las respuestas construidas con
+    ResponseBuilder y al 429 generado por el manejador de AppException.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            result = scope.get("state", {}).get(RATE_LIMIT_STATE_KEY)
+            if message["type"] == "http.response.start" and result is not None:
+                headers = [*message.get("headers", []), *result.headers()]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
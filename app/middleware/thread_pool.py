@@ -0,0 +1,33 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.thread_pool import THREAD_WAIT_MS
+
+THREAD_WAIT_HEADER = b"x-thread-wait-ms"
+
+
+class ThreadWaitHeaderMiddleware:
+    """
+    Middleware ASGI que añade la cabecera X-Thread-Wait-Ms (modo debug).
+
+    La espera la miden las dependencias start_thread_wait y
+    measure_thread_wait y queda en request.state; las peticiones que no
+    pasan por ellas (p. ej. un 404) no llevan la cabecera.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_header(message: Message) -> None:
+            wait_ms = scope.get("state", {}).get(THREAD_WAIT_MS)
+            if message["type"] == "http.response.start" and wait_ms is not None:
+                headers = list(message.get("headers", []))
+                headers.append((THREAD_WAIT_HEADER, f"{wait_ms:.3f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_header)
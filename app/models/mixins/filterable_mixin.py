@@ -1,4 +1,5 @@
-from typing import get_type_hints, Type, Any, cast
+from typing import get_args, get_type_hints, Type, Any, cast
+from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, field_validator
 from app.enums.filter import FilterOperator
@@ -7,10 +8,32 @@ from app.utils.filters.filter_validator import FilterValidator
 from app.exceptions.filters import InvalidFilterFormatException
 from loguru import logger
 
+_filter_classes_cache: dict[
+    tuple[type, frozenset[str]], tuple[Type[Enum], Type[BaseModel]]
+] = {}
+
+
+def _is_datetime(annotation: Any) -> bool:
+    """Si la anotación es datetime (o datetime | None)"""
+    return annotation is datetime or datetime in get_args(annotation)
+
 
 class FilterableMixin:
     """Mixin que genera automáticamente clases de filtrado para cualquier modelo"""
 
+    @classmethod
+    def filter_classes(
+        cls, exclude_fields: set[str] | None = None
+    ) -> tuple[Type[Enum], Type[BaseModel]]:
+        """
+        Igual que create_filter_classes, pero construye las clases una sola vez
+        por modelo y conjunto de campos excluidos y reutiliza el resultado.
+        """
+        key = (cls, frozenset(exclude_fields or ()))
+        if key not in _filter_classes_cache:
+            _filter_classes_cache[key] = cls.create_filter_classes(exclude_fields)
+        return _filter_classes_cache[key]
+
     @classmethod
     def create_filter_classes(
         cls, exclude_fields: set[str] | None = None
@@ -28,15 +51,20 @@ class FilterableMixin:
             exclude_fields = set()
 
         if hasattr(cls, "model_fields"):
-            field_names = [
-                name for name in cls.model_fields.keys() if name not in exclude_fields
-            ]
+            annotations = {
+                name: field.annotation for name, field in cls.model_fields.items()
+            }
         else:
-            field_names = [
-                name
-                for name in get_type_hints(cls).keys()
-                if name not in exclude_fields and not name.startswith("_")
-            ]
+            annotations = {
+                name: annotation
+                for name, annotation in get_type_hints(cls).items()
+                if not name.startswith("_")
+            }
+        field_names = [name for name in annotations if name not in exclude_fields]
+        # Solo los valores de estos campos se interpretan como fechas
+        datetime_fields = frozenset(
+            name for name in field_names if _is_datetime(annotations[name])
+        )
 
         enum_fields = {name.upper(): name for name in field_names}
         FilterFieldEnum = Enum(f"{cls.__name__}FilterField", enum_fields, type=str)
@@ -79,6 +107,9 @@ class FilterableMixin:
                 - "age:ge:18,age:le:65" -> age >= 18 AND age <= 65
                 - "name:in:Spider;Iron;Thor" -> name IN ('Spider', 'Iron', 'Thor')
                 - "age:is_null:" -> age IS NULL
+                - "age:between:18;65" -> age BETWEEN 18 AND 65
+                - "updated_at:ge:now-1h" -> modificados en la última hora
+                - "created_at:between:2025-01-01;2025-01-31T23:59:59Z"
 
                 Operadores disponibles:
                 - eq: igual (=)
@@ -90,14 +121,22 @@ class FilterableMixin:
                 - like: contiene (LIKE '%valor%')
                 - in: en lista (separador: ;)
                 - not_in: no en lista (separador: ;)
+                - between: entre dos valores, ambos incluidos (separador: ;)
                 - is_null: es nulo (IS NULL)
                 - is_not_null: no es nulo (IS NOT NULL)
+
+                En los campos de fecha (p. ej. created_at) los valores son fechas
+                ISO 8601 (sin zona se toma UTC) o relativas a ahora con
+                now, now-30m, now-1h, now-7d (unidades s, m, h, d, w); en el
+                resto nunca se interpretan como fechas.
                 """
                 if not filter_str:
                     return cls(filters=[])
 
                 try:
-                    filters = FilterParser.parse(filter_str, FilterFieldEnumType)
+                    filters = FilterParser.parse(
+                        filter_str, FilterFieldEnumType, datetime_fields
+                    )
                     return cls(filters=filters)
                 except Exception as e:
                     logger.error(
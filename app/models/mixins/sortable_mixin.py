@@ -7,10 +7,27 @@ from app.utils.sorting.sort_validator import SortValidator
 from app.exceptions.sorting import InvalidSortFormatException
 from loguru import logger
 
+_sort_classes_cache: dict[
+    tuple[type, frozenset[str]], tuple[Type[Enum], Type[BaseModel]]
+] = {}
+
 
 class SortableMixin:
     """Mixin que genera automáticamente clases de ordenamiento para cualquier modelo"""
 
+    @classmethod
+    def sort_classes(
+        cls, exclude_fields: set[str] | None = None
+    ) -> tuple[Type[Enum], Type[BaseModel]]:
+        """
+        Igual que create_sort_classes, pero construye las clases una sola vez
+        por modelo y conjunto de campos excluidos y reutiliza el resultado.
+        """
+        key = (cls, frozenset(exclude_fields or ()))
+        if key not in _sort_classes_cache:
+            _sort_classes_cache[key] = cls.create_sort_classes(exclude_fields)
+        return _sort_classes_cache[key]
+
     @classmethod
     def create_sort_classes(
         cls, exclude_fields: set[str] | None = None
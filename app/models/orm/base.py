@@ -1,32 +1,37 @@
+from sqlalchemy import CheckConstraint
+from sqlalchemy.orm import declared_attr
 from sqlmodel import SQLModel, Field
-from datetime import datetime, timezone
-from uuid import UUID, uuid4
+from datetime import datetime
+from typing import ClassVar
+from uuid import UUID
+from app.db.partitioning import id_time_check_name, id_time_check_sql
+from app.db.sql_functions import utcnow
+from app.utils.uuid7 import uuid7
 
 
 class BaseSQLModel(SQLModel):
-    """Clase base para los modelos de SQLModel con campos comunes."""
+    """
+    Clase base para los modelos de SQLModel con campos comunes.
 
-    id: UUID = Field(
-        default_factory=uuid4, primary_key=True, nullable=False, index=True
-    )
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    created_at y updated_at los mantiene la base de datos (server_default y
+    onupdate), sin coste por asignación de atributos en Python. Tras un INSERT
+    se leen con RETURNING; tras un UPDATE updated_at queda expirado y se
+    recarga al acceder a él.
+    """
+
+    # UUIDv7: ordenado en el tiempo para insertar al final del índice de la PK
+    id: UUID = Field(default_factory=uuid7, primary_key=True, nullable=False)
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": utcnow()},
     )
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow()},
     )
 
-    def __setattr__(self, name: str, value):
-        if (
-            name != "updated_at"
-            and name != "created_at"
-            and hasattr(self, "_sa_instance_state")
-            and self._sa_instance_state is not None
-        ):
-            super().__setattr__("updated_at", datetime.now(timezone.utc))
-
-        super().__setattr__(name, value)
-
     def model_dump(self, **kwargs):
         """Convierte los campos datetime a cadenas ISO 8601."""
         data = super().model_dump(**kwargs)
@@ -36,3 +41,41 @@ class BaseSQLModel(SQLModel):
                 data[field] = data[field].isoformat()
 
         return data
+
+
+class PartitionedSQLModel(BaseSQLModel):
+    """
+    Base para tablas particionadas por rango mensual de created_at (PostgreSQL).
+
+    PostgreSQL exige que la clave primaria de una tabla particionada incluya
+    la columna de partición, así que en la tabla es (id, created_at); el ORM
+    sigue identificando las filas solo por id (session.get, identity map).
+    Un CHECK ata created_at a la marca de tiempo del id UUIDv7 (con margen
+    PARTITION_ID_SKEW_HOURS) para que las búsquedas por id puedan podar
+    particiones sin perder filas. En otros motores la opción de partición y
+    el CHECK se ignoran.
+
+    Las particiones se crean por adelantado con app.db.partitioning (al
+    arrancar y desde las migraciones): un INSERT sin partición para su mes
+    falla.
+    """
+
+    __partition_column__: ClassVar[str] = "created_at"
+    __mapper_args__ = {"primary_key": ["id"]}
+
+    @declared_attr
+    def __table_args__(cls):
+        return (
+            CheckConstraint(
+                id_time_check_sql(cls.__partition_column__),
+                name=id_time_check_name(cls.__tablename__),
+            ).ddl_if(dialect="postgresql"),
+            {"postgresql_partition_by": f"RANGE ({cls.__partition_column__})"},
+        )
+
+    created_at: datetime | None = Field(
+        default=None,
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": utcnow()},
+    )
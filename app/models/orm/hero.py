@@ -1,22 +1,40 @@
+from sqlalchemy import Index
 from sqlmodel import Field
 from app.models.orm.base import BaseSQLModel
 from app.models.mixins.sortable_mixin import SortableMixin
 from app.models.mixins.filterable_mixin import FilterableMixin
-from pydantic import BaseModel
+from app.utils.lazy import lazy_module_attributes
+from pydantic import BaseModel, Field as PydanticField
+from uuid import UUID
 
 
 class Hero(BaseSQLModel, SortableMixin, FilterableMixin, table=True):
+    # created_at crece con el orden de inserción: en PostgreSQL basta un índice
+    # BRIN (unos pocos KB) para los filtros por rango de fechas. updated_at no
+    # sigue el orden físico de las filas y necesita un B-tree. En otros motores
+    # postgresql_using se ignora y ambos son B-tree.
+    __table_args__ = (
+        Index("ix_hero_created_at", "created_at", postgresql_using="brin"),
+        Index("ix_hero_updated_at", "updated_at"),
+    )
+
     name: str = Field(index=True)
     age: int | None = Field(default=None, index=True)
     secret_name: str
 
 
-HeroFilterField, HeroFilter = Hero.create_filter_classes(
-    exclude_fields={"created_at", "updated_at"}
+# HeroFilterField, HeroFilter, HeroSortField y HeroSort se generan en el primer
+# acceso para no pagar su construcción al importar solo el modelo (p. ej. en
+# alembic); app.main las construye igualmente al importar repositorio y rutas
+__getattr__ = lazy_module_attributes(
+    __name__,
+    globals(),
+    HeroFilterField=lambda: Hero.filter_classes()[0],
+    HeroFilter=lambda: Hero.filter_classes()[1],
+    HeroSortField=lambda: Hero.sort_classes()[0],
+    HeroSort=lambda: Hero.sort_classes()[1],
 )
 
-HeroSortField, HeroSort = Hero.create_sort_classes()
-
 
 class HeroCreate(BaseModel):
     name: str
@@ -34,3 +52,7 @@ class HeroPatch(BaseModel):
     name: str | None = None
     age: int | None = None
     secret_name: str | None = None
+
+
+class HeroBatchGet(BaseModel):
+    ids: list[UUID] = PydanticField(min_length=1, max_length=1000)
@@ -10,8 +10,9 @@ class Status(BaseModel):
 class Pagination(BaseModel):
     page: int
     size: int
-    total: int
-    pages: int
+    # None cuando se pagina sin COUNT (include_total=false)
+    total: Optional[int] = None
+    pages: Optional[int] = None
     has_next: bool
     has_prev: bool
 
@@ -3,16 +3,44 @@ from sqlmodel import Session, select, func
 from typing import TypeVar, Generic, Type
 from app.abstractions.filters.filter_strategy import IFilterStrategy
 from app.abstractions.filters.sort_strategy import ISortStrategy
+from app.repositories.strategies.generic_filter_strategy import GenericFilterStrategy
+from app.repositories.strategies.generic_sort_strategy import GenericSortStrategy
+from app.db.entity_loader import EntityLoader, get_entity_loader
+from app.db.parallel_queries import can_run_concurrently, scalar_in_new_session
+from app.db.copy import copy_rows
+from app.db.in_list import in_list
+from app.db.partitioning import partition_bounds_for_ids
+from app.db.query_guard import query_guard
+from app.db.write_coalescer import get_write_coalescer
+from app.core.change_stream import broadcaster, publish_change, stage_change
 from loguru import logger
+from sqlalchemy import Row, insert, inspect
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.util import identity_key
 from uuid import UUID
 
 T = TypeVar("T")
 FilterType = TypeVar("FilterType")
 SortType = TypeVar("SortType")
 
+_repository_classes_cache: dict[
+    tuple[type, type, str | None], type["BaseRepository"]
+] = {}
+
 
 class BaseRepository(Generic[T, FilterType, SortType], ABC):
+    # Máximo de ids por consulta (acota además el rango de created_at por bloque)
+    IN_CHUNK_SIZE = 500
+
+    # Repositorios concretos definidos (usado para precalentar sentencias)
+    registry: list[type["BaseRepository"]] = []
+
+    def __init_subclass__(cls, register: bool = True, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Las bases genéricas (register=False) no se pueden crear solo con la sesión
+        if register:
+            BaseRepository.registry.append(cls)
+
     def __init__(
         self,
         session: Session,
@@ -25,20 +53,196 @@ class BaseRepository(Generic[T, FilterType, SortType], ABC):
         self.filter_strategy = filter_strategy
         self.sort_strategy = sort_strategy
 
+    @classmethod
+    def for_model(
+        cls, model_class: Type[T], default_sort: str | None = None
+    ) -> type["BaseRepository"]:
+        """
+        Crea el repositorio genérico de `model_class`.
+
+        Las estrategias de filtrado y ordenamiento se construyen aquí, una vez
+        por modelo; cada instancia solo enlaza la sesión de la petición. La
+        clase se cachea por base, modelo y orden por defecto, así que llamarlo
+        varias veces no multiplica las clases ni las entradas del registro.
+        """
+        key = (cls, model_class, default_sort)
+        if key not in _repository_classes_cache:
+            _repository_classes_cache[key] = cls._create_for_model(
+                model_class, default_sort
+            )
+        return _repository_classes_cache[key]
+
+    @classmethod
+    def _create_for_model(
+        cls, model_class: Type[T], default_sort: str | None
+    ) -> type["BaseRepository"]:
+        filter_strategy = GenericFilterStrategy(model_class)
+        sort_strategy = GenericSortStrategy(
+            model_class=model_class, default_sort=default_sort
+        )
+
+        def __init__(self, session: Session):
+            BaseRepository.__init__(
+                self, session, model_class, filter_strategy, sort_strategy
+            )
+
+        return type(f"{model_class.__name__}Repository", (cls,), {"__init__": __init__})
+
     def create(self, entity: T) -> T:
         try:
-            self.session.add(entity)
-            self.session.commit()
-            self.session.refresh(entity)
+            # Una entidad ya persistida no se vuelve a insertar: no es un alta
+            state = inspect(entity)
+            is_new = state.transient or state.pending
+            coalescer = get_write_coalescer(self.session) if is_new else None
+            event = None
+            if coalescer:
+                # Se inserta junto a las altas concurrentes en un único commit
+                # (el agrupador publica el evento del alta)
+                entity = coalescer.create(self._write_bind(), entity)
+            else:
+                self.session.add(entity)
+                if is_new:
+                    event = self._stage_change("created", entity)
+                self.session.commit()
+                self.session.refresh(entity)
+            loader = get_entity_loader(self.session)
+            if loader:
+                loader.prime(self.model_class, entity.id, entity)
+            publish_change(event)
             return entity
         except SQLAlchemyError as e:
             self.session.rollback()
             logger.error(f"Error creating {self.model_class.__name__}: {str(e)}")
             raise
 
+    def _stage_change(self, type: str, entity):
+        """Evento del cambio, con el NOTIFY en la transacción de la escritura"""
+        if not broadcaster.active:
+            return None
+        connection = self.session.connection(
+            bind_arguments={"bind": self._write_bind()}
+        )
+        return stage_change(type, self.model_class, entity, connection)
+
+    def _write_bind(self):
+        """Motor de las escrituras (el escritor si la sesión separa lecturas)"""
+        return self.session.get_bind(clause=insert(self.model_class.__table__))
+
+    def bulk_insert(self, rows: list[dict]) -> int:
+        """
+        Inserta muchas filas sin crear entidades ORM (COPY binario con psycopg3).
+
+        Las filas son diccionarios con las mismas claves; las columnas que
+        falten toman su valor por defecto de Python (p. ej. el id) o del
+        servidor (p. ej. created_at).
+        """
+        try:
+            connection = self.session.connection(
+                bind_arguments={"bind": self._write_bind()}
+            )
+            inserted = copy_rows(connection, self.model_class.__table__, rows)
+            self.session.commit()
+            return inserted
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Error bulk inserting {self.model_class.__name__}: {str(e)}")
+            raise
+
     def get_by_id(self, entity_id: UUID) -> T | None:
+        loader = get_entity_loader(self.session)
+        if loader:
+            # Sin el cargador, session.get consultaría si no está en la sesión
+            if self._needs_query(loader, entity_id):
+                loader.record_baseline()
+            return loader.load(self.model_class, entity_id, self._fetch_many)
         return self.session.get(self.model_class, entity_id)
 
+    def get_many(self, entity_ids: list[UUID]) -> dict[UUID, T]:
+        """
+        Obtiene varias entidades por id con una única consulta IN por bloque.
+
+        Las entidades ya cargadas y vigentes en la sesión (identity map) se
+        reutilizan sin volver a consultarlas, y los ids encolados con
+        prefetch se resuelven en la misma consulta.
+
+        Returns:
+            Diccionario id -> entidad con las entidades encontradas
+        """
+        loader = get_entity_loader(self.session)
+        if loader:
+            unloaded = sum(
+                1
+                for entity_id in dict.fromkeys(entity_ids)
+                if self._needs_query(loader, entity_id)
+            )
+            loader.record_baseline(-(-unloaded // self.IN_CHUNK_SIZE))
+            return loader.load_many(self.model_class, entity_ids, self._fetch_many)
+        return self._fetch_many(entity_ids)
+
+    def prefetch(self, entity_ids: list[UUID]) -> None:
+        """
+        Encola ids en el cargador de la petición para que las siguientes
+        llamadas a get_by_id se resuelvan con una sola consulta.
+
+        Los servicios lo llaman antes de resolver varias referencias por id
+        una a una (p. ej. HeroService.get_heroes_by_ids). Sin cargador las
+        carga ya en la sesión, de donde las toma session.get.
+        """
+        loader = get_entity_loader(self.session)
+        if loader:
+            loader.schedule(
+                self.model_class,
+                [
+                    entity_id
+                    for entity_id in entity_ids
+                    if self._loaded(entity_id) is None
+                ],
+            )
+        else:
+            self._fetch_many(entity_ids)
+
+    def _loaded(self, entity_id: UUID) -> T | None:
+        """Entidad ya cargada y vigente en la sesión (identity map), si la hay"""
+        cached = self.session.identity_map.get(
+            identity_key(self.model_class, entity_id)
+        )
+        if cached is not None and not inspect(cached).expired:
+            return cached
+        return None
+
+    def _needs_query(self, loader: EntityLoader, entity_id: UUID) -> bool:
+        """Si sin el cargador habría que consultar la entidad"""
+        prefetched = loader.take_prefetched(self.model_class, entity_id)
+        return prefetched or self._loaded(entity_id) is None
+
+    def _fetch_many(self, entity_ids: list[UUID]) -> dict[UUID, T]:
+        found: dict[UUID, T] = {}
+        pending: list[UUID] = []
+        for entity_id in dict.fromkeys(entity_ids):
+            cached = self._loaded(entity_id)
+            if cached is not None:
+                found[entity_id] = cached
+            else:
+                pending.append(entity_id)
+
+        loader = get_entity_loader(self.session)
+        try:
+            for start in range(0, len(pending), self.IN_CHUNK_SIZE):
+                chunk = pending[start : start + self.IN_CHUNK_SIZE]
+                query = select(self.model_class).where(
+                    in_list(self.model_class.id, chunk),
+                    *partition_bounds_for_ids(self.model_class, chunk),
+                )
+                for entity in self.session.exec(query).all():
+                    found[entity.id] = entity
+                if loader:
+                    loader.record_queries()
+        except SQLAlchemyError as e:
+            logger.error(f"Error querying {self.model_class.__name__}: {str(e)}")
+            raise
+
+        return found
+
     def get_all(
         self, offset: int = 0, limit: int = 100, sort: SortType | None = None
     ) -> list[T]:
@@ -53,11 +257,13 @@ class BaseRepository(Generic[T, FilterType, SortType], ABC):
         limit: int = 100,
         sort: SortType | None = None,
     ) -> list[T]:
+        query = self._build_filtered_query(select(self.model_class), filter, sort)
+        query = query.offset(offset).limit(limit)
+        query_guard.check_page(
+            self.session, self.model_class, filter, sort, offset, query
+        )
         try:
-            query = select(self.model_class)
-            query = self.filter_strategy.apply(query, filter)
-            query = self.sort_strategy.apply(query, sort)
-            return self.session.exec(query.offset(offset).limit(limit)).all()
+            return self.session.exec(query).all()
         except SQLAlchemyError as e:
             logger.error(f"Error querying {self.model_class.__name__}: {str(e)}")
             raise
@@ -65,16 +271,114 @@ class BaseRepository(Generic[T, FilterType, SortType], ABC):
             logger.error(f"Unexpected error in get_filtered: {str(e)}")
             raise
 
+    def get_filtered_rows(
+        self,
+        filter: FilterType,
+        offset: int = 0,
+        limit: int = 100,
+        sort: SortType | None = None,
+    ) -> list[Row]:
+        """
+        Variante de solo lectura de get_filtered.
+
+        Ejecuta la misma consulta filtrada y ordenada seleccionando columnas de
+        Core, por lo que devuelve filas ligeras (named tuples) sin hidratar
+        entidades ORM ni registrarlas en la sesión.
+        """
+        query = self._build_filtered_query(
+            select(*self.model_class.__table__.columns), filter, sort
+        )
+        query = query.offset(offset).limit(limit)
+        query_guard.check_page(
+            self.session, self.model_class, filter, sort, offset, query
+        )
+        try:
+            return self.session.exec(query).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error querying {self.model_class.__name__}: {str(e)}")
+            raise
+
+    def get_filtered_rows_page(
+        self,
+        filter: FilterType,
+        offset: int = 0,
+        limit: int = 100,
+        sort: SortType | None = None,
+    ) -> tuple[list[Row], bool]:
+        """
+        Página de filas sin COUNT: pide limit + 1 filas y la sobrante indica
+        si existe una página siguiente.
+        """
+        rows = self.get_filtered_rows(filter, offset, limit + 1, sort)
+        return rows[:limit], len(rows) > limit
+
+    def get_filtered_rows_with_count(
+        self,
+        filter: FilterType,
+        offset: int = 0,
+        limit: int = 100,
+        sort: SortType | None = None,
+    ) -> tuple[list[Row], int]:
+        """
+        Página de filas y total filtrado.
+
+        Si el pool tiene conexiones libres, el COUNT se lanza a la vez en otra
+        conexión y la latencia es la de la consulta más lenta en lugar de la
+        suma. Cada consulta ve su propia instantánea de la base de datos.
+        """
+        estimated = self._estimated_count(filter)
+        if estimated is not None:
+            return self.get_filtered_rows(filter, offset, limit, sort), estimated
+
+        engine = self.session.get_bind()
+        if not can_run_concurrently(engine):
+            rows = self.get_filtered_rows(filter, offset, limit, sort)
+            return rows, self.session.exec(self._build_count_query(filter)).one()
+
+        count = scalar_in_new_session(engine, self._build_count_query(filter))
+        rows = self.get_filtered_rows(filter, offset, limit, sort)
+        return rows, count.result()
+
+    def _build_filtered_query(
+        self, query: select, filter: FilterType | None, sort: SortType | None
+    ) -> select:
+        query = self.filter_strategy.apply(query, filter)
+        return self.sort_strategy.apply(query, sort)
+
     def count(self, filter: FilterType | None = None) -> int:
-        """Cuenta el total de elementos después del filtrado"""
+        """
+        Cuenta el total de elementos después del filtrado.
+
+        Si contar cuesta más que QUERY_MAX_COST, devuelve la estimación del
+        planificador en lugar del total exacto.
+        """
+        estimated = self._estimated_count(filter)
+        if estimated is not None:
+            return estimated
+        return self.session.exec(self._build_count_query(filter)).one()
+
+    def _estimated_count(self, filter: FilterType | None) -> int | None:
+        query = self.filter_strategy.apply(select(self.model_class.id), filter)
+        return query_guard.estimated_count(
+            self.session, self.model_class, filter, query
+        )
+
+    def _build_count_query(self, filter: FilterType | None) -> select:
         query = select(func.count(self.model_class.id))
         if filter:
             query = self.filter_strategy.apply(query, filter)
-        return self.session.exec(query).one()
+        return query
 
     def delete(self, entity: T):
+        # Tras el commit la entidad borrada ya no se puede leer
+        snapshot = entity.model_dump(mode="json") if broadcaster.active else None
         self.session.delete(entity)
+        event = self._stage_change("deleted", snapshot) if snapshot else None
         self.session.commit()
+        loader = get_entity_loader(self.session)
+        if loader:
+            loader.forget(self.model_class, entity.id)
+        publish_change(event)
 
     def update_put(self, entity_id: UUID, updated_entity: T) -> T | None:
         try:
@@ -85,8 +389,10 @@ class BaseRepository(Generic[T, FilterType, SortType], ABC):
                 if key not in ["id", "created_at", "updated_at"]:
                     setattr(existing_entity, key, value)
             self.session.add(existing_entity)
+            event = self._stage_change("updated", existing_entity)
             self.session.commit()
             self.session.refresh(existing_entity)
+            publish_change(event)
             return existing_entity
         except SQLAlchemyError as e:
             self.session.rollback()
@@ -101,6 +407,8 @@ class BaseRepository(Generic[T, FilterType, SortType], ABC):
         for key, value in partial_update.items():
             setattr(existing_entity, key, value)
         self.session.add(existing_entity)
+        event = self._stage_change("updated", existing_entity)
         self.session.commit()
         self.session.refresh(existing_entity)
+        publish_change(event)
         return existing_entity
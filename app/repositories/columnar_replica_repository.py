@@ -0,0 +1,118 @@
+from typing import TypeVar
+from uuid import UUID
+
+from app.db.columnar_replica import ColumnarReplica, get_replica, sort_keys
+from app.db.query_guard import query_guard
+from app.repositories.base_repository import BaseRepository
+
+T = TypeVar("T")
+FilterType = TypeVar("FilterType")
+SortType = TypeVar("SortType")
+
+
+class ColumnarReplicaRepository(
+    BaseRepository[T, FilterType, SortType], register=False
+):
+    """
+    Repositorio que responde los listados desde una réplica columnar en
+    memoria (NumPy) en lugar de consultar la base de datos.
+
+    Filtros, orden, paginación, total y límites de query_guard tienen la
+    misma semántica que en BaseRepository, salvo el orden de las columnas de
+    texto: NumPy compara por punto de código (como la colación BINARY de
+    SQLite o "C" de PostgreSQL), no con la colación de la base de datos
+    (p. ej. en_US.UTF-8 ordena "adam" antes que "Zed"). Las escrituras y las
+    lecturas por id van a la base de datos y, tras confirmar, invalidan la
+    réplica. Requiere el paquete `numpy`.
+
+    Ejemplo:
+        HeroReplicaRepository = ColumnarReplicaRepository.for_model(
+            Hero, default_sort="name"
+        )
+    """
+
+    @property
+    def replica(self) -> ColumnarReplica:
+        return get_replica(self.model_class)
+
+    def _sort_keys(self, sort: SortType | None) -> list[tuple[str, bool]]:
+        return sort_keys(sort, getattr(self.sort_strategy, "default_sort", None))
+
+    def _page(
+        self, filter: FilterType | None, offset: int, limit: int, sort: SortType | None
+    ) -> tuple[list, int]:
+        # Sin coste de base de datos que estimar: solo los límites estáticos
+        query_guard.check_page_limits(filter, sort, offset)
+        snapshot = self.replica.snapshot(self.session)
+        return snapshot.page(filter, self._sort_keys(sort), offset, limit)
+
+    def get_all(
+        self, offset: int = 0, limit: int = 100, sort: SortType | None = None
+    ) -> list[T]:
+        return self.get_filtered(None, offset, limit, sort)
+
+    def get_filtered(
+        self,
+        filter: FilterType,
+        offset: int = 0,
+        limit: int = 100,
+        sort: SortType | None = None,
+    ) -> list[T]:
+        """Página de entidades: ids desde la réplica y entidades con get_many"""
+        rows, _ = self._page(filter, offset, limit, sort)
+        ids: list[UUID] = [row.id for row in rows]
+        entities = self.get_many(ids)
+        return [entities[entity_id] for entity_id in ids if entity_id in entities]
+
+    def get_filtered_rows(
+        self,
+        filter: FilterType,
+        offset: int = 0,
+        limit: int = 100,
+        sort: SortType | None = None,
+    ) -> list:
+        rows, _ = self._page(filter, offset, limit, sort)
+        return rows
+
+    def get_filtered_rows_with_count(
+        self,
+        filter: FilterType,
+        offset: int = 0,
+        limit: int = 100,
+        sort: SortType | None = None,
+    ) -> tuple[list, int]:
+        return self._page(filter, offset, limit, sort)
+
+    def count(self, filter: FilterType | None = None) -> int:
+        query_guard.check_filter(filter)
+        return self.replica.snapshot(self.session).count(filter)
+
+    def create(self, entity: T) -> T:
+        try:
+            return super().create(entity)
+        finally:
+            self.replica.invalidate()
+
+    def bulk_insert(self, rows: list[dict]) -> int:
+        try:
+            return super().bulk_insert(rows)
+        finally:
+            self.replica.invalidate()
+
+    def delete(self, entity: T):
+        try:
+            return super().delete(entity)
+        finally:
+            self.replica.invalidate()
+
+    def update_put(self, entity_id: UUID, updated_entity: T) -> T | None:
+        try:
+            return super().update_put(entity_id, updated_entity)
+        finally:
+            self.replica.invalidate()
+
+    def update_patch(self, entity_id: UUID, partial_update: dict) -> T | None:
+        try:
+            return super().update_patch(entity_id, partial_update)
+        finally:
+            self.replica.invalidate()
@@ -1,6 +1,8 @@
 from sqlmodel import select
 from app.abstractions.filters.filter_strategy import IFilterStrategy
 from app.enums.filter import FilterOperator
+from app.db.in_list import in_list
+from app.db.partitioning import partition_bounds
 from typing import TypeVar, Callable
 from pydantic import BaseModel
 from loguru import logger
@@ -13,21 +15,25 @@ FilterType = TypeVar("FilterType", bound=BaseModel)
 class GenericFilterStrategy(IFilterStrategy[T, FilterType]):
     """Estrategia de filtrado genérica que funciona con cualquier modelo"""
 
+    # No depende del modelo: se construye una sola vez para todas las instancias
+    operator_map: dict[FilterOperator, Callable] = {
+        FilterOperator.EQ: lambda field, value: field == value,
+        FilterOperator.NE: lambda field, value: field != value,
+        FilterOperator.GT: lambda field, value: field > value,
+        FilterOperator.GE: lambda field, value: field >= value,
+        FilterOperator.LT: lambda field, value: field < value,
+        FilterOperator.LE: lambda field, value: field <= value,
+        FilterOperator.LIKE: lambda field, value: field.ilike(f"%{value}%"),
+        # La lista va en un solo parámetro: mismo SQL para 10 o 50.000 valores
+        FilterOperator.IN: lambda field, value: in_list(field, value),
+        FilterOperator.NOT_IN: lambda field, value: ~in_list(field, value),
+        FilterOperator.BETWEEN: lambda field, value: field.between(*value),
+        FilterOperator.IS_NULL: lambda field, value: field.is_(None),
+        FilterOperator.IS_NOT_NULL: lambda field, value: field.isnot(None),
+    }
+
     def __init__(self, model_class: type[T]):
         self.model_class = model_class
-        self.operator_map: dict[FilterOperator, Callable] = {
-            FilterOperator.EQ: lambda field, value: field == value,
-            FilterOperator.NE: lambda field, value: field != value,
-            FilterOperator.GT: lambda field, value: field > value,
-            FilterOperator.GE: lambda field, value: field >= value,
-            FilterOperator.LT: lambda field, value: field < value,
-            FilterOperator.LE: lambda field, value: field <= value,
-            FilterOperator.LIKE: lambda field, value: field.ilike(f"%{value}%"),
-            FilterOperator.IN: lambda field, value: field.in_(value),
-            FilterOperator.NOT_IN: lambda field, value: ~field.in_(value),
-            FilterOperator.IS_NULL: lambda field, value: field.is_(None),
-            FilterOperator.IS_NOT_NULL: lambda field, value: field.isnot(None),
-        }
 
     def apply(self, query: select, filter_model: FilterType | None = None) -> select:
         if not filter_model and not (
@@ -64,4 +70,8 @@ class GenericFilterStrategy(IFilterStrategy[T, FilterType]):
                 )
                 continue
 
+        # En tablas particionadas, los filtros por id acotan created_at
+        for condition in partition_bounds(self.model_class, filters):
+            query = query.where(condition)
+
         return query
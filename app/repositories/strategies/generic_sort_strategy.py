@@ -12,6 +12,12 @@ SortType = TypeVar("SortType", bound=BaseModel)
 class GenericSortStrategy(ISortStrategy[T, SortType]):
     """Estrategia de ordenamiento genérica que funciona con cualquier modelo"""
 
+    # No depende del modelo: se construye una sola vez para todas las instancias
+    direction_map: dict[SortDirection, Callable] = {
+        SortDirection.ASC: lambda field: field.asc(),
+        SortDirection.DESC: lambda field: field.desc(),
+    }
+
     def __init__(self, model_class: type[T], default_sort: str | None = None):
         """
         Inicializa la estrategia de ordenamiento.
@@ -22,10 +28,6 @@ class GenericSortStrategy(ISortStrategy[T, SortType]):
         """
         self.model_class = model_class
         self.default_sort = default_sort
-        self.direction_map: dict[SortDirection, Callable] = {
-            SortDirection.ASC: lambda field: field.asc(),
-            SortDirection.DESC: lambda field: field.desc(),
-        }
 
     def apply(self, query: select, sort_model: SortType | None = None) -> select:
         """Aplica ordenamiento al query"""
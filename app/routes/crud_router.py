@@ -0,0 +1,138 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from app.core.rate_limit import list_query_cost, rate_limit
+from app.db.database import db
+from app.db.statement_timeout import statement_timeout
+from app.repositories.base_repository import BaseRepository
+from app.services.crud_service import CRUDService
+from app.utils.response import ResponseBuilder
+
+# Igual que en las rutas de héroes: las lecturas por id deben ser inmediatas
+DETAIL_TIMEOUT_MS = 1_000
+
+DEFAULT_FILTER_EXCLUDE: frozenset[str] = frozenset()
+
+
+def create_crud_router(
+    model_class: type,
+    *,
+    prefix: str,
+    create_schema: type[BaseModel],
+    put_schema: type[BaseModel],
+    patch_schema: type[BaseModel],
+    repository_class: type[BaseRepository] | None = None,
+    default_sort: str | None = None,
+    filter_exclude: frozenset[str] = DEFAULT_FILTER_EXCLUDE,
+    tags: list[str] | None = None,
+) -> APIRouter:
+    """
+    Genera las rutas CRUD de un modelo (listado, detalle, alta, PUT, PATCH y
+    borrado), con el mismo comportamiento que las de app/routes/test.py.
+
+    Todo lo que no depende de la petición se construye aquí, una vez por
+    modelo: clases de filtro y ordenamiento, estrategias y repositorio. La
+    única dependencia por petición enlaza la sesión al repositorio.
+
+    Ejemplo:
+        mission_router = create_crud_router(
+            Mission,
+            prefix="/missions",
+            create_schema=MissionCreate,
+            put_schema=MissionPut,
+            patch_schema=MissionPatch,
+            default_sort="name",
+        )
+    """
+    name = model_class.__name__
+    _, filter_class = model_class.filter_classes(set(filter_exclude))
+    _, sort_class = model_class.sort_classes()
+    repository_class = repository_class or BaseRepository.for_model(
+        model_class, default_sort=default_sort
+    )
+
+    def get_service(session: Session = Depends(db.get_session)) -> CRUDService:
+        return CRUDService(repository_class(session))
+
+    router = APIRouter(prefix=prefix, tags=tags or [name.lower()])
+
+    @router.get("", dependencies=[rate_limit(list_query_cost)])
+    def list_entities(
+        service: CRUDService = Depends(get_service),
+        page: int = Query(1, ge=1),
+        size: int = Query(10, ge=1, le=100),
+        filter: str = Query(
+            None, description="Filtros: 'campo:operador:valor,campo2:operador:valor'"
+        ),
+        sort: str = Query(
+            None, description="Ordenamiento: 'campo:direccion,campo2:direccion'"
+        ),
+        include_total: bool = Query(
+            True, description="Si es false no se ejecuta COUNT (total y pages null)"
+        ),
+    ):
+        offset, limit = ResponseBuilder.get_pagination_params(page, size)
+        filter_model = filter_class.from_string(filter)
+        sort_model = sort_class.from_string(sort)
+
+        if not include_total:
+            rows, has_next = service.get_rows_page(
+                filter_model, offset, limit, sort_model
+            )
+            return ResponseBuilder.paginated(
+                data=rows,
+                page=page,
+                size=size,
+                has_next=has_next,
+                message=f"{name} list",
+            )
+
+        rows, total = service.get_rows_with_count(
+            filter_model, offset, limit, sort_model
+        )
+        return ResponseBuilder.paginated(
+            data=rows, page=page, size=size, total=total, message=f"{name} list"
+        )
+
+    @router.get(
+        "/{entity_id}",
+        dependencies=[rate_limit(1), statement_timeout(DETAIL_TIMEOUT_MS)],
+    )
+    def read_entity(entity_id: UUID, service: CRUDService = Depends(get_service)):
+        entity = service.get_by_id(entity_id)
+        return ResponseBuilder.success(data=entity, message=f"{name} detail")
+
+    @router.post("", status_code=status.HTTP_201_CREATED, dependencies=[rate_limit(1)])
+    def create_entity(data: create_schema, service: CRUDService = Depends(get_service)):
+        entity = service.create(data)
+        return ResponseBuilder.success(
+            data=entity, message=f"{name} created", status_code=201
+        )
+
+    @router.put("/{entity_id}", dependencies=[rate_limit(1)])
+    def update_entity_put(
+        entity_id: UUID,
+        data: put_schema,
+        service: CRUDService = Depends(get_service),
+    ):
+        entity = service.update_put(entity_id, data)
+        return ResponseBuilder.success(data=entity, message=f"{name} updated (PUT)")
+
+    @router.patch("/{entity_id}", dependencies=[rate_limit(1)])
+    def update_entity_patch(
+        entity_id: UUID,
+        data: patch_schema,
+        service: CRUDService = Depends(get_service),
+    ):
+        entity = service.update_patch(entity_id, data.model_dump(exclude_unset=True))
+        return ResponseBuilder.success(data=entity, message=f"{name} updated (PATCH)")
+
+    @router.delete("/{entity_id}", dependencies=[rate_limit(1)])
+    def delete_entity(entity_id: UUID, service: CRUDService = Depends(get_service)):
+        service.delete(entity_id)
+        return ResponseBuilder.success(message=f"{name} deleted")
+
+    return router
@@ -0,0 +1,14 @@
+from app.models.orm.hero import Hero, HeroCreate, HeroPatch, HeroPut
+from app.routes.crud_router import create_crud_router
+
+# CRUD de héroes generado; la lógica de negocio propia sigue en /test/heroes.
+# for_model devuelve la misma clase que HeroRepository (caché por modelo)
+heroes_router = create_crud_router(
+    Hero,
+    prefix="/heroes",
+    create_schema=HeroCreate,
+    put_schema=HeroPut,
+    patch_schema=HeroPatch,
+    default_sort="name",
+    tags=["heroes"],
+)
@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+
+from app.core.metrics import collect_metrics
+from app.utils.response import ResponseBuilder
+
+metrics_router = APIRouter(tags=["metrics"])
+
+
+@metrics_router.get("/metrics")
+async def read_metrics():
+    # async: las métricas del pool de hilos se leen desde el bucle de eventos
+    return ResponseBuilder.success(data=collect_metrics())
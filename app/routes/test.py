@@ -1,19 +1,38 @@
-from fastapi import APIRouter, Query, Depends, status
-from app.models.orm.hero import HeroFilter, HeroSort, HeroPut, HeroPatch, HeroCreate
+from fastapi import APIRouter, Query, Depends, Request, status
+from fastapi.responses import StreamingResponse
+from app.models.orm.hero import (
+    Hero,
+    HeroFilter,
+    HeroSort,
+    HeroPut,
+    HeroPatch,
+    HeroCreate,
+    HeroBatchGet,
+)
 from app.services.hero_service import get_hero_service, HeroService
 from app.utils.response import ResponseBuilder
+from app.core.rate_limit import list_query_cost, rate_limit
+from app.db.statement_timeout import statement_timeout
+from app.core.change_stream import stream_changes
+from app.core.config import get_settings
 from uuid import UUID
 
 test_router = APIRouter(prefix="/test", tags=["test"])
 
+# Las lecturas por clave primaria deben ser inmediatas: un límite corto evita
+# que retengan una conexión del pool si algo va mal
+DETAIL_TIMEOUT_MS = 1_000
 
-@test_router.post("/heroes", status_code=status.HTTP_201_CREATED)
+
+@test_router.post(
+    "/heroes", status_code=status.HTTP_201_CREATED, dependencies=[rate_limit(1)]
+)
 def create_hero(hero: HeroCreate, service: HeroService = Depends(get_hero_service)):
     result = service.create_hero(hero)
     return ResponseBuilder.success(data=result, message="Hero created", status_code=201)
 
 
-@test_router.get("/heroes")
+@test_router.get("/heroes", dependencies=[rate_limit(list_query_cost)])
 def read_heroes(
     service: HeroService = Depends(get_hero_service),
     page: int = Query(1, ge=1),
@@ -26,35 +45,90 @@ def read_heroes(
         None,
         description="Ordenamiento: 'campo:direccion,campo2:direccion'. Ej: 'age:desc,name:asc'",
     ),
+    include_total: bool = Query(
+        True,
+        description=(
+            "Si es false no se ejecuta COUNT: total y pages son null y has_next "
+            "se calcula pidiendo una fila más"
+        ),
+    ),
 ):
     offset, limit = ResponseBuilder.get_pagination_params(page, size)
     filter_model = HeroFilter.from_string(filter)
     sort_model = HeroSort.from_string(sort)
 
-    result = service.get_heroes_filtered(
+    if not include_total:
+        result, has_next = service.get_hero_rows_page(
+            filter=filter_model, offset=offset, limit=limit, sort=sort_model
+        )
+        return ResponseBuilder.paginated(
+            data=result, page=page, size=size, has_next=has_next, message="Heroes list"
+        )
+
+    result, total = service.get_hero_rows_with_count(
         filter=filter_model, offset=offset, limit=limit, sort=sort_model
     )
-    total = service.count(filter_model)
 
     return ResponseBuilder.paginated(
         data=result, page=page, size=size, total=total, message="Heroes list"
     )
 
 
-@test_router.get("/heroes/{hero_id}")
+@test_router.post(
+    "/heroes/batch-get",
+    dependencies=[rate_limit(2), statement_timeout(DETAIL_TIMEOUT_MS)],
+)
+def read_heroes_batch(
+    batch: HeroBatchGet, service: HeroService = Depends(get_hero_service)
+):
+    heroes, missing = service.get_heroes_by_ids(batch.ids)
+    return ResponseBuilder.success(
+        data={"items": heroes, "missing": missing}, message="Heroes batch"
+    )
+
+
+@test_router.get("/heroes/stream", dependencies=[rate_limit(1)])
+async def stream_heroes(
+    request: Request,
+    filter: str = Query(
+        None,
+        description="Solo se envían los cambios de héroes que cumplen el filtro (mismo formato que el listado)",
+    ),
+):
+    # Se valida antes de abrir el stream para responder 400 si es incorrecto
+    filter_model = HeroFilter.from_string(filter)
+    config = get_settings()
+    events = stream_changes(
+        Hero,
+        filter_model,
+        keepalive=config.change_stream_keepalive,
+        max_queue=config.change_stream_queue_size,
+        is_disconnected=request.is_disconnected,
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@test_router.get(
+    "/heroes/{hero_id}",
+    dependencies=[rate_limit(1), statement_timeout(DETAIL_TIMEOUT_MS)],
+)
 def read_hero(hero_id: UUID, service: HeroService = Depends(get_hero_service)):
     result = service.get_hero_by_id(hero_id=hero_id)
     return ResponseBuilder.success(data=result, message="Hero detail")
 
 
-@test_router.delete("/heroes/{hero_id}")
+@test_router.delete("/heroes/{hero_id}", dependencies=[rate_limit(1)])
 def delete_hero(hero_id: UUID, service: HeroService = Depends(get_hero_service)):
     hero = service.get_hero_by_id(hero_id=hero_id)
     service.delete_hero(hero=hero)
     return ResponseBuilder.success(message="Hero deleted")
 
 
-@test_router.put("/heroes/{hero_id}")
+@test_router.put("/heroes/{hero_id}", dependencies=[rate_limit(1)])
 def update_hero_put(
     hero_id: UUID,
     updated_hero: HeroPut,
@@ -64,7 +138,7 @@ def update_hero_put(
     return ResponseBuilder.success(data=result, message="Hero updated (PUT)")
 
 
-@test_router.patch("/heroes/{hero_id}")
+@test_router.patch("/heroes/{hero_id}", dependencies=[rate_limit(1)])
 def update_hero_patch(
     hero_id: UUID,
     partial_update: HeroPatch,
@@ -0,0 +1,49 @@
+import importlib.util
+
+import uvicorn
+from loguru import logger
+
+from app.core.config import get_settings
+
+APP_PATH = "app.main:app"
+
+
+def main() -> None:
+    """
+    Arranca el servidor de producción con varios workers de uvicorn.
+
+    Cada worker abre su propio pool de settings.db_pool_size conexiones más
+    las auxiliares (settings.db_auxiliary_connections), de modo que el total
+    nunca supera DB_MAX_CONNECTIONS. Al recibir SIGTERM
+    uvicorn deja de aceptar conexiones, espera a las peticiones en curso
+    (hasta GRACEFUL_SHUTDOWN_TIMEOUT) y después el lifespan cierra el pool.
+    """
+    settings = get_settings()
+
+    # Precarga: los workers se lanzan con spawn y reimportan la app, pero
+    # importarla aquí hace que un error de importación falle antes de lanzarlos
+    importlib.import_module(APP_PATH.split(":")[0])
+
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info(
+        f"Starting {settings.web_concurrency} worker(s) on "
+        f"{settings.server_host}:{settings.server_port} "
+        f"(loop={loop}, http={http}, db pool={settings.db_pool_size}/worker)"
+    )
+
+    uvicorn.run(
+        APP_PATH,
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=settings.web_concurrency,
+        loop=loop,
+        http=http,
+        proxy_headers=True,
+        timeout_graceful_shutdown=settings.graceful_shutdown_timeout,
+        log_level=settings.log_level.lower(),
+    )
+
+
+if __name__ == "__main__":
+    main()
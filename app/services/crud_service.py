@@ -0,0 +1,63 @@
+from typing import Generic, TypeVar
+from pydantic import BaseModel
+from app.repositories.base_repository import BaseRepository
+from app.exceptions.entity import EntityNotFoundException
+from loguru import logger
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class CRUDService(Generic[T]):
+    """
+    Servicio genérico con las operaciones CRUD de un modelo.
+
+    Es lo que usan las rutas de create_crud_router; los modelos con lógica de
+    negocio propia (p. ej. HeroService) tienen su propio servicio.
+    """
+
+    def __init__(self, repository: BaseRepository):
+        self.repository = repository
+        self.model_class = repository.model_class
+        self.model_name = repository.model_class.__name__
+
+    def create(self, data: BaseModel) -> T:
+        entity = self.repository.create(self.model_class(**data.model_dump()))
+        logger.info(f"{self.model_name} created with ID: {entity.id}")
+        return entity
+
+    def get_by_id(self, entity_id: UUID) -> T:
+        entity = self.repository.get_by_id(entity_id)
+        if not entity:
+            raise EntityNotFoundException(self.model_name, entity_id)
+        return entity
+
+    def get_rows_with_count(
+        self, filter, offset: int = 0, limit: int = 100, sort=None
+    ) -> tuple[list, int]:
+        """Página del listado y total filtrado (consultados a la vez si se puede)."""
+        return self.repository.get_filtered_rows_with_count(filter, offset, limit, sort)
+
+    def get_rows_page(
+        self, filter, offset: int = 0, limit: int = 100, sort=None
+    ) -> tuple[list, bool]:
+        """Página del listado y si hay siguiente, sin consulta COUNT."""
+        return self.repository.get_filtered_rows_page(filter, offset, limit, sort)
+
+    def update_put(self, entity_id: UUID, data: BaseModel) -> T:
+        entity = self.repository.update_put(entity_id, data)
+        if not entity:
+            raise EntityNotFoundException(self.model_name, entity_id)
+        logger.info(f"{self.model_name} with ID {entity_id} updated (PUT)")
+        return entity
+
+    def update_patch(self, entity_id: UUID, partial_update: dict) -> T:
+        entity = self.repository.update_patch(entity_id, partial_update)
+        if not entity:
+            raise EntityNotFoundException(self.model_name, entity_id)
+        logger.info(f"{self.model_name} with ID {entity_id} updated (PATCH)")
+        return entity
+
+    def delete(self, entity_id: UUID) -> None:
+        self.repository.delete(self.get_by_id(entity_id))
+        logger.info(f"{self.model_name} with ID {entity_id} deleted")
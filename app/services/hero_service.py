@@ -44,6 +44,16 @@ class HeroService:
             raise HeroNotFoundException(hero_id)
         return hero
 
+    def get_heroes_by_ids(self, hero_ids: list[UUID]) -> tuple[list[Hero], list[UUID]]:
+        """Obtiene varios héroes en orden de petición junto a los ids no encontrados."""
+        ordered_ids = list(dict.fromkeys(hero_ids))
+        # Los get_by_id siguientes se resuelven con una sola consulta
+        self.repository.prefetch(ordered_ids)
+        found = {hero_id: self.repository.get_by_id(hero_id) for hero_id in ordered_ids}
+        heroes = [hero for hero in found.values() if hero is not None]
+        missing = [hero_id for hero_id, hero in found.items() if hero is None]
+        return heroes, missing
+
     def retire_hero(self, hero_id: UUID) -> None:
         """Ejemplo de proceso de negocio complejo"""
         hero = self.get_hero_by_id(hero_id)
@@ -71,6 +81,36 @@ class HeroService:
     ) -> list[Hero]:
         return self.repository.get_filtered(filter, offset, limit, sort)
 
+    def get_hero_rows_filtered(
+        self,
+        filter: HeroFilter,
+        offset: int = 0,
+        limit: int = 100,
+        sort: HeroSort | None = None,
+    ) -> list:
+        """Listado de solo lectura sin hidratar entidades ORM."""
+        return self.repository.get_filtered_rows(filter, offset, limit, sort)
+
+    def get_hero_rows_with_count(
+        self,
+        filter: HeroFilter,
+        offset: int = 0,
+        limit: int = 100,
+        sort: HeroSort | None = None,
+    ) -> tuple[list, int]:
+        """Página del listado y total filtrado (consultados a la vez si se puede)."""
+        return self.repository.get_filtered_rows_with_count(filter, offset, limit, sort)
+
+    def get_hero_rows_page(
+        self,
+        filter: HeroFilter,
+        offset: int = 0,
+        limit: int = 100,
+        sort: HeroSort | None = None,
+    ) -> tuple[list, bool]:
+        """Página del listado y si hay siguiente, sin consulta COUNT."""
+        return self.repository.get_filtered_rows_page(filter, offset, limit, sort)
+
     def count(self, filter: HeroFilter | None = None) -> int:
         return self.repository.count(filter=filter)
 
@@ -0,0 +1,118 @@
+from datetime import datetime, timezone
+from typing import Any, Callable, Mapping
+from app.enums.filter import FilterOperator
+from loguru import logger
+
+
+def _as_datetime(value: str) -> datetime | str:
+    """Fecha ISO serializada (p. ej. created_at) en UTC sin zona, como el filtro"""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _comparable(field_value: Any, value: Any) -> tuple[Any, Any]:
+    """
+    Iguala los tipos como lo haría la base de datos con afinidad de texto:
+    si uno de los dos es una cadena (p. ej. un UUID o una fecha serializados
+    a JSON), se comparan sus representaciones como texto. Las fechas
+    serializadas se comparan como fechas con los filtros de fecha.
+    """
+    if isinstance(value, datetime) and isinstance(field_value, str):
+        field_value = _as_datetime(field_value)
+    if isinstance(field_value, str) != isinstance(value, str):
+        return str(field_value), str(value)
+    return field_value, value
+
+
+def _compare(op: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    def compare(field_value: Any, value: Any) -> bool:
+        # En SQL cualquier comparación con NULL es desconocida: no coincide
+        if field_value is None or value is None:
+            return False
+        return op(*_comparable(field_value, value))
+
+    return compare
+
+
+def _contains(field_value: Any, value: Any) -> bool:
+    if field_value is None or value is None:
+        return False
+    return str(value).lower() in str(field_value).lower()
+
+
+def _in(field_value: Any, values: list) -> bool:
+    if field_value is None:
+        return False
+    return any(_compare(lambda a, b: a == b)(field_value, value) for value in values)
+
+
+def _not_in(field_value: Any, values: list) -> bool:
+    # NOT IN con NULL en la columna tampoco coincide en SQL
+    return field_value is not None and not _in(field_value, values)
+
+
+_ge = _compare(lambda a, b: a >= b)
+_le = _compare(lambda a, b: a <= b)
+
+
+def _between(field_value: Any, values: list) -> bool:
+    low, high = values
+    return _ge(field_value, low) and _le(field_value, high)
+
+
+class FilterMatcher:
+    """
+    Responsable SOLO de evaluar en Python un filtro sobre un diccionario.
+
+    Replica la semántica de GenericFilterStrategy (incluido el tratamiento de
+    NULL de SQL) para decidir si una entidad ya cargada cumple el filtro sin
+    consultar la base de datos.
+    """
+
+    operator_map: dict[FilterOperator, Callable[[Any, Any], bool]] = {
+        FilterOperator.EQ: _compare(lambda a, b: a == b),
+        FilterOperator.NE: _compare(lambda a, b: a != b),
+        FilterOperator.GT: _compare(lambda a, b: a > b),
+        FilterOperator.GE: _ge,
+        FilterOperator.LT: _compare(lambda a, b: a < b),
+        FilterOperator.LE: _le,
+        FilterOperator.LIKE: _contains,
+        FilterOperator.IN: _in,
+        FilterOperator.NOT_IN: _not_in,
+        FilterOperator.BETWEEN: _between,
+        FilterOperator.IS_NULL: lambda field_value, value: field_value is None,
+        FilterOperator.IS_NOT_NULL: lambda field_value, value: field_value is not None,
+    }
+
+    @classmethod
+    def matches(cls, filter_model: Any, data: Mapping[str, Any]) -> bool:
+        """
+        Indica si `data` cumple todas las condiciones del filtro (AND).
+
+        Los campos que no existen en `data` se ignoran, igual que los campos
+        inexistentes en el modelo al construir la consulta.
+        """
+        for field_enum, operator, value in getattr(filter_model, "filters", None) or []:
+            field_name = field_enum.value
+            if field_name not in data:
+                logger.warning(f"Invalid filter field ignored: {field_name}")
+                continue
+
+            match = cls.operator_map.get(operator)
+            if match is None:
+                logger.warning(f"Unsupported operator: {operator.value}")
+                continue
+
+            try:
+                if not match(data[field_name], value):
+                    return False
+            except TypeError:
+                # Tipos no comparables (p. ej. texto frente a número): no coincide
+                return False
+
+        return True
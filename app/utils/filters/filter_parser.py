@@ -11,7 +11,9 @@ class FilterParser:
 
     @staticmethod
     def parse(
-        filter_str: str | None, field_enum: Type[Enum]
+        filter_str: str | None,
+        field_enum: Type[Enum],
+        datetime_fields: frozenset[str] = frozenset(),
     ) -> list[tuple[Enum, FilterOperator, any]]:
         """
         Convierte un string a lista de filtros.
@@ -19,6 +21,7 @@ class FilterParser:
         Args:
             filter_str: String con formato "campo:operador:valor,campo2:operador2:valor2"
             field_enum: Enum con los campos permitidos
+            datetime_fields: Campos de tipo fecha, cuyos valores se convierten a datetime
 
         Returns:
             Lista de tuplas (field_enum, operator_enum, value)
@@ -28,7 +31,9 @@ class FilterParser:
 
         filters = []
         for part in filter_str.split(","):
-            parsed_filter = FilterParser._parse_single_filter(part.strip(), field_enum)
+            parsed_filter = FilterParser._parse_single_filter(
+                part.strip(), field_enum, datetime_fields
+            )
             if parsed_filter:
                 filters.append(parsed_filter)
 
@@ -36,7 +41,7 @@ class FilterParser:
 
     @staticmethod
     def _parse_single_filter(
-        part: str, field_enum: Type[Enum]
+        part: str, field_enum: Type[Enum], datetime_fields: frozenset[str] = frozenset()
     ) -> tuple[Enum, FilterOperator, any] | None:
         """
         Parsea un solo filtro del formato "campo:operador:valor"
@@ -44,6 +49,7 @@ class FilterParser:
         Args:
             part: String con un solo filtro
             field_enum: Enum con los campos permitidos
+            datetime_fields: Campos de tipo fecha
 
         Returns:
             Tupla (field, operator, value) o None si es inválido
@@ -78,5 +84,11 @@ class FilterParser:
                 f"Invalid operator '{operator_str}'. Available operators: {[e.value for e in FilterOperator]}"
             )
 
-        value = FilterValueConverter.convert(value_str, operator)
+        try:
+            value = FilterValueConverter.convert(
+                value_str, operator, field.value in datetime_fields
+            )
+        except ValueError as e:
+            logger.warning(f"Invalid filter value for {field_str}: {value_str}")
+            raise InvalidFilterFormatException(f"Invalid value for '{field_str}'. {e}")
         return (field, operator, value)
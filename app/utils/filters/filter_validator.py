@@ -1,4 +1,6 @@
+from datetime import datetime
 from enum import Enum
+from typing import Any
 from app.enums.filter import FilterOperator
 
 
@@ -65,13 +67,27 @@ class FilterValidator:
                     f"Operator {operator.value} requires a list or tuple value. Got: {type(value).__name__}"
                 )
 
+        elif operator == FilterOperator.BETWEEN:
+            if not isinstance(value, (list, tuple)) or len(value) != 2:
+                raise FilterValidationError(
+                    f"Operator {operator.value} requires two values separated by ';'. Got: {value}"
+                )
+            for bound in value:
+                FilterValidator._validate_range_value(operator, bound)
+
         elif operator in [
             FilterOperator.GT,
             FilterOperator.GE,
             FilterOperator.LT,
             FilterOperator.LE,
         ]:
-            if value is not None and not isinstance(value, (int, float)):
-                raise FilterValidationError(
-                    f"Operator {operator.value} requires numeric value. Got: {type(value).__name__}"
-                )
+            if value is not None:
+                FilterValidator._validate_range_value(operator, value)
+
+    @staticmethod
+    def _validate_range_value(operator: FilterOperator, value: Any) -> None:
+        """Valida que el valor de una comparación de rango sea un número o fecha"""
+        if not isinstance(value, (int, float, datetime)):
+            raise FilterValidationError(
+                f"Operator {operator.value} requires numeric value or ISO-8601 datetime. Got: {type(value).__name__}"
+            )
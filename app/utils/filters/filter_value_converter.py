@@ -1,32 +1,55 @@
+import re
+from datetime import datetime, timedelta, timezone
 from app.enums.filter import FilterOperator
 
+# Fecha ISO 8601 ("2025-01-31", "2025-01-31T10:00:00Z", "2025-01-31T10:00:00+02:00")
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+# Instante relativo a ahora ("now", "now-1h", "now-30m", "now-7d")
+_RELATIVE = re.compile(r"^now(?:([+-])(\d+)([smhdw]))?$", re.IGNORECASE)
+_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
 
 class FilterValueConverter:
     """Responsable SOLO de convertir valores según el tipo y operador"""
 
     @staticmethod
-    def convert(value_str: str | None, operator: FilterOperator) -> any:
+    def convert(
+        value_str: str | None, operator: FilterOperator, is_datetime: bool = False
+    ) -> any:
         """
         Convierte el valor string según el operador.
 
         Args:
             value_str: Valor como string
             operator: Operador que determina cómo convertir
+            is_datetime: Si el campo filtrado es una fecha; solo entonces se
+                interpretan fechas ISO 8601 e instantes relativos ("now-1h")
 
         Returns:
             Valor convertido al tipo apropiado
+
+        Raises:
+            ValueError: Si el campo es una fecha y el valor no lo es
         """
 
         if operator in [FilterOperator.IS_NULL, FilterOperator.IS_NOT_NULL]:
             return None
 
-        if operator in [FilterOperator.IN, FilterOperator.NOT_IN]:
-            return FilterValueConverter._convert_to_list(value_str)
+        # LIKE busca texto: el valor nunca se interpreta como fecha
+        if operator == FilterOperator.LIKE:
+            is_datetime = False
 
-        return FilterValueConverter._convert_scalar(value_str)
+        if operator in [
+            FilterOperator.IN,
+            FilterOperator.NOT_IN,
+            FilterOperator.BETWEEN,
+        ]:
+            return FilterValueConverter._convert_to_list(value_str, is_datetime)
+
+        return FilterValueConverter._convert_scalar(value_str, is_datetime)
 
     @staticmethod
-    def _convert_to_list(value_str: str | None) -> list:
+    def _convert_to_list(value_str: str | None, is_datetime: bool = False) -> list:
         """
         Convierte string a lista separada por punto y coma.
         """
@@ -34,20 +57,29 @@ class FilterValueConverter:
             return []
 
         return [
-            FilterValueConverter._convert_scalar(v.strip())
+            FilterValueConverter._convert_scalar(v.strip(), is_datetime)
             for v in value_str.split(";")
         ]
 
     @staticmethod
-    def _convert_scalar(value_str: str | None) -> any:
+    def _convert_scalar(value_str: str | None, is_datetime: bool = False) -> any:
         """
         Intenta convertir un valor string a su tipo más apropiado.
 
-        Orden de conversión: int -> float -> bool -> string
+        Orden de conversión: int -> float -> bool -> string; en campos de
+        fecha, datetime.
         """
         if not value_str:
             return value_str
 
+        if is_datetime:
+            converted = FilterValueConverter._convert_datetime(value_str)
+            if converted is None:
+                raise ValueError(
+                    f"Expected an ISO-8601 datetime or now[+-]N[smhdw]. Got: {value_str}"
+                )
+            return converted
+
         try:
             return int(value_str)
         except ValueError:
@@ -62,3 +94,31 @@ class FilterValueConverter:
             return value_str.lower() == "true"
 
         return value_str
+
+    @staticmethod
+    def _convert_datetime(value_str: str) -> datetime | None:
+        """
+        Convierte una fecha ISO 8601 o un instante relativo ("now-1h").
+
+        Devuelve UTC sin zona, como se guardan created_at y updated_at: las
+        fechas con zona se pasan a UTC y las que no la tienen se toman como
+        UTC. None si el valor no es una fecha.
+        """
+        relative = _RELATIVE.match(value_str)
+        if relative:
+            sign, amount, unit = relative.groups()
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            if not amount:
+                return now
+            delta = timedelta(**{_UNITS[unit.lower()]: int(amount)})
+            return now - delta if sign == "-" else now + delta
+
+        if not _ISO_DATE.match(value_str):
+            return None
+        try:
+            value = datetime.fromisoformat(value_str)
+        except ValueError:
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
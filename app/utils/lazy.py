@@ -0,0 +1,23 @@
+from typing import Any, Callable
+
+
+def lazy_module_attributes(
+    module_name: str, module_globals: dict[str, Any], **factories: Callable[[], Any]
+) -> Callable[[str], Any]:
+    """
+    Crea un __getattr__ de módulo (PEP 562) que construye atributos bajo demanda.
+
+    Cada factoría se ejecuta la primera vez que se accede al nombre y el
+    resultado se guarda en el módulo, así que los accesos posteriores (incluido
+    `from modulo import nombre`) no vuelven a pasar por aquí.
+    """
+
+    def __getattr__(name: str) -> Any:
+        factory = factories.get(name)
+        if factory is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = factory()
+        module_globals[name] = value
+        return value
+
+    return __getattr__
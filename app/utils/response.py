@@ -2,6 +2,7 @@ from app.models.response import SuccessResponse, Status, Pagination, ErrorRespon
 from fastapi.responses import JSONResponse
 from app.exceptions.responses import PageNotFoundException
 from datetime import datetime
+from uuid import UUID
 
 
 class ResponseBuilder:
@@ -25,17 +26,31 @@ class ResponseBuilder:
 
     @staticmethod
     def paginated(
-        data, page: int, size: int, total: int, message="OK", status_code=200
+        data,
+        page: int,
+        size: int,
+        total: int | None = None,
+        message="OK",
+        status_code=200,
+        has_next: bool | None = None,
     ):
-        pages = (total + size - 1) // size
-        if page > pages and total > 0:
-            raise PageNotFoundException(page=page)
+        if total is None:
+            # Paginación sin COUNT: has_next lo aporta quien consulta (limit + 1)
+            if page > 1 and not data:
+                raise PageNotFoundException(page=page)
+            pages = None
+            has_next = bool(has_next)
+        else:
+            pages = (total + size - 1) // size
+            if page > pages and total > 0:
+                raise PageNotFoundException(page=page)
+            has_next = page < pages
         pagination = Pagination(
             page=page,
             size=size,
             total=total,
             pages=pages,
-            has_next=page < pages,
+            has_next=has_next,
             has_prev=page > 1,
         )
         status = Status(code=status_code, message=message)
@@ -59,7 +74,7 @@ class ResponseBuilder:
 
     @staticmethod
     def _serialize_datetime(data):
-        """Convierte objetos datetime a cadenas en estructuras de datos."""
+        """Convierte objetos datetime y UUID a cadenas en estructuras de datos."""
         if isinstance(data, dict):
             return {
                 key: ResponseBuilder._serialize_datetime(value)
@@ -69,6 +84,10 @@ class ResponseBuilder:
             return [ResponseBuilder._serialize_datetime(item) for item in data]
         elif isinstance(data, datetime):
             return data.isoformat()
+        elif isinstance(data, UUID):
+            return str(data)
+        elif hasattr(data, "_asdict"):
+            return ResponseBuilder._serialize_datetime(data._asdict())
         elif hasattr(data, "model_dump"):
             return data.model_dump(mode="json")
         return data
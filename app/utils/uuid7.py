@@ -0,0 +1,58 @@
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    """
+    Genera un UUID versión 7 (RFC 9562) ordenado en el tiempo.
+
+    Los 48 bits altos son el timestamp Unix en milisegundos, por lo que los
+    ids consecutivos se insertan al final del índice de la clave primaria.
+    Dentro del mismo milisegundo, rand_a actúa como contador (método 1 del
+    RFC) para mantener el orden monotónico en este proceso.
+    """
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # Arranca en la mitad baja para dejar margen al contador
+            _counter = int.from_bytes(os.urandom(2)) & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return UUID(int=value)
+
+
+def uuid7_datetime(value: UUID) -> datetime | None:
+    """
+    Instante UTC (sin zona, como created_at) codificado en un UUIDv7.
+
+    Devuelve None si el UUID no es de la versión 7.
+    """
+    if value.version != 7:
+        return None
+    timestamp_ms = value.int >> 80
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).replace(
+        tzinfo=None
+    )
@@ -0,0 +1,111 @@
+"""
+Prueba de carga del control de admisión con 3x de sobrecarga.
+
+Una app sintética simula una base de datos con CAPACITY conexiones y
+SERVICE_TIME segundos por consulta. Se le envían peticiones en bucle abierto
+al triple de su capacidad y se compara la latencia sin control de admisión,
+con límite fijo y en modo adaptativo (AIMD). Sin control, la cola crece sin
+límite y el p99 con ella; con control, el p99 de las respuestas servidas
+queda acotado y el exceso recibe 503 rápidos.
+
+Uso: uv run python -m benchmarks.admission [segundos] [sobrecarga]
+"""
+
+import statistics
+import sys
+import time
+
+import anyio
+import httpx
+from fastapi import FastAPI
+
+from app.middleware.admission import AdmissionControlMiddleware
+from benchmarks.common import print_table
+
+CAPACITY = 10
+SERVICE_TIME = 0.02
+QUEUE_TIMEOUT = 0.1
+
+
+def make_app(mode: str) -> FastAPI:
+    app = FastAPI()
+    database = anyio.Semaphore(CAPACITY)
+
+    @app.get("/test/heroes")
+    async def read_heroes():
+        async with database:
+            await anyio.sleep(SERVICE_TIME)
+        return "OK"
+
+    if mode != "off":
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            limits={"/test": CAPACITY},
+            queue_size=CAPACITY * 4,
+            queue_timeout=QUEUE_TIMEOUT,
+            adaptive=mode == "adaptive",
+            target_latency=SERVICE_TIME * 2,
+        )
+    return app
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+async def load(mode: str, seconds: float, overload: float):
+    rate = CAPACITY / SERVICE_TIME * overload
+    ok: list[float] = []
+    shed: list[float] = []
+
+    async def one(client: httpx.AsyncClient):
+        start = time.perf_counter()
+        response = await client.get("/test/heroes")
+        elapsed = (time.perf_counter() - start) * 1000
+        (ok if response.status_code == 200 else shed).append(elapsed)
+
+    transport = httpx.ASGITransport(app=make_app(mode))
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        async with anyio.create_task_group() as tg:
+            start = time.perf_counter()
+            sent = 0
+            while time.perf_counter() - start < seconds:
+                # Bucle abierto: las llegadas no esperan a las respuestas
+                due = int((time.perf_counter() - start) * rate)
+                for _ in range(due - sent):
+                    tg.start_soon(one, client)
+                sent = due
+                await anyio.sleep(0.001)
+    return ok, shed
+
+
+def run(seconds: float, overload: float) -> None:
+    rows = []
+    for mode in ["off", "static", "adaptive"]:
+        ok, shed = anyio.run(load, mode, seconds, overload)
+        rows.append(
+            [
+                mode,
+                len(ok),
+                len(shed),
+                f"{percentile(ok, 50):,.1f}",
+                f"{percentile(ok, 99):,.1f}",
+                f"{percentile(shed, 99):,.1f}",
+            ]
+        )
+    print(
+        f"capacity {CAPACITY / SERVICE_TIME:,.0f} req/s, "
+        f"offered {CAPACITY / SERVICE_TIME * overload:,.0f} req/s\n"
+    )
+    print_table(["mode", "ok", "503", "p50 ok ms", "p99 ok ms", "p99 503 ms"], rows)
+
+
+if __name__ == "__main__":
+    run(
+        float(sys.argv[1]) if len(sys.argv) > 1 else 5.0,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 3.0,
+    )
@@ -0,0 +1,90 @@
+"""
+Latencia del listado desde la base de datos frente a la réplica columnar.
+
+Siembra héroes (100k por defecto) y mide p50/p95 de una página de 20 filas
+más el total (`get_filtered_rows_with_count`) con HeroRepository y con
+ColumnarReplicaRepository para:
+
+- el listado por defecto (orden por name),
+- un filtro por rango (`age:ge:50`) ordenado por age desc,
+- una búsqueda de texto (`name:like:99`),
+- dos criterios de orden (`age:asc,created_at:desc`).
+
+Informa además del tiempo de carga de la réplica (lo que cuesta cada
+cambio). Por defecto contra SQLite; para Postgres define
+BENCH_DATABASE_URL (ver README). Requiere el paquete `numpy`.
+
+Uso: uv run python -m benchmarks.columnar_replica [héroes] [iteraciones]
+"""
+
+import statistics
+import sys
+import time
+
+from sqlmodel import Session
+
+from app.models.orm.hero import Hero, HeroFilter, HeroSort
+from app.repositories.columnar_replica_repository import ColumnarReplicaRepository
+from app.repositories.hero_repository import HeroRepository
+from benchmarks.common import make_engine, print_table, seed_heroes
+
+QUERIES = [
+    ("default", None, None),
+    ("range", "age:ge:50", "age:desc"),
+    ("like", "name:like:99", None),
+    ("two sorts", None, "age:asc,created_at:desc"),
+]
+
+
+def measure(engine, repository_class, filter_str, sort_str, iterations) -> list:
+    hero_filter = HeroFilter.from_string(filter_str)
+    hero_sort = HeroSort.from_string(sort_str)
+    timings = []
+    with Session(engine) as session:
+        repository = repository_class(session)
+        # Primera ejecución fuera de la medida (carga de la réplica, caché)
+        repository.get_filtered_rows_with_count(hero_filter, 0, 20, hero_sort)
+        for _ in range(iterations):
+            start = time.perf_counter()
+            repository.get_filtered_rows_with_count(hero_filter, 0, 20, hero_sort)
+            timings.append((time.perf_counter() - start) * 1000)
+            session.rollback()
+    return timings
+
+
+def run(count: int, iterations: int) -> None:
+    engine = make_engine()
+    seed_heroes(engine, count)
+    replica_class = ColumnarReplicaRepository.for_model(Hero, default_sort="name")
+
+    with Session(engine) as session:
+        replica = replica_class(session).replica
+        replica.snapshot(session)
+        load_ms = replica.last_refresh_ms
+
+    rows = []
+    for label, filter_str, sort_str in QUERIES:
+        for source, repository_class in (
+            (engine.dialect.name, HeroRepository),
+            ("replica", replica_class),
+        ):
+            timings = measure(
+                engine, repository_class, filter_str, sort_str, iterations
+            )
+            rows.append(
+                [
+                    label,
+                    source,
+                    f"{statistics.median(timings):,.2f}",
+                    f"{statistics.quantiles(timings, n=20)[-1]:,.2f}",
+                ]
+            )
+    print(f"{count:,} heroes, replica load {load_ms:,.0f} ms\n")
+    print_table(["query", "source", "p50 ms", "p95 ms"], rows)
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+    )
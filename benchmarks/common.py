@@ -0,0 +1,71 @@
+"""Utilidades compartidas por los benchmarks."""
+
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.repositories.hero_repository import HeroRepository
+from app.utils.uuid7 import uuid7
+
+
+def make_engine(url: str | None = None, **options):
+    """
+    Crea el motor de base de datos del benchmark.
+
+    Usa BENCH_DATABASE_URL si está definida; si no, una base SQLite temporal.
+    `options` se pasan a create_engine (p. ej. pool_size).
+    """
+    url = url or os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        path = os.path.join(tempfile.mkdtemp(prefix="bench-"), "bench.db")
+        url = f"sqlite:///{path}"
+    engine = create_engine(url, **options)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def seed_heroes(engine, count: int, batch_size: int = 10_000) -> None:
+    """Inserta `count` héroes sintéticos en lotes (COPY binario con psycopg3)"""
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        repository = HeroRepository(session)
+        for start in range(0, count, batch_size):
+            repository.bulk_insert(
+                [
+                    {
+                        "id": uuid7(),
+                        "created_at": now,
+                        "updated_at": now,
+                        "name": f"Hero {i}",
+                        "age": i % 100,
+                        "secret_name": f"Secret {i}",
+                    }
+                    for i in range(start, min(start + batch_size, count))
+                ]
+            )
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Devuelve el mejor tiempo (segundos) de `repeat` ejecuciones"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_table(headers: list[str], rows: list[list[object]]) -> None:
+    """Imprime una tabla alineada en texto plano"""
+    widths = [
+        max(len(str(value)) for value in [header, *(row[i] for row in rows)])
+        for i, header in enumerate(headers)
+    ]
+    print("  ".join(header.ljust(width) for header, width in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(value).ljust(width) for value, width in zip(row, widths)))
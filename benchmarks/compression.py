@@ -0,0 +1,76 @@
+"""
+Coste de CPU frente a bytes ahorrados al comprimir páginas del listado.
+
+Construye respuestas de `ResponseBuilder.paginated` con 10 y 100 héroes y las
+comprime con cada codificación disponible (gzip siempre; zstd y brotli si
+están instalados) a varios niveles.
+
+Uso: uv run python -m benchmarks.compression [repeticiones]
+"""
+
+import sys
+import time
+from datetime import datetime, timezone
+
+from app.middleware.compression import ENCODERS
+from app.utils.response import ResponseBuilder
+from app.utils.uuid7 import uuid7
+from benchmarks.common import print_table
+
+PAGE_SIZES = [10, 100]
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 11], "zstd": [1, 3, 10]}
+
+
+def page_body(size: int) -> bytes:
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": uuid7(),
+            "created_at": now,
+            "updated_at": now,
+            "name": f"Hero {i}",
+            "age": 20 + i % 60,
+            "secret_name": f"Secret identity {i}",
+        }
+        for i in range(size)
+    ]
+    return ResponseBuilder.paginated(
+        data=rows, page=1, size=size, total=10_000, message="Heroes list"
+    ).body
+
+
+def compress(encoding: str, level: int, body: bytes) -> bytes:
+    compressor = ENCODERS[encoding](level)
+    return compressor.compress(body) + compressor.finish()
+
+
+def run(repeat: int) -> None:
+    rows = []
+    for size in PAGE_SIZES:
+        body = page_body(size)
+        rows.append([size, "identity", "-", len(body), len(body), "0.0", "0.0"])
+        for encoding in ENCODERS:
+            for level in LEVELS[encoding]:
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    compressed = compress(encoding, level, body)
+                elapsed_us = (time.perf_counter() - start) / repeat * 1e6
+                rows.append(
+                    [
+                        size,
+                        encoding,
+                        level,
+                        len(body),
+                        len(compressed),
+                        f"{(1 - len(compressed) / len(body)) * 100:.1f}",
+                        f"{elapsed_us:,.1f}",
+                    ]
+                )
+    print_table(
+        ["rows", "encoding", "level", "bytes", "compressed", "saved %", "us/response"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,110 @@
+"""
+Coste por petición de construir el repositorio y sus estrategias.
+
+Compara la construcción por petición de estrategias y repositorio (como hacía
+`get_hero_service`) con enlazar solo la sesión a estrategias construidas una
+vez por modelo:
+
+- asignaciones (bloques y bytes, tracemalloc) y µs por construcción,
+- µs por petición de un endpoint que solo resuelve la dependencia, medido de
+  extremo a extremo a través de FastAPI con httpx.ASGITransport.
+
+Uso: uv run python -m benchmarks.dependencies [iteraciones] [peticiones]
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlmodel import Session
+
+from app.db.database import db
+from app.models.orm.hero import Hero
+from app.repositories.base_repository import BaseRepository
+from app.repositories.strategies.generic_filter_strategy import GenericFilterStrategy
+from app.repositories.strategies.generic_sort_strategy import GenericSortStrategy
+from app.services.hero_service import HeroService, get_hero_service
+from benchmarks.common import print_table
+
+
+def per_request_service(session: Session = Depends(db.get_session)) -> HeroService:
+    """Construcción anterior: estrategias nuevas en cada petición"""
+    repository = BaseRepository(
+        session,
+        Hero,
+        GenericFilterStrategy(Hero),
+        GenericSortStrategy(model_class=Hero, default_sort="name"),
+    )
+    return HeroService(repository)
+
+
+def allocations(build, iterations: int) -> tuple[float, float, float]:
+    session = Session(db.engine)
+    build(session)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    keep = [build(session) for _ in range(iterations)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats) / iterations
+    size = sum(stat.size_diff for stat in stats) / iterations
+    del keep
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        build(session)
+    elapsed_us = (time.perf_counter() - start) * 1_000_000 / iterations
+    session.close()
+    return blocks, size, elapsed_us
+
+
+async def request_time(dependency, requests: int) -> float:
+    app = FastAPI()
+
+    @app.get("/noop")
+    def noop(service: HeroService = Depends(dependency)):
+        return None
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get("/noop")
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/noop")
+        return (time.perf_counter() - start) * 1_000_000 / requests
+
+
+def run(iterations: int, requests: int) -> None:
+    cases = [
+        ("per request", per_request_service),
+        ("bound session", get_hero_service),
+    ]
+    rows = []
+    for label, dependency in cases:
+        # Sin pasar por Depends: misma llamada que hace FastAPI por petición
+        blocks, size, build_us = allocations(dependency, iterations)
+        rows.append(
+            [
+                label,
+                f"{blocks:,.1f}",
+                f"{size:,.0f}",
+                f"{build_us:,.2f}",
+                f"{asyncio.run(request_time(dependency, requests)):,.1f}",
+            ]
+        )
+    print(f"{iterations:,} constructions, {requests:,} requests per case\n")
+    print_table(
+        ["strategies", "blocks/req", "bytes/req", "build µs", "request µs"], rows
+    )
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 3_000,
+    )
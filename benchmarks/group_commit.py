@@ -0,0 +1,88 @@
+"""
+Altas/segundo con escritores concurrentes sin y con group commit.
+
+Lanza N escritores (por defecto 200) que crean héroes de uno en uno con
+`HeroRepository.create`, cada uno con su propia sesión, y mide altas/segundo
+y p50/p99 por alta con WRITE_COALESCING desactivado y activado. Con SQLite
+en fichero cada commit es un fsync; para medir contra Postgres define
+BENCH_DATABASE_URL (ver README).
+
+Uso: uv run python -m benchmarks.group_commit [escritores] [altas por escritor] [max delay ms]
+"""
+
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from app.db import write_coalescer
+from app.models.orm.hero import Hero
+from app.repositories.hero_repository import HeroRepository
+from benchmarks.common import make_engine, print_table
+
+
+def writer(engine, inserts: int, start: threading.Barrier) -> tuple[list, int]:
+    timings, errors = [], 0
+    with Session(engine) as session:
+        repository = HeroRepository(session)
+        start.wait()
+        for i in range(inserts):
+            begin = time.perf_counter()
+            try:
+                repository.create(Hero(name=f"Hero {i}", age=i % 100, secret_name="s"))
+            except SQLAlchemyError:
+                errors += 1
+            timings.append((time.perf_counter() - begin) * 1000)
+    return timings, errors
+
+
+def measure(engine, coalescing: bool, writers: int, inserts: int) -> list[object]:
+    write_coalescer.config.write_coalescing = coalescing
+    start = threading.Barrier(writers + 1)
+    with ThreadPoolExecutor(max_workers=writers) as executor:
+        futures = [
+            executor.submit(writer, engine, inserts, start) for _ in range(writers)
+        ]
+        start.wait()
+        begin = time.perf_counter()
+        results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - begin
+
+    timings = [t for result in results for t in result[0]]
+    errors = sum(result[1] for result in results)
+    percentiles = statistics.quantiles(timings, n=100)
+    return [
+        "on" if coalescing else "off",
+        f"{(len(timings) - errors) / elapsed:,.0f}",
+        f"{statistics.median(timings):,.2f}",
+        f"{percentiles[98]:,.2f}",
+        errors,
+    ]
+
+
+def run(writers: int, inserts: int, max_delay_ms: float) -> None:
+    # Un pool a la medida de los escritores: se mide el commit, no la espera
+    engine = make_engine(pool_size=writers, max_overflow=0)
+    write_coalescer._coalescer.max_delay = max_delay_ms / 1000
+
+    rows = [
+        measure(engine, coalescing, writers, inserts) for coalescing in (False, True)
+    ]
+    print(
+        f"{writers} concurrent writers x {inserts} inserts, "
+        f"max delay {max_delay_ms} ms ({engine.url.get_backend_name()})\n"
+    )
+    print_table(["coalescing", "inserts/s", "p50 ms", "p99 ms", "errors"], rows)
+    print(f"\nbatches: {write_coalescer._coalescer.metrics()}")
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        float(sys.argv[3]) if len(sys.argv) > 3 else 2.0,
+    )
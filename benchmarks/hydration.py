@@ -0,0 +1,55 @@
+"""
+Filas/segundo hidratadas por el listado ORM (get_filtered) frente al listado
+de Core (get_filtered_rows) para 100, 1k y 10k filas.
+
+Uso: uv run python -m benchmarks.hydration
+"""
+
+from sqlalchemy import delete
+from sqlmodel import Session
+
+from app.models.orm.hero import Hero, HeroFilter
+from app.repositories.hero_repository import HeroRepository
+from app.utils.response import ResponseBuilder
+from benchmarks.common import best_of, make_engine, print_table, seed_heroes
+
+SIZES = (100, 1_000, 10_000)
+
+
+def run() -> None:
+    engine = make_engine()
+    rows = []
+    for size in SIZES:
+        with Session(engine) as session:
+            session.exec(delete(Hero))
+            session.commit()
+        seed_heroes(engine, size)
+
+        def orm_path():
+            with Session(engine) as session:
+                heroes = HeroRepository(session).get_filtered(HeroFilter(), 0, size)
+                ResponseBuilder._serialize_datetime(heroes)
+
+        def core_path():
+            with Session(engine) as session:
+                heroes = HeroRepository(session).get_filtered_rows(
+                    HeroFilter(), 0, size
+                )
+                ResponseBuilder._serialize_datetime(heroes)
+
+        orm_time = best_of(orm_path)
+        core_time = best_of(core_path)
+        rows.append(
+            [
+                size,
+                f"{size / orm_time:,.0f}",
+                f"{size / core_time:,.0f}",
+                f"{orm_time / core_time:.2f}x",
+            ]
+        )
+
+    print_table(["rows", "orm rows/s", "core rows/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,66 @@
+"""
+Informe del coste de importación por módulo de `app.main`.
+
+Ejecuta `python -X importtime` en un intérprete limpio y muestra el tiempo
+acumulado por paquete de primer nivel y los módulos con más tiempo propio.
+
+Uso: uv run python -m benchmarks.import_time [módulo] [top]
+"""
+
+import subprocess
+import sys
+from collections import defaultdict
+
+from benchmarks.common import print_table
+
+
+def collect(module: str) -> list[tuple[str, int, int]]:
+    """Devuelve (módulo, tiempo propio us, tiempo acumulado us) por import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def run(module: str, top: int) -> None:
+    entries = collect(module)
+    total_us = sum(self_us for _, self_us, _ in entries)
+
+    by_package: dict[str, int] = defaultdict(int)
+    for name, self_us, _ in entries:
+        by_package[name.split(".")[0]] += self_us
+
+    print(f"import {module}: {total_us / 1000:,.1f} ms\n")
+    print_table(
+        ["package", "ms", "%"],
+        [
+            [package, f"{us / 1000:,.1f}", f"{us * 100 / total_us:.1f}"]
+            for package, us in sorted(by_package.items(), key=lambda i: -i[1])[:top]
+        ],
+    )
+    print()
+    print_table(
+        ["module", "self ms", "cumulative ms"],
+        [
+            [name, f"{self_us / 1000:,.1f}", f"{cumulative_us / 1000:,.1f}"]
+            for name, self_us, cumulative_us in sorted(entries, key=lambda e: -e[1])[
+                :top
+            ]
+        ],
+    )
+
+
+if __name__ == "__main__":
+    run(
+        sys.argv[1] if len(sys.argv) > 1 else "app.main",
+        int(sys.argv[2]) if len(sys.argv) > 2 else 15,
+    )
@@ -0,0 +1,111 @@
+"""
+Filtros IN con listas grandes de ids.
+
+Siembra héroes y busca listas de 10, 1.000 y 50.000 ids existentes con:
+
+- `expanding IN`: `Hero.id.in_(ids)`, un parámetro por elemento (el
+  comportamiento anterior de GenericFilterStrategy),
+- `single bind`: `in_list(Hero.id, ids)`, la lista en un único parámetro
+  (`= ANY(array)` en Postgres, `json_each` en SQLite),
+- `temp table`: volcar los ids a una tabla temporal y hacer JOIN.
+
+Mide p50 (compilación + ejecución + lectura de filas) y la longitud del SQL
+enviado. Para medir contra Postgres define BENCH_DATABASE_URL (ver README).
+
+Uso: uv run python -m benchmarks.in_lists [héroes] [iteraciones]
+"""
+
+import random
+import statistics
+import sys
+import time
+
+from sqlalchemy import Column, MetaData, Table, event, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from app.db.in_list import in_list
+from app.models.orm.hero import Hero
+from benchmarks.common import make_engine, print_table, seed_heroes
+
+SIZES = (10, 1_000, 50_000)
+
+
+def expanding_in(session: Session, ids: list) -> list:
+    query = select(Hero.id, Hero.name).where(Hero.id.in_(ids))
+    return session.execute(query).all()
+
+
+def single_bind(session: Session, ids: list) -> list:
+    query = select(Hero.id, Hero.name).where(in_list(Hero.id, ids))
+    return session.execute(query).all()
+
+
+def temp_table(session: Session, ids: list) -> list:
+    table = Table(
+        "bench_ids",
+        MetaData(),
+        Column("id", Hero.id.type, primary_key=True),
+        prefixes=["TEMPORARY"],
+    )
+    connection = session.connection()
+    # La tabla temporal vive lo que la conexión: se reutiliza vaciándola
+    table.create(connection, checkfirst=True)
+    try:
+        connection.execute(table.insert(), [{"id": entity_id} for entity_id in ids])
+        query = select(Hero.id, Hero.name).join(table, table.c.id == Hero.id)
+        return session.execute(query).all()
+    finally:
+        connection.execute(table.delete())
+
+
+def measure(engine, strategy, ids: list, iterations: int) -> tuple[str, str, int]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    timings = []
+    try:
+        with Session(engine) as session:
+            for _ in range(iterations):
+                start = time.perf_counter()
+                rows = strategy(session, ids)
+                timings.append((time.perf_counter() - start) * 1000)
+                session.rollback()
+                assert len(rows) == len(ids)
+    except SQLAlchemyError as e:
+        return "error", type(e.orig or e).__name__, 0
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    sql_length = max(len(statement) for statement in statements)
+    return f"{statistics.median(timings):,.2f}", f"{sql_length:,}", len(ids)
+
+
+def run(count: int, iterations: int) -> None:
+    engine = make_engine()
+    seed_heroes(engine, count)
+    with Session(engine) as session:
+        all_ids = list(session.execute(select(Hero.id)).scalars())
+
+    cases = [
+        ("expanding IN", expanding_in),
+        ("single bind", single_bind),
+        ("temp table", temp_table),
+    ]
+    rows = []
+    for size in SIZES:
+        ids = random.sample(all_ids, min(size, len(all_ids)))
+        for label, strategy in cases:
+            p50, sql_length, _ = measure(engine, strategy, ids, iterations)
+            rows.append([f"{len(ids):,}", label, p50, sql_length])
+    print(f"{count:,} heroes, {engine.dialect.name}, {iterations} runs per case\n")
+    print_table(["ids", "strategy", "p50 ms", "SQL chars"], rows)
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
@@ -0,0 +1,67 @@
+"""
+Latencia del listado con el COUNT en serie o en paralelo a la página.
+
+Siembra héroes, inyecta una latencia de red fija por sentencia (por defecto
+2 ms, típica entre la aplicación y Postgres en otra máquina) y mide p50/p95
+de `get_filtered_rows_with_count` con PARALLEL_COUNT desactivado y activado.
+Para medir contra Postgres define BENCH_DATABASE_URL (ver README).
+
+Uso: uv run python -m benchmarks.parallel_count [héroes] [latencia ms] [iteraciones]
+"""
+
+import statistics
+import sys
+import time
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.db import parallel_queries
+from app.models.orm.hero import HeroFilter
+from app.repositories.hero_repository import HeroRepository
+from benchmarks.common import make_engine, print_table, seed_heroes
+
+
+def measure(engine, parallel: bool, iterations: int) -> list[float]:
+    parallel_queries.config.parallel_count = parallel
+    hero_filter = HeroFilter.from_string("name:like:Hero 1")
+    timings = []
+    with Session(engine) as session:
+        repository = HeroRepository(session)
+        for _ in range(iterations):
+            start = time.perf_counter()
+            repository.get_filtered_rows_with_count(hero_filter, 0, 20)
+            timings.append((time.perf_counter() - start) * 1000)
+            session.rollback()
+    return timings
+
+
+def run(count: int, latency_ms: float, iterations: int) -> None:
+    engine = make_engine()
+    seed_heroes(engine, count)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def inject_latency(*args):
+        time.sleep(latency_ms / 1000)
+
+    rows = []
+    for parallel in (False, True):
+        measure(engine, parallel, 3)
+        timings = measure(engine, parallel, iterations)
+        rows.append(
+            [
+                "parallel" if parallel else "sequential",
+                f"{statistics.median(timings):,.2f}",
+                f"{statistics.quantiles(timings, n=20)[-1]:,.2f}",
+            ]
+        )
+    print(f"{count:,} heroes, {latency_ms} ms injected per statement\n")
+    print_table(["count query", "p50 ms", "p95 ms"], rows)
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 2.0,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 50,
+    )
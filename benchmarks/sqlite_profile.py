@@ -0,0 +1,117 @@
+"""
+Rendimiento de un archivo SQLite con y sin el perfil de producción.
+
+Para cada configuración crea una base nueva, siembra héroes y, durante unos
+segundos por carga, mide operaciones por segundo desde varios hilos:
+
+- `reads`: 8 hilos leyendo héroes por id (`get_by_id`),
+- `writes`: 4 hilos dando de alta héroes, un commit por alta,
+- `mixed`: 6 lectores y 2 escritores a la vez.
+
+`off` es `create_engine(url)` sin más (rollback journal, synchronous=FULL y
+todas las conexiones compitiendo por el bloqueo de escritura); `on` es el
+perfil de Database (WAL, synchronous=NORMAL, mmap, un escritor y varios
+lectores). Los errores son consultas que fallaron con "database is locked".
+
+Uso: uv run python -m benchmarks.sqlite_profile [héroes] [segundos]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy.exc import OperationalError
+from sqlmodel import select
+
+from app.db.database import Database
+from app.db.sqlite_profile import SQLiteProfile
+from app.models.orm.hero import Hero
+from app.repositories.hero_repository import HeroRepository
+from benchmarks.common import print_table, seed_heroes
+
+WORKLOADS = {"reads": (8, 0), "writes": (0, 4), "mixed": (6, 2)}
+
+
+def make_database(profile: SQLiteProfile | None) -> Database:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-"), "bench.db")
+    database = Database(f"sqlite:///{path}", pool_size=8, sqlite_profile=profile)
+    database.create_db_and_tables()
+    return database
+
+
+def reader(database: Database, ids: list, stop: threading.Event, counts: dict):
+    with database.new_session() as session:
+        repository = HeroRepository(session)
+        while not stop.is_set():
+            try:
+                repository.get_by_id(random.choice(ids))
+                session.rollback()
+                counts["reads"] += 1
+            except OperationalError:
+                session.rollback()
+                counts["errors"] += 1
+
+
+def writer(database: Database, stop: threading.Event, counts: dict):
+    with database.new_session() as session:
+        repository = HeroRepository(session)
+        while not stop.is_set():
+            try:
+                repository.create(Hero(name="Bench", secret_name="s", age=1))
+                session.expunge_all()
+                counts["writes"] += 1
+            except OperationalError:
+                counts["errors"] += 1
+
+
+def measure(database: Database, ids: list, readers: int, writers: int, seconds):
+    stop = threading.Event()
+    counts = [{"reads": 0, "writes": 0, "errors": 0} for _ in range(readers + writers)]
+    threads = [
+        threading.Thread(target=reader, args=(database, ids, stop, counts[i]))
+        for i in range(readers)
+    ] + [
+        threading.Thread(target=writer, args=(database, stop, counts[readers + i]))
+        for i in range(writers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return {key: sum(count[key] for count in counts) for key in counts[0]}
+
+
+def run(count: int, seconds: float) -> None:
+    profiles = [("off", None), ("on", SQLiteProfile())]
+    rows = []
+    for label, profile in profiles:
+        database = make_database(profile)
+        seed_heroes(database.engine, count)
+        with database.new_session() as session:
+            ids = list(session.exec(select(Hero.id)).all())
+        for workload, (readers, writers) in WORKLOADS.items():
+            totals = measure(database, ids, readers, writers, seconds)
+            rows.append(
+                [
+                    label,
+                    workload,
+                    f"{totals['reads'] / seconds:,.0f}",
+                    f"{totals['writes'] / seconds:,.0f}",
+                    totals["errors"],
+                ]
+            )
+        database.dispose()
+    print(f"{count:,} heroes, {seconds:g} s per workload\n")
+    print_table(["profile", "workload", "reads/s", "writes/s", "errors"], rows)
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 5,
+    )
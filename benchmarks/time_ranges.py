@@ -0,0 +1,129 @@
+"""
+Filtros por rango de fechas sobre created_at con y sin índice.
+
+Siembra héroes en orden de creación repartidos en un año (10M por defecto)
+y mide p50/p95 del listado filtrado por:
+
+- la última hora (`created_at:ge:now-1h`),
+- un día concreto (`created_at:between:...`),
+
+(página de 20 ordenada por created_at desc más el total) sin índice en
+created_at, con B-tree y, en Postgres, con BRIN (el índice de la migración
+c5e1f7a3d902), junto con el tamaño de cada índice. Para medir contra
+Postgres define BENCH_DATABASE_URL (ver README).
+
+Uso: uv run python -m benchmarks.time_ranges [héroes] [iteraciones]
+"""
+
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.models.orm.hero import HeroFilter, HeroSort
+from app.repositories.hero_repository import HeroRepository
+from app.utils.uuid7 import uuid7
+from benchmarks.common import make_engine, print_table
+
+DAYS = 365
+INDEX = "ix_hero_created_at"
+
+
+def seed(engine, count: int, batch_size: int = 50_000) -> datetime:
+    """Inserta `count` héroes con created_at creciente hasta ahora"""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    start = now - timedelta(days=DAYS)
+    step = timedelta(days=DAYS) / count
+    with Session(engine) as session:
+        repository = HeroRepository(session)
+        for offset in range(0, count, batch_size):
+            repository.bulk_insert(
+                [
+                    {
+                        "id": uuid7(),
+                        "created_at": start + step * i,
+                        "updated_at": start + step * i,
+                        "name": f"Hero {i}",
+                        "age": i % 100,
+                        "secret_name": f"Secret {i}",
+                    }
+                    for i in range(offset, min(offset + batch_size, count))
+                ]
+            )
+    return now
+
+
+def create_index(engine, kind: str) -> str:
+    """Deja created_at sin índice, con B-tree o con BRIN y devuelve su tamaño"""
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP INDEX IF EXISTS {INDEX}"))
+        if kind == "btree":
+            connection.execute(text(f"CREATE INDEX {INDEX} ON hero (created_at)"))
+        elif kind == "brin":
+            connection.execute(
+                text(f"CREATE INDEX {INDEX} ON hero USING brin (created_at)")
+            )
+        connection.execute(text("ANALYZE hero"))
+        if kind == "none" or engine.dialect.name != "postgresql":
+            return "-"
+        size = connection.execute(
+            text(f"SELECT pg_size_pretty(pg_relation_size('{INDEX}'))")
+        ).scalar_one()
+    return size
+
+
+def measure(engine, filter_str: str, iterations: int) -> list[float]:
+    hero_filter = HeroFilter.from_string(filter_str)
+    # Un listado por fechas se ordena por fecha: con el orden por defecto
+    # (name) el planificador puede preferir recorrer ix_hero_name
+    hero_sort = HeroSort.from_string("created_at:desc")
+    timings = []
+    with Session(engine) as session:
+        repository = HeroRepository(session)
+        for _ in range(iterations):
+            start = time.perf_counter()
+            repository.get_filtered_rows_with_count(hero_filter, 0, 20, hero_sort)
+            timings.append((time.perf_counter() - start) * 1000)
+            session.rollback()
+    return timings
+
+
+def run(count: int, iterations: int) -> None:
+    engine = make_engine()
+    now = seed(engine, count)
+    day = (now - timedelta(days=DAYS // 2)).date()
+    queries = [
+        ("last hour", "created_at:ge:now-1h"),
+        ("one day", f"created_at:between:{day};{day}T23:59:59"),
+    ]
+    kinds = ["none", "btree"]
+    if engine.dialect.name == "postgresql":
+        kinds.append("brin")
+
+    rows = []
+    for kind in kinds:
+        size = create_index(engine, kind)
+        for label, filter_str in queries:
+            measure(engine, filter_str, 2)
+            timings = measure(engine, filter_str, iterations)
+            rows.append(
+                [
+                    kind,
+                    size,
+                    label,
+                    f"{statistics.median(timings):,.2f}",
+                    f"{statistics.quantiles(timings, n=20)[-1]:,.2f}",
+                ]
+            )
+    print(f"{count:,} heroes over {DAYS} days, {engine.dialect.name}\n")
+    print_table(["index", "size", "range", "p50 ms", "p95 ms"], rows)
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
@@ -0,0 +1,106 @@
+"""
+Coste de actualizar en bloque 100k entidades cargadas con el antiguo hook
+__setattr__ (updated_at calculado en Python en cada asignación) frente a
+updated_at mantenido por la base de datos (onupdate).
+
+Uso: uv run python -m benchmarks.timestamps [filas]
+"""
+
+import sys
+import time
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlmodel import Field, Session, SQLModel, select
+
+from app.models.orm.hero import Hero
+from benchmarks.common import make_engine, print_table, seed_heroes
+
+
+class LegacyHero(SQLModel, table=True):
+    """Réplica del BaseSQLModel anterior con timestamps calculados en Python"""
+
+    __tablename__ = "legacy_hero"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    name: str
+    age: int | None = None
+    secret_name: str
+
+    def __setattr__(self, name: str, value):
+        if (
+            name != "updated_at"
+            and name != "created_at"
+            and hasattr(self, "_sa_instance_state")
+            and self._sa_instance_state is not None
+        ):
+            super().__setattr__("updated_at", datetime.now(timezone.utc))
+
+        super().__setattr__(name, value)
+
+
+def seed_legacy(engine, count: int) -> None:
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": uuid4(),
+            "created_at": now,
+            "updated_at": now,
+            "name": f"Hero {i}",
+            "age": i % 100,
+            "secret_name": f"Secret {i}",
+        }
+        for i in range(count)
+    ]
+    with Session(engine) as session:
+        session.exec(insert(LegacyHero), params=rows)
+        session.commit()
+
+
+def bulk_update(engine, model_class) -> tuple[float, float]:
+    """Devuelve (segundos asignando atributos, segundos en el flush)"""
+    with Session(engine) as session:
+        entities = session.exec(select(model_class)).all()
+
+        start = time.perf_counter()
+        for entity in entities:
+            entity.age = (entity.age or 0) + 1
+        assign_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        session.commit()
+        flush_time = time.perf_counter() - start
+
+    return assign_time, flush_time
+
+
+def run(count: int) -> None:
+    engine = make_engine()
+    SQLModel.metadata.create_all(engine, tables=[LegacyHero.__table__])
+    seed_heroes(engine, count)
+    seed_legacy(engine, count)
+
+    rows = []
+    for label, model_class in (
+        ("python __setattr__", LegacyHero),
+        ("db onupdate", Hero),
+    ):
+        assign_time, flush_time = bulk_update(engine, model_class)
+        rows.append(
+            [
+                label,
+                f"{assign_time * 1000:,.0f}",
+                f"{flush_time * 1000:,.0f}",
+                f"{(assign_time + flush_time) * 1000:,.0f}",
+            ]
+        )
+
+    print(f"Bulk update of {count:,} loaded entities")
+    print_table(["mode", "assign ms", "flush ms", "total ms"], rows)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,93 @@
+"""
+Rendimiento de inserción y tamaño del índice de la clave primaria con
+UUIDv4 (aleatorio) frente a UUIDv7 (ordenado en el tiempo).
+
+Uso: uv run python -m benchmarks.uuid_keys [filas]
+
+El tamaño del índice se lee de pg_relation_size en Postgres y de la tabla
+virtual dbstat en SQLite (si la compilación de SQLite la incluye).
+"""
+
+import sys
+import time
+from uuid import uuid4
+
+from sqlalchemy import Column, MetaData, String, Table, Uuid, insert, text
+
+from app.utils.uuid7 import uuid7
+from benchmarks.common import make_engine, print_table
+
+BATCH_SIZE = 10_000
+
+metadata = MetaData()
+
+
+def make_table(name: str) -> Table:
+    return Table(
+        name,
+        metadata,
+        Column("id", Uuid(), primary_key=True),
+        Column("payload", String(32), nullable=False),
+    )
+
+
+TABLES = {"uuid4": make_table("bench_uuid_v4"), "uuid7": make_table("bench_uuid_v7")}
+GENERATORS = {"uuid4": uuid4, "uuid7": uuid7}
+
+
+def index_size(connection, table: Table) -> str:
+    dialect = connection.dialect.name
+    try:
+        if dialect == "postgresql":
+            size = connection.execute(
+                text(
+                    "SELECT pg_relation_size(indexrelid) FROM pg_index "
+                    "WHERE indrelid = CAST(:table AS regclass) AND indisprimary"
+                ),
+                {"table": table.name},
+            ).scalar_one()
+        elif dialect == "sqlite":
+            size = connection.execute(
+                text(
+                    "SELECT SUM(pgsize) FROM dbstat WHERE name = "
+                    "(SELECT name FROM sqlite_master WHERE type = 'index' "
+                    "AND tbl_name = :table)"
+                ),
+                {"table": table.name},
+            ).scalar_one()
+        else:
+            return "n/a"
+    except Exception:
+        return "n/a"
+    return f"{size / 1024 / 1024:,.1f}"
+
+
+def run(count: int) -> None:
+    engine = make_engine()
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    rows = []
+    for label, table in TABLES.items():
+        generate = GENERATORS[label]
+        start = time.perf_counter()
+        with engine.begin() as connection:
+            for offset in range(0, count, BATCH_SIZE):
+                batch = [
+                    {"id": generate(), "payload": f"row {i}"}
+                    for i in range(offset, min(offset + BATCH_SIZE, count))
+                ]
+                connection.execute(insert(table), batch)
+        elapsed = time.perf_counter() - start
+
+        with engine.connect() as connection:
+            size = index_size(connection, table)
+        rows.append([label, f"{count / elapsed:,.0f}", size])
+
+    metadata.drop_all(engine)
+    print(f"Inserted {count:,} rows per table")
+    print_table(["key", "inserts/s", "pk index MB"], rows)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
@@ -0,0 +1,99 @@
+"""
+Rendimiento del servidor de producción según el número de workers.
+
+Lanza `python -m app.server` con WEB_CONCURRENCY=1/2/4/8 contra una base con
+héroes sembrados y mide peticiones/segundo del listado con clientes HTTP
+concurrentes. El pool total se mantiene en DB_MAX_CONNECTIONS.
+
+Uso: uv run python -m benchmarks.workers [segundos] [clientes]
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from benchmarks.common import make_engine, print_table, seed_heroes
+
+WORKER_COUNTS = [1, 2, 4, 8]
+HEROES = 1_000
+PATH = "/test/heroes?limit=20"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"Server at {base_url} did not start in {timeout}s")
+
+
+def client_loop(base_url: str, until: float) -> int:
+    done = 0
+    with httpx.Client(base_url=base_url) as client:
+        while time.monotonic() < until:
+            client.get(PATH).raise_for_status()
+            done += 1
+    return done
+
+
+def measure(database_url: str, workers: int, seconds: float, clients: int):
+    port = free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "WEB_CONCURRENCY": str(workers),
+        "HOST": "127.0.0.1",
+        "PORT": str(port),
+        "LOG_LEVEL": "WARNING",
+    }
+    server = subprocess.Popen([sys.executable, "-m", "app.server"], env=env)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_ready(base_url)
+        until = time.monotonic() + seconds
+        with ThreadPoolExecutor(clients) as pool:
+            total = sum(
+                pool.map(lambda _: client_loop(base_url, until), range(clients))
+            )
+    finally:
+        # SIGTERM: uvicorn drena las peticiones en curso antes de salir
+        server.terminate()
+        server.wait()
+    return total / seconds
+
+
+def run(seconds: float, clients: int) -> None:
+    engine = make_engine()
+    seed_heroes(engine, HEROES)
+    database_url = engine.url.render_as_string(hide_password=False)
+    engine.dispose()
+
+    rows = []
+    baseline = None
+    for workers in WORKER_COUNTS:
+        rps = measure(database_url, workers, seconds, clients)
+        baseline = baseline or rps
+        rows.append([workers, f"{rps:,.0f}", f"{rps / baseline:.2f}x"])
+    print_table(["workers", "req/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    run(
+        float(sys.argv[1]) if len(sys.argv) > 1 else 5.0,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 32,
+    )
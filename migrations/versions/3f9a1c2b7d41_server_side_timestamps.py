@@ -0,0 +1,62 @@
+"""Server-side timestamps
+
+Revision ID: 3f9a1c2b7d41
+Revises: 70020ca0e894
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2b7d41'
+down_revision: Union[str, Sequence[str], None] = '70020ca0e894'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POSTGRES_NOW = sa.text("TIMEZONE('utc', STATEMENT_TIMESTAMP())")
+SQLITE_NOW = sa.text("(STRFTIME('%Y-%m-%d %H:%M:%f', 'now'))")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    now = POSTGRES_NOW if is_postgres else SQLITE_NOW
+
+    with op.batch_alter_table('hero') as batch_op:
+        batch_op.alter_column('created_at', server_default=now)
+        batch_op.alter_column('updated_at', server_default=now)
+
+    if is_postgres:
+        # Mantiene updated_at también en UPDATEs que no pasan por el ORM
+        op.execute(
+            """
+            CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+            BEGIN
+                NEW.updated_at = TIMEZONE('utc', STATEMENT_TIMESTAMP());
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+            """
+        )
+        op.execute(
+            """
+            CREATE TRIGGER hero_set_updated_at
+            BEFORE UPDATE ON hero
+            FOR EACH ROW EXECUTE FUNCTION set_updated_at()
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS hero_set_updated_at ON hero")
+        op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
+
+    with op.batch_alter_table('hero') as batch_op:
+        batch_op.alter_column('updated_at', server_default=None)
+        batch_op.alter_column('created_at', server_default=None)
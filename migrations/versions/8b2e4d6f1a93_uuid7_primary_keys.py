@@ -0,0 +1,34 @@
+"""UUIDv7 primary keys
+
+Revision ID: 8b2e4d6f1a93
+Revises: 3f9a1c2b7d41
+Create Date: 2026-10-19 10:00:00.000000
+
+Los ids se generan en la aplicación (BaseSQLModel.id usa uuid7), así que no
+hace falta reescribir las filas existentes: los UUIDv4 ya guardados siguen
+siendo válidos y las filas nuevas se añaden al final del índice de la PK.
+Esta revisión solo elimina, si existe, el índice redundante sobre la clave
+primaria que generaba `index=True` en las bases creadas con create_all; las
+migraciones anteriores nunca lo crearon, así que el downgrade no lo recrea.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f1a93'
+down_revision: Union[str, Sequence[str], None] = '3f9a1c2b7d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f('ix_hero_id'), table_name='hero', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # El esquema de 3f9a1c2b7d41 no tiene ix_hero_id: no hay nada que deshacer
+    pass
@@ -0,0 +1,37 @@
+"""Timestamp indexes
+
+Revision ID: c5e1f7a3d902
+Revises: 8b2e4d6f1a93
+Create Date: 2026-10-19 12:00:00.000000
+
+Índices para los filtros por fecha (created_at/updated_at con gt, ge, lt,
+le y between). En PostgreSQL, created_at usa BRIN: las filas se insertan en
+orden de creación y el índice guarda solo el mínimo y el máximo de cada
+bloque de páginas, así que ocupa unos pocos KB incluso con millones de filas.
+updated_at cambia con cada UPDATE y no sigue el orden físico de la tabla:
+usa B-tree en todos los motores.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1f7a3d902'
+down_revision: Union[str, Sequence[str], None] = '8b2e4d6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_hero_created_at', 'hero', ['created_at'], postgresql_using='brin'
+    )
+    op.create_index('ix_hero_updated_at', 'hero', ['updated_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_hero_updated_at', table_name='hero')
+    op.drop_index('ix_hero_created_at', table_name='hero')
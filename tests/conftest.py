@@ -4,6 +4,7 @@ from sqlmodel import Session, create_engine, SQLModel
 from sqlmodel.pool import StaticPool
 from app.main import app
 from app.db.database import db
+from app.db.entity_loader import EntityLoader, ENTITY_LOADER_KEY
 from app.core.config import Settings
 
 pytest_plugins = [
@@ -53,7 +54,13 @@ def client_fixture(session: Session):
     """Cliente de prueba de FastAPI con base de datos de prueba"""
 
     def get_test_session():
-        yield session
+        # Como db.get_session: un cargador de entidades por petición
+        loader = EntityLoader()
+        session.info[ENTITY_LOADER_KEY] = loader
+        try:
+            yield session
+        finally:
+            session.info.pop(ENTITY_LOADER_KEY, None)
 
     app.dependency_overrides[db.get_session] = get_test_session
     client = TestClient(app)
@@ -0,0 +1,67 @@
+import threading
+
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from app.middleware.admission import AdmissionControlMiddleware
+
+
+class TestAdmissionControlMiddleware:
+    """Tests para el rechazo de peticiones con 503"""
+
+    def _client(
+        self, release: threading.Event, started: threading.Event | None = None
+    ) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            limits={"/limited": 1},
+            queue_size=0,
+            queue_timeout=3,
+        )
+
+        @app.get("/limited/slow")
+        def slow():
+            started.set()
+            release.wait(5)
+            return "OK"
+
+        @app.get("/limited/fast")
+        def fast():
+            return "OK"
+
+        @app.get("/health")
+        def health():
+            return "OK"
+
+        return TestClient(app)
+
+    def test_rejects_over_limit_with_retry_after(self):
+        """Debe devolver 503 con Retry-After cuando el grupo está lleno"""
+        # Arrange
+        release, started = threading.Event(), threading.Event()
+        with self._client(release, started) as client:
+            slow = threading.Thread(target=client.get, args=("/limited/slow",))
+            slow.start()
+            started.wait(5)
+
+            # Act
+            response = client.get("/limited/fast")
+            health = client.get("/health")
+
+            release.set()
+            slow.join()
+
+        # Assert
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["retry-after"] == "3"
+        assert response.json()["status"]["message"] == "Service Unavailable"
+        assert health.status_code == status.HTTP_200_OK
+
+    def test_admits_when_group_is_free(self):
+        """Debe dejar pasar las peticiones con capacidad libre"""
+        # Act
+        response = self._client(threading.Event()).get("/limited/fast")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
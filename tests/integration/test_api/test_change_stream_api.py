@@ -0,0 +1,52 @@
+import json
+
+import anyio
+from fastapi import status
+
+from app.core.change_stream import broadcaster
+
+
+def capture_events(client, action) -> list:
+    """Ejecuta `action(client)` suscrito a los cambios de héroes"""
+
+    async def main():
+        with broadcaster.subscribe("Hero", max_queue=10) as subscription:
+            await anyio.to_thread.run_sync(action, client)
+            events = []
+            while event := await subscription.get(timeout=0.05):
+                events.append(event)
+            return events
+
+    return anyio.run(main)
+
+
+class TestChangeStreamApi:
+    """Tests para el stream de cambios de héroes"""
+
+    def test_invalid_filter_returns_400(self, client):
+        """Debe validar el filtro antes de abrir el stream"""
+        # Act
+        response = client.get("/test/heroes/stream?filter=age:gt:abc")
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_writes_publish_change_events(self, client):
+        """Debe publicar un evento por cada escritura confirmada"""
+
+        # Arrange
+        def write(client):
+            hero = {"name": "Spider-Man", "age": 25, "secret_name": "Peter"}
+            hero_id = client.post("/test/heroes", json=hero).json()["data"]["id"]
+            client.patch(f"/test/heroes/{hero_id}", json={"age": 26})
+            client.delete(f"/test/heroes/{hero_id}")
+
+        # Act
+        events = capture_events(client, write)
+
+        # Assert
+        assert [event.type for event in events] == ["created", "updated", "deleted"]
+        assert len({event.entity_id for event in events}) == 1
+        assert events[1].data["age"] == 26
+        assert events[2].data["name"] == "Spider-Man"
+        json.dumps([event.to_dict() for event in events])
@@ -0,0 +1,80 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.compression import CompressionMiddleware
+
+LARGE = {"items": [{"name": f"Hero {i}", "age": i} for i in range(200)]}
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500, levels={"gzip": 6})
+
+    @app.get("/large")
+    def large():
+        return LARGE
+
+    @app.get("/small")
+    def small():
+        return {"status": "OK"}
+
+    @app.get("/stream")
+    def stream():
+        lines = (f'{{"id": {i}}}\n' for i in range(1000))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    return TestClient(app)
+
+
+class TestCompressionMiddleware:
+    """Tests para la compresión de respuestas"""
+
+    def test_compresses_large_json(self):
+        """Debe comprimir con gzip las respuestas grandes"""
+        # Act
+        response = make_client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert response.json() == LARGE
+
+    def test_skips_small_responses(self):
+        """No debe comprimir por debajo del tamaño mínimo"""
+        # Act
+        response = make_client().get("/small", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert "content-encoding" not in response.headers
+
+    def test_skips_without_accept_encoding(self):
+        """No debe comprimir si el cliente no lo acepta"""
+        # Act
+        response = make_client().get(
+            "/large", headers={"Accept-Encoding": "identity"}
+        )
+
+        # Assert
+        assert "content-encoding" not in response.headers
+        assert response.json() == LARGE
+
+    def test_streams_compressed_chunks(self):
+        """Debe comprimir al vuelo las respuestas en streaming"""
+        # Arrange
+        client = make_client()
+
+        # Act
+        with client.stream(
+            "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            raw = b"".join(response.iter_raw())
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        lines = gzip.decompress(raw).decode().splitlines()
+        assert len(lines) == 1000
@@ -0,0 +1,145 @@
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from app.db.database import db
+from app.main import app as main_app
+from app.models.orm.hero import Hero, HeroCreate, HeroPatch, HeroPut
+from app.repositories.base_repository import BaseRepository
+from app.repositories.hero_repository import HeroRepository
+from app.routes.crud_router import create_crud_router
+
+
+@pytest.fixture(name="crud_client")
+def crud_client_fixture(session):
+    """Aplicación con las rutas CRUD generadas para Hero"""
+    app = FastAPI()
+    for exception_class, handler in main_app.exception_handlers.items():
+        app.add_exception_handler(exception_class, handler)
+    app.include_router(
+        create_crud_router(
+            Hero,
+            prefix="/heroes",
+            create_schema=HeroCreate,
+            put_schema=HeroPut,
+            patch_schema=HeroPatch,
+            default_sort="name",
+        )
+    )
+
+    def get_test_session():
+        yield session
+
+    app.dependency_overrides[db.get_session] = get_test_session
+    return TestClient(app)
+
+
+class TestCrudRouterApi:
+    """Tests para las rutas generadas por create_crud_router"""
+
+    def test_create_and_read(self, crud_client):
+        """Debe crear la entidad y devolverla en el detalle"""
+        # Act
+        created = crud_client.post(
+            "/heroes", json={"name": "Thor", "age": 1500, "secret_name": "Odinson"}
+        )
+        hero_id = created.json()["data"]["id"]
+        response = crud_client.get(f"/heroes/{hero_id}")
+
+        # Assert
+        assert created.status_code == status.HTTP_201_CREATED
+        assert created.json()["status"]["message"] == "Hero created"
+        assert response.json()["data"]["name"] == "Thor"
+
+    def test_list_with_filter_sort_and_total(self, crud_client, multiple_heroes):
+        """Debe filtrar, ordenar y paginar como el listado de héroes"""
+        # Act
+        response = crud_client.get("/heroes?filter=age:gt:0&sort=name:desc&size=2")
+
+        # Assert
+        body = response.json()
+        names = [hero["name"] for hero in body["data"]["items"]]
+        assert response.status_code == status.HTTP_200_OK
+        assert names == sorted(names, reverse=True)
+        assert body["data"]["pagination"]["size"] == 2
+        assert body["data"]["pagination"]["total"] >= len(names)
+
+    def test_list_without_total(self, crud_client, multiple_heroes):
+        """Con include_total=false no debe devolver total"""
+        # Act
+        response = crud_client.get("/heroes?include_total=false&size=1")
+
+        # Assert
+        pagination = response.json()["data"]["pagination"]
+        assert pagination["total"] is None
+        assert pagination["has_next"] is True
+
+    def test_put_patch_and_delete(self, crud_client, hero_in_db):
+        """Debe actualizar y borrar la entidad"""
+        # Act
+        put = crud_client.put(
+            f"/heroes/{hero_in_db.id}",
+            json={"name": "New", "age": 40, "secret_name": "Secret"},
+        )
+        patch = crud_client.patch(f"/heroes/{hero_in_db.id}", json={"age": 41})
+        delete = crud_client.delete(f"/heroes/{hero_in_db.id}")
+        missing = crud_client.get(f"/heroes/{hero_in_db.id}")
+
+        # Assert
+        assert put.json()["data"]["name"] == "New"
+        assert patch.json()["data"]["age"] == 41
+        assert delete.status_code == status.HTTP_200_OK
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+        assert missing.json()["errors"] == [f"Hero with id {hero_in_db.id} not found"]
+
+    def test_invalid_filter_returns_400(self, crud_client):
+        """Debe validar el filtro con las clases generadas del modelo"""
+        # Act
+        response = crud_client.get("/heroes?filter=power:eq:1")
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestHeroesRouter:
+    """Tests para las rutas /heroes que monta la aplicación"""
+
+    def test_app_serves_generated_routes(self, client, hero_in_db):
+        """La aplicación debe servir el CRUD generado de Hero"""
+        # Act
+        response = client.get(f"/heroes/{hero_in_db.id}")
+        listing = client.get("/heroes?sort=name:asc")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["name"] == hero_in_db.name
+        assert [hero["id"] for hero in listing.json()["data"]["items"]] == [
+            str(hero_in_db.id)
+        ]
+
+
+class TestRepositoryForModel:
+    """Tests para los repositorios genéricos construidos una vez por modelo"""
+
+    def test_instances_share_strategies(self, session):
+        """Cada instancia debe enlazar solo la sesión"""
+        # Arrange
+        repository_class = BaseRepository.for_model(Hero, default_sort="name")
+
+        # Act
+        first, second = repository_class(session), repository_class(session)
+
+        # Assert
+        assert repository_class.__name__ == "HeroRepository"
+        assert first.filter_strategy is second.filter_strategy
+        assert first.sort_strategy is second.sort_strategy
+        assert first.session is session
+
+    def test_hero_repository_comes_from_the_cache(self):
+        """HeroRepository debe ser la clase cacheada de for_model"""
+        # Act
+        repository_class = BaseRepository.for_model(Hero, default_sort="name")
+
+        # Assert
+        assert repository_class is HeroRepository
+        assert BaseRepository.registry.count(HeroRepository) == 1
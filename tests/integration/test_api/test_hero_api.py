@@ -1,4 +1,5 @@
 from fastapi import status
+from sqlalchemy import event
 from uuid import uuid4
 
 
@@ -108,6 +109,83 @@ class TestHeroListEndpoint:
         # Verificar que todos tienen age >= 30
         assert all(hero["age"] >= 30 for hero in data["data"]["items"])
 
+    def test_get_heroes_filter_between(self, client, multiple_heroes):
+        """Debe filtrar por un rango inclusivo"""
+        # Act
+        response = client.get("/test/heroes?filter=age:between:35;45")
+
+        # Assert
+        ages = sorted(hero["age"] for hero in response.json()["data"]["items"])
+        assert ages == [35, 45]
+
+    def test_get_heroes_filter_by_updated_at(self, client, multiple_heroes):
+        """Debe filtrar por fecha de modificación relativa a ahora"""
+        # Act
+        recent = client.get("/test/heroes?filter=updated_at:ge:now-1h")
+        future = client.get("/test/heroes?filter=created_at:gt:now%2B1d")
+
+        # Assert
+        assert recent.json()["data"]["pagination"]["total"] == 4
+        assert future.json()["data"]["pagination"]["total"] == 0
+
+    def test_get_heroes_text_filters_ignore_dates(self, client, multiple_heroes):
+        """Un valor con forma de fecha en un campo de texto debe buscarse como texto"""
+        # Act
+        now = client.get("/test/heroes?filter=name:eq:Now")
+        date = client.get("/test/heroes?filter=secret_name:like:2024-01-01")
+
+        # Assert
+        assert now.status_code == 200
+        assert now.json()["data"]["pagination"]["total"] == 0
+        assert date.json()["data"]["pagination"]["total"] == 0
+
+    def test_get_heroes_invalid_date_filter(self, client, multiple_heroes):
+        """Debe rechazar un valor que no es fecha en un campo de fecha"""
+        # Act
+        response = client.get("/test/heroes?filter=created_at:ge:yesterday")
+
+        # Assert
+        assert response.status_code == 400
+
+    def test_get_heroes_without_total(self, client, multiple_heroes):
+        """Debe paginar sin total ni páginas con include_total=false"""
+        # Act
+        response = client.get("/test/heroes?page=1&size=3&include_total=false")
+
+        # Assert
+        pagination = response.json()["data"]["pagination"]
+        assert len(response.json()["data"]["items"]) == 3
+        assert pagination["total"] is None
+        assert pagination["pages"] is None
+        assert pagination["has_next"] is True
+
+    def test_get_heroes_without_total_last_page(self, client, multiple_heroes):
+        """Debe indicar que no hay siguiente en la última página"""
+        # Act
+        response = client.get("/test/heroes?page=2&size=2&include_total=false")
+
+        # Assert
+        pagination = response.json()["data"]["pagination"]
+        assert pagination["has_next"] is False
+        assert pagination["has_prev"] is True
+
+    def test_get_heroes_without_total_out_of_range(self, client, multiple_heroes):
+        """Debe retornar 404 si la página sin total está vacía"""
+        # Act
+        response = client.get("/test/heroes?page=5&size=2&include_total=false")
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_heroes_deep_page_rejected(self, client, multiple_heroes):
+        """Debe rechazar con 400 las páginas más allá de QUERY_MAX_OFFSET"""
+        # Act
+        response = client.get("/test/heroes?page=50000&size=100")
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "offset 4,999,900 exceeds" in response.json()["errors"][0]
+
 
 class TestHeroDetailEndpoint:
     """Tests para GET /test/heroes/{hero_id}"""
@@ -133,6 +211,72 @@ class TestHeroDetailEndpoint:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+class TestHeroBatchGetEndpoint:
+    """Tests para POST /test/heroes/batch-get"""
+
+    def test_batch_get_returns_items_in_request_order(self, client, multiple_heroes):
+        """Debe retornar los héroes en el orden de la petición"""
+        # Arrange
+        ids = [str(multiple_heroes[2].id), str(multiple_heroes[0].id)]
+
+        # Act
+        response = client.post("/test/heroes/batch-get", json={"ids": ids})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [hero["id"] for hero in data["data"]["items"]] == ids
+        assert data["data"]["missing"] == []
+
+    def test_batch_get_reports_missing_ids(self, client, hero_in_db):
+        """Debe listar los ids que no existen"""
+        # Arrange
+        missing_id = str(uuid4())
+
+        # Act
+        response = client.post(
+            "/test/heroes/batch-get", json={"ids": [missing_id, str(hero_in_db.id)]}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["data"]["items"]) == 1
+        assert data["data"]["missing"] == [missing_id]
+
+    def test_batch_get_uses_one_query(self, client, multiple_heroes, session, engine):
+        """Debe resolver todos los ids con una sola SELECT gracias al cargador"""
+        # Arrange
+        ids = [str(hero.id) for hero in multiple_heroes] + [str(uuid4())]
+        session.expire_all()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+
+        # Act
+        try:
+            response = client.post("/test/heroes/batch-get", json={"ids": ids})
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["data"]["items"]) == len(multiple_heroes)
+        selects = [sql for sql in statements if sql.lstrip().startswith("SELECT")]
+        assert len(selects) == 1
+
+    def test_batch_get_empty_ids(self, client):
+        """Debe retornar error 422 si no se envían ids"""
+        # Act
+        response = client.post("/test/heroes/batch-get", json={"ids": []})
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
 class TestHeroUpdateEndpoint:
     """Tests para PUT /test/heroes/{hero_id}"""
 
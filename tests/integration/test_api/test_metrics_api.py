@@ -0,0 +1,55 @@
+from fastapi import Depends, FastAPI, status
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+from app.core.thread_pool import measure_thread_wait, start_thread_wait
+from app.middleware.thread_pool import ThreadWaitHeaderMiddleware
+
+
+class TestMetricsEndpoint:
+    """Tests para GET /metrics"""
+
+    def test_metrics_include_thread_pool(self, client):
+        """Debe exponer el estado del pool de hilos"""
+        # Act
+        response = client.get("/metrics")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        thread_pool = response.json()["data"]["thread_pool"]
+        assert thread_pool["size"] == get_settings().thread_pool_size
+        assert {"active", "queued", "waits", "wait_ms_total"} <= thread_pool.keys()
+        assert thread_pool["wait_ms_histogram"]["le_inf"] == thread_pool["waits"]
+
+
+class TestThreadWaitHeader:
+    """Tests para la cabecera X-Thread-Wait-Ms"""
+
+    def _client(self, expose_header: bool) -> TestClient:
+        app = FastAPI(
+            dependencies=[Depends(start_thread_wait), Depends(measure_thread_wait)]
+        )
+        if expose_header:
+            app.add_middleware(ThreadWaitHeaderMiddleware)
+
+        @app.get("/sync")
+        def sync_route():
+            return "OK"
+
+        return TestClient(app)
+
+    def test_header_in_debug_mode(self):
+        """Debe añadir la espera por hilos de la petición en modo debug"""
+        # Act
+        response = self._client(expose_header=True).get("/sync")
+
+        # Assert
+        assert float(response.headers["x-thread-wait-ms"]) >= 0
+
+    def test_no_header_outside_debug_mode(self):
+        """No debe añadir la cabecera fuera del modo debug"""
+        # Act
+        response = self._client(expose_header=False).get("/sync")
+
+        # Assert
+        assert "x-thread-wait-ms" not in response.headers
@@ -0,0 +1,59 @@
+import pytest
+from fastapi import status
+
+from app.core.rate_limit import InMemoryRateLimitBackend, get_rate_limit_backend
+from app.main import app
+
+
+@pytest.fixture(name="rate_limited_client")
+def rate_limited_client_fixture(client):
+    """Cliente con un cubo de 6 tokens que casi no se recarga"""
+    backend = InMemoryRateLimitBackend(capacity=6, refill_rate=0.01)
+    app.dependency_overrides[get_rate_limit_backend] = lambda: backend
+    yield client
+
+
+class TestRateLimit:
+    """Tests para el límite de peticiones por cliente y ruta"""
+
+    def test_returns_rate_limit_headers(self, rate_limited_client, hero_in_db):
+        """Debe informar de los tokens restantes de la ruta"""
+        # Act
+        response = rate_limited_client.get(f"/test/heroes/{hero_in_db.id}")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ratelimit-limit"] == "6"
+        assert response.headers["ratelimit-remaining"] == "5"
+
+    def test_unfiltered_list_costs_more(self, rate_limited_client):
+        """Debe cobrar más el listado sin filtros que el filtrado"""
+        # Act
+        unfiltered = rate_limited_client.get("/test/heroes")
+        filtered = rate_limited_client.get("/test/heroes?filter=age:gt:1")
+
+        # Assert
+        assert unfiltered.headers["ratelimit-remaining"] == "1"
+        assert filtered.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_rejects_with_429_and_retry_after(self, rate_limited_client):
+        """Debe devolver 429 con Retry-After al agotar el cubo"""
+        # Arrange
+        rate_limited_client.get("/test/heroes")
+
+        # Act
+        response = rate_limited_client.get("/test/heroes")
+
+        # Assert
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response.headers["retry-after"]) >= 1
+        assert response.json()["status"]["code"] == 429
+
+    def test_disabled_by_default(self, client):
+        """No debe limitar ni añadir cabeceras si está desactivado"""
+        # Act
+        response = client.get("/test/heroes")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert "ratelimit-limit" not in response.headers
@@ -0,0 +1,54 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+from sqlalchemy import text
+
+from app.services.hero_service import HeroService
+
+SLOW_QUERY = text(
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c "
+    "WHERE x < 100000000) SELECT count(*) FROM c"
+)
+
+
+@pytest.fixture(name="slow_list")
+def slow_list_fixture(monkeypatch, session):
+    """Sustituye el listado por una consulta que tarda varios segundos"""
+    session.commit()
+
+    def slow_rows(self, *args, **kwargs):
+        self.repository.session.exec(SLOW_QUERY)
+        return [], 0
+
+    monkeypatch.setattr(HeroService, "get_hero_rows_with_count", slow_rows)
+
+
+class TestStatementTimeout:
+    """Tests para el plazo de las consultas de cada petición"""
+
+    def test_client_deadline_returns_504(self, client, slow_list):
+        """Debe devolver 504 si vence el plazo enviado por el cliente"""
+        # Act
+        response = client.get("/test/heroes", headers={"X-Request-Timeout-Ms": "50"})
+
+        # Assert
+        assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+        assert response.json()["errors"] == ["Request deadline exceeded"]
+
+    def test_route_timeout_returns_503(self, client, session, monkeypatch):
+        """Debe devolver 503 si vence el timeout corto de la ruta de detalle"""
+        # Arrange
+        session.commit()
+
+        def slow_detail(self, hero_id):
+            self.repository.session.exec(SLOW_QUERY)
+
+        monkeypatch.setattr(HeroService, "get_hero_by_id", slow_detail)
+
+        # Act
+        response = client.get(f"/test/heroes/{uuid4()}")
+
+        # Assert
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["errors"] == ["Database query timed out"]
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+from app.core.config import get_settings
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+MEASURE_IMPORT = (
+    "import time; start = time.perf_counter(); import app.main; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def run_python(code: str) -> str:
+    """Ejecuta código en un intérprete limpio y devuelve la última línea impresa"""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+class TestImportBudget:
+    """Gate de tiempo de importación de la aplicación"""
+
+    def test_import_app_main_within_budget(self):
+        """Importar app.main no debe superar IMPORT_BUDGET_MS"""
+        # Arrange
+        budget_ms = get_settings().import_budget_ms
+
+        # Act
+        elapsed_ms = min(float(run_python(MEASURE_IMPORT)) for _ in range(3))
+
+        # Assert
+        assert elapsed_ms < budget_ms
+
+    def test_import_models_does_not_build_filter_classes(self):
+        """Importar los modelos no debe generar las clases de filtro/orden"""
+        # Arrange
+        code = (
+            "import app.models.orm.hero as hero; "
+            "print(int('HeroFilter' in vars(hero) or 'HeroSort' in vars(hero)))"
+        )
+
+        # Act
+        built = run_python(code)
+
+        # Assert
+        assert built == "0"
@@ -0,0 +1,99 @@
+import time
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from app import main
+from app.core.config import Settings
+from app.db.database import Database
+from app.db.startup import (
+    SchemaOutOfDateError,
+    get_alembic_head,
+    prepare_database,
+    verify_schema,
+)
+
+
+@pytest.fixture
+def startup_database(tmp_path):
+    """Base SQLite en fichero para probar el arranque en frío"""
+    database = Database(f"sqlite:///{tmp_path / 'startup.db'}")
+    yield database
+    database.engine.dispose()
+
+
+def stamp(database: Database, revision: str) -> None:
+    with database.engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)")
+        )
+        connection.execute(
+            text("INSERT INTO alembic_version VALUES (:rev)"), {"rev": revision}
+        )
+
+
+class TestSchemaVerification:
+    """Tests para la verificación de la revisión de alembic al arrancar"""
+
+    def test_verify_schema_accepts_head_revision(self, startup_database):
+        """Debe arrancar si la base está en la revisión head"""
+        # Arrange
+        head = get_alembic_head("alembic.ini")
+        stamp(startup_database, head)
+
+        # Act & Assert
+        verify_schema(startup_database.engine, head)
+
+    def test_verify_schema_rejects_outdated_revision(self, startup_database):
+        """Debe fallar si la base no está en la revisión head"""
+        # Arrange
+        stamp(startup_database, "outdated")
+
+        # Act & Assert
+        with pytest.raises(SchemaOutOfDateError, match="outdated"):
+            verify_schema(startup_database.engine, get_alembic_head("alembic.ini"))
+
+    def test_verify_schema_rejects_unversioned_database(self, startup_database):
+        """Debe fallar si la base no tiene tabla alembic_version"""
+        # Act & Assert
+        with pytest.raises(SchemaOutOfDateError):
+            verify_schema(startup_database.engine, "head")
+
+
+class TestPrepareDatabase:
+    """Tests para las fases de arranque"""
+
+    def test_prepare_database_reports_phase_timings(self, startup_database):
+        """Debe devolver la duración de cada fase"""
+        # Arrange
+        settings = Settings(DB_STARTUP_MODE="create_all", DB_PREWARM_CONNECTIONS=2)
+
+        # Act
+        timings = prepare_database(startup_database, settings)
+
+        # Assert
+        assert set(timings) == {"schema", "pool", "statements"}
+        assert len(startup_database.engine._compiled_cache) > 0
+
+
+class TestColdStart:
+    """Gate de tiempo de arranque en frío hasta el primer byte"""
+
+    def test_cold_start_to_first_byte_within_budget(
+        self, startup_database, monkeypatch
+    ):
+        """Debe arrancar y servir la primera respuesta dentro del presupuesto"""
+        # Arrange
+        monkeypatch.setattr(main, "db", startup_database)
+        budget_ms = main.config.startup_budget_ms
+
+        # Act
+        start = time.perf_counter()
+        with TestClient(main.app) as client:
+            response = client.get("/health")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert "schema" in main.app.state.startup_timings
+        assert elapsed_ms < budget_ms
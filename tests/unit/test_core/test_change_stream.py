@@ -0,0 +1,276 @@
+import json
+import threading
+from unittest.mock import Mock
+
+import anyio
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.change_stream import (
+    ORIGIN,
+    ChangeBroadcaster,
+    ChangeEvent,
+    broadcaster,
+    stream_changes,
+)
+from app.db.notify_bridge import MAX_PAYLOAD_BYTES, PostgresNotifyBridge
+from app.models.orm.hero import Hero, HeroFilter
+from app.repositories.hero_repository import HeroRepository
+
+
+def hero_event(type: str = "created", **data) -> ChangeEvent:
+    data = {"id": "h1", "name": "Spider-Man", "age": 25, **data}
+    return ChangeEvent(type=type, model="Hero", entity_id=data["id"], data=data)
+
+
+class TestChangeBroadcaster:
+    """Tests para el difusor de cambios en proceso"""
+
+    def test_delivers_events_published_from_other_threads(self):
+        """Debe entregar en el bucle del suscriptor lo publicado desde un hilo"""
+        # Arrange
+        local = ChangeBroadcaster()
+        event = hero_event()
+
+        async def main():
+            with local.subscribe("Hero", max_queue=10) as subscription:
+                thread = threading.Thread(target=local.publish, args=(event,))
+                thread.start()
+                thread.join()
+                return await subscription.get(timeout=1)
+
+        # Act
+        received = anyio.run(main)
+
+        # Assert
+        assert received is event
+        assert local.metrics()["published"] == 1
+
+    def test_only_delivers_to_subscribers_of_the_model(self):
+        """No debe entregar eventos de otros modelos"""
+        # Arrange
+        local = ChangeBroadcaster()
+
+        async def main():
+            with local.subscribe("Villain", max_queue=10) as subscription:
+                local.publish(hero_event())
+                return await subscription.get(timeout=0.05)
+
+        # Act & Assert
+        assert anyio.run(main) is None
+
+    def test_marks_slow_subscribers_as_overflowed(self):
+        """Debe marcar la suscripción como desbordada si se llena la cola"""
+        # Arrange
+        local = ChangeBroadcaster()
+
+        async def main():
+            with local.subscribe("Hero", max_queue=1) as subscription:
+                local.publish(hero_event())
+                local.publish(hero_event())
+                await anyio.sleep(0.01)
+                return subscription.overflowed
+
+        # Act & Assert
+        assert anyio.run(main) is True
+        assert local.metrics()["overflows"] == 1
+
+    def test_receive_ignores_own_events(self):
+        """Debe descartar las notificaciones publicadas por este proceso"""
+        # Arrange
+        local = ChangeBroadcaster()
+        remote = hero_event()
+        remote.origin = "other-worker"
+
+        # Act
+        local.receive(hero_event())
+        local.receive(remote)
+
+        # Assert
+        assert local.metrics()["received"] == 1
+
+    def test_listeners_receive_local_and_remote_events(self):
+        """Debe llamar a los oyentes del modelo con cada evento entregado"""
+        # Arrange
+        local = ChangeBroadcaster()
+        received = []
+        local.add_listener("Hero", received.append)
+        remote = hero_event()
+        remote.origin = "other-worker"
+
+        # Act
+        local.publish(hero_event())
+        local.receive(remote)
+        local.publish(ChangeEvent("created", "Villain", "v1", None))
+
+        # Assert
+        assert [event.model for event in received] == ["Hero", "Hero"]
+        assert local.active is False
+
+    def test_inactive_without_subscribers_or_bridge(self):
+        """No debe haber trabajo de publicación si nadie escucha"""
+        # Arrange
+        local = ChangeBroadcaster()
+
+        # Act & Assert
+        assert local.active is False
+        local.bridge = object()
+        assert local.active is True
+
+
+class RecordingBridge:
+    """Puente que anota si cada envío llega dentro de una transacción abierta"""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, event, connection):
+        self.sent.append((event.type, connection.in_transaction()))
+
+
+class TestTransactionalBridge:
+    """Tests para el envío al puente dentro de la transacción del cambio"""
+
+    def test_repository_sends_before_commit(self, session, monkeypatch):
+        """Debe enviar cada evento en la transacción de la escritura"""
+        # Arrange
+        bridge = RecordingBridge()
+        monkeypatch.setattr(broadcaster, "bridge", bridge)
+        repository = HeroRepository(session)
+
+        # Act
+        hero = repository.create(Hero(name="Spider-Man", secret_name="Peter"))
+        repository.update_patch(hero.id, {"age": 26})
+        repository.delete(hero)
+
+        # Assert
+        assert bridge.sent == [("created", True), ("updated", True), ("deleted", True)]
+
+    def test_failed_commit_publishes_nothing_locally(self, session, monkeypatch):
+        """No debe entregar localmente un cambio que no llega a confirmarse"""
+        # Arrange
+        monkeypatch.setattr(broadcaster, "bridge", RecordingBridge())
+        repository = HeroRepository(session)
+        published = broadcaster.published
+        monkeypatch.setattr(
+            session, "commit", lambda: (_ for _ in ()).throw(SQLAlchemyError("boom"))
+        )
+
+        # Act & Assert
+        with pytest.raises(SQLAlchemyError):
+            repository.create(Hero(name="Spider-Man", secret_name="Peter"))
+        assert broadcaster.published == published
+
+
+class TestStreamChanges:
+    """Tests para la generación de eventos SSE"""
+
+    def test_streams_only_matching_events(self):
+        """Debe enviar solo los cambios que cumplen el filtro"""
+        # Arrange
+        filter_model = HeroFilter.from_string("age:gt:18")
+
+        async def main():
+            stream = stream_changes(Hero, filter_model, keepalive=1, max_queue=10)
+            assert await stream.__anext__() == ": connected\n\n"
+            broadcaster.publish(hero_event(id="young", age=12))
+            broadcaster.publish(hero_event(id="adult", age=30))
+            message = await stream.__anext__()
+            await stream.aclose()
+            return message
+
+        # Act
+        message = anyio.run(main)
+
+        # Assert
+        lines = message.strip().split("\n")
+        assert lines[1] == "event: created"
+        assert json.loads(lines[2].removeprefix("data: "))["entity_id"] == "adult"
+
+    def test_sends_keepalive_comments(self):
+        """Debe enviar un comentario si no hay eventos en el intervalo"""
+
+        # Arrange
+        async def main():
+            stream = stream_changes(Hero, None, keepalive=0.01, max_queue=10)
+            await stream.__anext__()
+            message = await stream.__anext__()
+            await stream.aclose()
+            return message
+
+        # Act & Assert
+        assert anyio.run(main) == ": keepalive\n\n"
+
+    def test_ends_with_overflow_event(self):
+        """Debe cerrar el stream si el cliente no consume a tiempo"""
+
+        # Arrange
+        async def main():
+            stream = stream_changes(Hero, None, keepalive=1, max_queue=1)
+            await stream.__anext__()
+            broadcaster.publish(hero_event())
+            broadcaster.publish(hero_event())
+            await anyio.sleep(0.01)
+            messages = [message async for message in stream]
+            return messages
+
+        # Act & Assert
+        assert anyio.run(main) == ["event: overflow\ndata: {}\n\n"]
+
+
+class TestPostgresNotifyBridge:
+    """Tests para la codificación de los eventos del puente LISTEN/NOTIFY"""
+
+    def test_roundtrip_delivers_remote_events(self):
+        """Debe reconstruir el evento y entregarlo como remoto"""
+        # Arrange
+        local = ChangeBroadcaster()
+        bridge = PostgresNotifyBridge(None, local, channel="entity_changes")
+        event = hero_event()
+        event.origin = "other-worker"
+
+        # Act
+        bridge.handle(bridge.encode(event))
+
+        # Assert
+        assert local.metrics()["received"] == 1
+        assert event.origin != ORIGIN
+
+    def test_drops_data_from_oversized_payloads(self):
+        """Debe quitar los datos si el payload supera el límite de NOTIFY"""
+        # Arrange
+        bridge = PostgresNotifyBridge(None, ChangeBroadcaster(), channel="c")
+        event = hero_event(secret_name="x" * MAX_PAYLOAD_BYTES)
+
+        # Act
+        payload = json.loads(bridge.encode(event))
+
+        # Assert
+        assert payload["data"] is None
+        assert payload["entity_id"] == "h1"
+
+    def test_send_notifies_on_the_given_connection(self):
+        """Debe hacer NOTIFY en la conexión del cambio, sin abrir otra"""
+        # Arrange
+        bridge = PostgresNotifyBridge(None, ChangeBroadcaster(), channel="c")
+        connection = Mock()
+
+        # Act
+        bridge.send(hero_event(), connection)
+
+        # Assert
+        statement, params = connection.execute.call_args.args
+        assert "pg_notify" in str(statement)
+        assert params["channel"] == "c"
+
+    def test_ignores_malformed_payloads(self):
+        """No debe fallar con notificaciones que no son eventos"""
+        # Arrange
+        local = ChangeBroadcaster()
+        bridge = PostgresNotifyBridge(None, local, channel="c")
+
+        # Act
+        bridge.handle("not json")
+
+        # Assert
+        assert local.metrics()["received"] == 0
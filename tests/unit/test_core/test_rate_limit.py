@@ -0,0 +1,172 @@
+import anyio
+import pytest
+
+from app.core import rate_limit as rate_limit_module
+from app.core.rate_limit import (
+    InMemoryRateLimitBackend,
+    RateLimitResult,
+    RedisRateLimitBackend,
+    TOKEN_BUCKET_SCRIPT,
+)
+
+
+class FakeRedis:
+    """
+    Servidor Redis falso con el subconjunto usado por el backend.
+
+    Ejecuta TOKEN_BUCKET_SCRIPT con una traducción directa a Python y
+    devuelve los valores como bytes, igual que redis-py.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def eval(self, script, numkeys, *keys_and_args):
+        assert script == TOKEN_BUCKET_SCRIPT
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        capacity, rate, cost = (float(arg) for arg in args)
+
+        state = self.hashes.get(keys[0], {})
+        tokens = float(state.get("tokens", capacity))
+        ts = float(state.get("ts", self.now))
+        tokens = min(capacity, tokens + max(0.0, self.now - ts) * rate)
+        allowed = 0
+        if tokens >= cost:
+            tokens -= cost
+            allowed = 1
+        self.hashes[keys[0]] = {"tokens": str(tokens), "ts": str(self.now)}
+        self.ttls[keys[0]] = int(-(-capacity / rate * 1000 // 1))
+        return [allowed, str(tokens).encode()]
+
+
+class TestInMemoryRateLimitBackend:
+    """Tests para los cubos de tokens en memoria"""
+
+    def test_allows_burst_up_to_capacity(self):
+        """Debe admitir hasta la capacidad y rechazar después"""
+        # Arrange
+        backend = InMemoryRateLimitBackend(capacity=3, refill_rate=0.001)
+
+        async def main():
+            return [(await backend.consume("client", 1)).allowed for _ in range(4)]
+
+        # Act
+        allowed = anyio.run(main)
+
+        # Assert
+        assert allowed == [True, True, True, False]
+
+    def test_cost_weights_consume_more_tokens(self):
+        """Debe descontar el coste de la petición"""
+        # Arrange
+        backend = InMemoryRateLimitBackend(capacity=10, refill_rate=0.001)
+
+        async def main():
+            await backend.consume("client", 7)
+            return await backend.consume("client", 5)
+
+        # Act
+        result = anyio.run(main)
+
+        # Assert
+        assert not result.allowed
+        assert result.tokens == pytest.approx(3, abs=0.01)
+
+    def test_refills_over_time(self, monkeypatch):
+        """Debe recuperar tokens según el ritmo de recarga"""
+        # Arrange
+        clock = [100.0]
+        monkeypatch.setattr(rate_limit_module, "monotonic", lambda: clock[0])
+        backend = InMemoryRateLimitBackend(capacity=2, refill_rate=1)
+
+        async def main():
+            await backend.consume("client", 2)
+            clock[0] += 1.5
+            return await backend.consume("client", 1)
+
+        # Act
+        result = anyio.run(main)
+
+        # Assert
+        assert result.allowed
+        assert result.tokens == pytest.approx(0.5)
+
+    def test_keys_are_independent(self):
+        """Debe llevar un cubo por clave"""
+        # Arrange
+        backend = InMemoryRateLimitBackend(capacity=1, refill_rate=0.001)
+
+        async def main():
+            await backend.consume("a", 1)
+            return await backend.consume("b", 1)
+
+        # Act & Assert
+        assert anyio.run(main).allowed
+
+
+class TestRedisRateLimitBackend:
+    """Tests para los cubos compartidos en Redis contra un servidor falso"""
+
+    def test_consumes_shared_bucket(self):
+        """Debe compartir el cubo entre instancias (workers)"""
+        # Arrange
+        redis = FakeRedis()
+        worker_a = RedisRateLimitBackend(redis, capacity=2, refill_rate=1)
+        worker_b = RedisRateLimitBackend(redis, capacity=2, refill_rate=1)
+
+        async def main():
+            await worker_a.consume("client", 1)
+            await worker_b.consume("client", 1)
+            return await worker_a.consume("client", 1)
+
+        # Act
+        result = anyio.run(main)
+
+        # Assert
+        assert not result.allowed
+        assert result.retry_after == pytest.approx(1)
+
+    def test_uses_prefixed_key_with_ttl(self):
+        """Debe guardar el cubo con prefijo y caducidad de un rellenado"""
+        # Arrange
+        redis = FakeRedis()
+        backend = RedisRateLimitBackend(redis, capacity=10, refill_rate=2)
+
+        # Act
+        anyio.run(backend.consume, "client", 3)
+
+        # Assert
+        assert redis.hashes["ratelimit:client"]["tokens"] == "7.0"
+        assert redis.ttls["ratelimit:client"] == 5000
+
+
+class TestRateLimitResult:
+    """Tests para las cabeceras de límite"""
+
+    def test_headers_when_allowed(self):
+        """Debe informar del límite, los restantes y el reinicio"""
+        # Arrange
+        result = RateLimitResult(True, limit=10, tokens=6.5, refill_rate=0.5, cost=1)
+
+        # Act
+        headers = dict(result.headers())
+
+        # Assert
+        assert headers == {
+            b"ratelimit-limit": b"10",
+            b"ratelimit-remaining": b"6",
+            b"ratelimit-reset": b"7",
+        }
+
+    def test_retry_after_when_rejected(self):
+        """Debe añadir Retry-After al rechazar"""
+        # Arrange
+        result = RateLimitResult(False, limit=10, tokens=1, refill_rate=0.5, cost=3)
+
+        # Act
+        headers = dict(result.headers())
+
+        # Assert
+        assert headers[b"retry-after"] == b"4"
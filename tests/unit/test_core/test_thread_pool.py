@@ -0,0 +1,122 @@
+import threading
+from types import SimpleNamespace
+
+import anyio
+from anyio import to_thread
+
+from app.core.thread_pool import (
+    THREAD_WAIT_MS,
+    ThreadWaitStats,
+    configure_thread_limiter,
+    measure_thread_wait,
+    start_thread_wait,
+    thread_pool_metrics,
+    thread_wait_stats,
+)
+
+
+class TestConfigureThreadLimiter:
+    """Tests para la configuración del pool de hilos"""
+
+    def test_sets_default_limiter_size(self):
+        """Debe ajustar el tamaño del limitador por defecto sin sustituirlo"""
+
+        # Arrange
+        async def main():
+            default = to_thread.current_default_thread_limiter()
+            configured = configure_thread_limiter(3)
+            return default, configured, to_thread.current_default_thread_limiter()
+
+        # Act
+        default, configured, current = anyio.run(main)
+
+        # Assert
+        assert default is configured is current
+        assert current.total_tokens == 3
+
+
+class TestThreadPoolMetrics:
+    """Tests para las métricas del pool de hilos"""
+
+    def test_reports_active_and_queued(self):
+        """Debe contar los hilos ocupados y las tareas en cola"""
+        # Arrange
+        release = threading.Event()
+        snapshot = {}
+
+        async def main():
+            configure_thread_limiter(1)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(to_thread.run_sync, release.wait)
+                await anyio.sleep(0.01)
+                tg.start_soon(to_thread.run_sync, lambda: None)
+                await anyio.sleep(0.05)
+                snapshot.update(thread_pool_metrics())
+                release.set()
+
+            return thread_pool_metrics()
+
+        # Act
+        metrics = anyio.run(main)
+
+        # Assert
+        assert (snapshot["size"], snapshot["active"], snapshot["queued"]) == (1, 1, 1)
+        assert metrics["queued"] == 0
+
+
+class TestThreadWait:
+    """Tests para la medición de la espera por un hilo libre"""
+
+    def test_measures_wait_for_a_busy_pool(self):
+        """Debe medir en el hilo el tiempo que la petición esperó por él"""
+        # Arrange
+        release = threading.Event()
+        request = SimpleNamespace(state=SimpleNamespace())
+        waits_before = thread_wait_stats.waits
+
+        async def main():
+            configure_thread_limiter(1)
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(to_thread.run_sync, release.wait)
+                await anyio.sleep(0.01)
+                await start_thread_wait(request)
+                tg.start_soon(to_thread.run_sync, measure_thread_wait, request)
+                await anyio.sleep(0.05)
+                release.set()
+
+        # Act
+        anyio.run(main)
+
+        # Assert
+        assert getattr(request.state, THREAD_WAIT_MS) >= 40
+        assert thread_wait_stats.waits == waits_before + 1
+
+    def test_without_start_does_not_record(self):
+        """Sin la dependencia asíncrona previa no debe anotar nada"""
+        # Arrange
+        stats_before = thread_wait_stats.waits
+        request = SimpleNamespace(state=SimpleNamespace())
+
+        # Act
+        measure_thread_wait(request)
+
+        # Assert
+        assert thread_wait_stats.waits == stats_before
+        assert not hasattr(request.state, THREAD_WAIT_MS)
+
+    def test_stats_build_cumulative_histogram(self):
+        """Debe acumular el total, el máximo y el histograma de las esperas"""
+        # Arrange
+        stats = ThreadWaitStats(buckets_ms=(1, 10))
+
+        # Act
+        for seconds in (0.0005, 0.005, 0.05):
+            stats.record(seconds)
+        metrics = stats.metrics()
+
+        # Assert
+        assert metrics["waits"] == 3
+        assert metrics["wait_ms_total"] == 55.5
+        assert metrics["wait_ms_max"] == 50
+        assert metrics["wait_ms_histogram"] == {"le_1": 1, "le_10": 2, "le_inf": 3}
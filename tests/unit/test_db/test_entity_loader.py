@@ -0,0 +1,97 @@
+from unittest.mock import Mock
+from app.db.entity_loader import EntityLoader, ENTITY_LOADER_KEY, get_entity_loader
+from app.models.orm.hero import Hero
+
+
+def counting_batch_fn(loader: EntityLoader, result: dict) -> Mock:
+    """Función de carga que anota una consulta por llamada, como _fetch_many"""
+    return Mock(side_effect=lambda ids: loader.record_queries() or result)
+
+
+class TestEntityLoader:
+    """Tests para el cargador de entidades por petición"""
+
+    def test_load_memoizes_missing_entities(self):
+        """Debe memorizar los ids no encontrados"""
+        # Arrange
+        loader = EntityLoader()
+        batch_fn = Mock(return_value={})
+
+        # Act
+        loader.load(Hero, 1, batch_fn)
+        result = loader.load(Hero, 1, batch_fn)
+
+        # Assert
+        assert result is None
+        batch_fn.assert_called_once()
+
+    def test_found_entities_are_left_to_the_session(self):
+        """Debe volver a pedir las entidades encontradas (el identity map las reutiliza)"""
+        # Arrange
+        loader = EntityLoader()
+        batch_fn = Mock(return_value={1: "hero"})
+
+        # Act
+        loader.load(Hero, 1, batch_fn)
+        loader.load(Hero, 1, batch_fn)
+
+        # Assert
+        assert batch_fn.call_count == 2
+
+    def test_scheduled_ids_are_coalesced(self):
+        """Debe resolver todos los ids encolados con una sola consulta"""
+        # Arrange
+        loader = EntityLoader()
+        batch_fn = counting_batch_fn(loader, {1: "a", 2: "b", 3: "c"})
+        loader.schedule(Hero, [1, 2, 3])
+
+        # Act
+        first = loader.load(Hero, 1, batch_fn)
+
+        # Assert
+        assert first == "a"
+        batch_fn.assert_called_once_with([1, 2, 3])
+        assert loader.queries_executed == 1
+        assert [loader.take_prefetched(Hero, entity_id) for entity_id in (1, 2, 3)] == [
+            False,
+            True,
+            True,
+        ]
+
+    def test_queries_saved_against_baseline(self):
+        """Debe calcular las consultas ahorradas respecto a las de una en una"""
+        # Arrange
+        loader = EntityLoader()
+        batch_fn = counting_batch_fn(loader, {1: "a", 2: "b"})
+
+        # Act
+        loader.record_baseline(2)
+        loader.load_many(Hero, [1, 2], batch_fn)
+
+        # Assert
+        assert (loader.queries_executed, loader.queries_saved) == (1, 1)
+
+    def test_forget_marks_entity_as_missing(self):
+        """Una entidad olvidada (borrada) no debe volver a consultarse"""
+        # Arrange
+        loader = EntityLoader()
+        batch_fn = Mock(return_value={1: "hero"})
+
+        # Act
+        loader.forget(Hero, 1)
+        result = loader.load(Hero, 1, batch_fn)
+
+        # Assert
+        assert result is None
+        batch_fn.assert_not_called()
+
+    def test_get_entity_loader_from_session(self, session):
+        """Debe obtener el cargador asociado a la sesión"""
+        # Arrange
+        loader = EntityLoader()
+        session.info[ENTITY_LOADER_KEY] = loader
+
+        # Act & Assert
+        assert get_entity_loader(session) is loader
+        session.info.pop(ENTITY_LOADER_KEY)
+        assert get_entity_loader(session) is None
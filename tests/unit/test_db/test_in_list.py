@@ -0,0 +1,155 @@
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.db.in_list import in_list
+from app.enums.filter import FilterOperator
+from app.models.orm.hero import Hero
+from app.repositories.strategies.generic_filter_strategy import GenericFilterStrategy
+
+
+class HeroField(str, Enum):
+    AGE = "age"
+
+
+@pytest.fixture(name="heroes_engine")
+def heroes_engine_fixture():
+    """SQLite en memoria con 100 héroes"""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            Hero(name=f"Hero {i}", age=i, secret_name=f"Secret {i}") for i in range(100)
+        )
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+class TestInListCompilation:
+    """Tests para el SQL generado por in_list en cada motor"""
+
+    def test_postgresql_binds_one_array(self):
+        """En PostgreSQL debe usar = ANY con un único parámetro de tipo array"""
+        # Arrange
+        query = select(Hero.id).where(in_list(Hero.age, list(range(5_000))))
+
+        # Act
+        compiled = query.compile(dialect=postgresql.dialect())
+
+        # Assert
+        assert "hero.age = ANY (CAST(" in str(compiled)
+        assert "AS INTEGER[])" in str(compiled)
+        assert list(compiled.params.values()) == [list(range(5_000))]
+
+    def test_postgresql_not_in_uses_all(self):
+        """NOT IN debe compilar a != ALL"""
+        # Act
+        sql = str(
+            select(Hero.id)
+            .where(~in_list(Hero.age, [1, 2]))
+            .compile(dialect=postgresql.dialect())
+        )
+
+        # Assert
+        assert "hero.age != ALL (CAST(" in sql
+
+    def test_sqlite_uses_json_each(self):
+        """En SQLite debe leer la lista con json_each, sin '= 1'"""
+        # Act
+        sql = str(
+            select(Hero.id)
+            .where(in_list(Hero.age, [1, 2]), Hero.age > 0)
+            .compile(dialect=sqlite.dialect())
+        )
+
+        # Assert
+        assert "hero.age IN (SELECT value FROM json_each(?)) AND" in sql
+
+    def test_same_sql_for_any_length(self):
+        """El SQL no debe depender de la longitud de la lista"""
+        # Act
+        short, long = (
+            str(
+                select(Hero.id)
+                .where(in_list(Hero.age, list(range(size))))
+                .compile(dialect=postgresql.dialect())
+            )
+            for size in (3, 30_000)
+        )
+
+        # Assert
+        assert short == long
+
+    def test_other_dialects_expand(self):
+        """En otros motores debe expandirse como un IN normal"""
+        # Act
+        sql = str(
+            select(Hero.id)
+            .where(~in_list(Hero.age, [1, 2]))
+            .compile(
+                dialect=mysql.dialect(), compile_kwargs={"render_postcompile": True}
+            )
+        )
+
+        # Assert
+        assert "hero.age NOT IN (%s, %s)" in sql
+
+
+class TestInListExecution:
+    """Tests de in_list contra SQLite"""
+
+    def test_matches_uuid_ids(self, heroes_engine):
+        """Debe convertir los UUID como la columna antes de serializarlos"""
+        # Arrange
+        with Session(heroes_engine) as session:
+            ids = session.exec(select(Hero.id).order_by(Hero.age)).all()[:40]
+
+            # Act
+            found = session.exec(select(Hero.id).where(in_list(Hero.id, ids))).all()
+
+        # Assert
+        assert set(found) == set(ids)
+
+    def test_not_in(self, heroes_engine):
+        """Debe excluir los valores de la lista"""
+        # Act
+        with Session(heroes_engine) as session:
+            ages = session.exec(
+                select(Hero.age).where(~in_list(Hero.age, list(range(10, 100))))
+            ).all()
+
+        # Assert
+        assert sorted(ages) == list(range(10))
+
+    def test_cached_statement_uses_new_values(self, heroes_engine):
+        """La sentencia cacheada debe usar los valores de cada ejecución"""
+        # Act
+        with Session(heroes_engine) as session:
+            first = session.exec(select(Hero.age).where(in_list(Hero.age, [1]))).all()
+            second = session.exec(
+                select(Hero.age).where(in_list(Hero.age, [2, 3]))
+            ).all()
+
+        # Assert
+        assert first == [1]
+        assert sorted(second) == [2, 3]
+
+    def test_filter_strategy_with_large_list(self, heroes_engine):
+        """El filtro in debe aceptar listas mayores que el límite de parámetros"""
+        # Arrange
+        ages = list(range(40_000))
+        filter_model = SimpleNamespace(
+            filters=[(HeroField.AGE, FilterOperator.IN, ages)]
+        )
+        query = GenericFilterStrategy(Hero).apply(select(Hero.age), filter_model)
+
+        # Act
+        with Session(heroes_engine) as session:
+            found = session.exec(query).all()
+
+        # Assert
+        assert sorted(found) == list(range(100))
@@ -0,0 +1,194 @@
+from datetime import date, timedelta
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.db.partitioning import (
+    add_months,
+    attach_partition,
+    create_partitions,
+    id_time_check_sql,
+    partition_bounds,
+    partition_bounds_for_ids,
+    partitioned_tables,
+)
+from app.enums.filter import FilterOperator
+from app.models.orm.base import PartitionedSQLModel
+from app.models.orm.hero import Hero
+from app.repositories.strategies.generic_filter_strategy import GenericFilterStrategy
+from app.utils.uuid7 import uuid7, uuid7_datetime
+
+
+@pytest.fixture(name="event_model", scope="module")
+def event_model_fixture():
+    """Modelo particionado de prueba, retirado de los metadatos al terminar"""
+
+    class PartitionedEvent(PartitionedSQLModel, table=True):
+        name: str
+
+    yield PartitionedEvent
+    SQLModel.metadata.remove(PartitionedEvent.__table__)
+
+
+class EventField(str, Enum):
+    ID = "id"
+
+
+class RecordingExecutor:
+    """Sustituto de una conexión u `op` de alembic que guarda las sentencias"""
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    def execute(self, statement):
+        self.statements.append(str(statement))
+
+
+class TestPartitionedSQLModel:
+    """Tests para la declaración de tablas particionadas"""
+
+    def test_postgres_ddl_partitions_by_created_at(self, event_model):
+        """Debe declarar PARTITION BY RANGE y la clave (id, created_at)"""
+        # Act
+        ddl = str(
+            CreateTable(event_model.__table__).compile(dialect=postgresql.dialect())
+        )
+
+        # Assert
+        assert "PARTITION BY RANGE (created_at)" in ddl
+        assert "PRIMARY KEY (id, created_at)" in ddl
+        assert "CONSTRAINT partitionedevent_id_time CHECK" in ddl
+        assert event_model.__table__ in partitioned_tables(SQLModel.metadata)
+        assert Hero.__table__ not in partitioned_tables(SQLModel.metadata)
+
+    def test_orm_identity_is_only_the_id(self, event_model):
+        """El ORM debe seguir identificando las filas solo por id"""
+        # Arrange
+        engine = create_engine("sqlite://")
+        event_model.__table__.create(engine)
+
+        # Act
+        with Session(engine) as session:
+            event = event_model(name="launch")
+            event_id = event.id
+            session.add(event)
+            session.commit()
+            session.expunge_all()
+            loaded = session.get(event_model, event_id)
+
+        # Assert
+        assert loaded.name == "launch"
+        assert loaded.created_at is not None
+
+    def test_id_time_check_bounds_created_at_by_the_id(self):
+        """El CHECK debe exigir que created_at esté a menos del margen del id v7"""
+        # Act
+        condition = id_time_check_sql("created_at", skew_hours=6)
+
+        # Assert
+        assert condition.startswith(
+            "substr(id::text, 15, 1) <> '7' OR created_at BETWEEN"
+        )
+        assert "- interval '6 hours' AND" in condition
+        assert condition.endswith("+ interval '6 hours'")
+
+
+class TestPartitionDdl:
+    """Tests para los helpers de creación de particiones"""
+
+    def test_add_months_crosses_years(self):
+        """Debe pasar de diciembre a enero del año siguiente"""
+        # Act & Assert
+        assert add_months(date(2025, 11, 15), 2) == date(2026, 1, 1)
+
+    def test_create_partitions_until_months_ahead(self):
+        """Debe crear una partición por mes hasta `months_ahead` meses vista"""
+        # Arrange
+        executor = RecordingExecutor()
+
+        # Act
+        names = create_partitions(
+            executor,
+            "hero",
+            date(2025, 11, 20),
+            months_ahead=2,
+            today=date(2025, 12, 3),
+        )
+
+        # Assert
+        assert names == ["hero_p202511", "hero_p202512", "hero_p202601", "hero_p202602"]
+        assert executor.statements[0] == (
+            'CREATE TABLE IF NOT EXISTS "hero_p202511" PARTITION OF "hero" '
+            "FOR VALUES FROM ('2025-11-01') TO ('2025-12-01')"
+        )
+
+    def test_attach_partition_validates_with_check_constraint(self):
+        """Debe añadir los CHECK del rango y del id y retirar solo el del rango"""
+        # Arrange
+        executor = RecordingExecutor()
+
+        # Act
+        attach_partition(executor, "hero", "hero_load", date(2026, 3, 9))
+
+        # Assert
+        add, attach, drop = executor.statements
+        assert "CHECK (created_at >= '2026-03-01' AND created_at < '2026-04-01')" in add
+        assert f'ADD CONSTRAINT "hero_id_time" CHECK ({id_time_check_sql()})' in add
+        assert attach == (
+            'ALTER TABLE "hero" ATTACH PARTITION "hero_load" '
+            "FOR VALUES FROM ('2026-03-01') TO ('2026-04-01')"
+        )
+        assert drop.endswith('DROP CONSTRAINT "hero_load_range"')
+
+
+class TestPartitionBounds:
+    """Tests para las cotas de created_at deducidas de los ids"""
+
+    def test_id_filters_bound_created_at(self, event_model):
+        """Debe acotar created_at alrededor de la marca de tiempo del id"""
+        # Arrange
+        entity_id = uuid7()
+        created = uuid7_datetime(entity_id)
+
+        # Act
+        lower, upper = partition_bounds(
+            event_model, [("id", FilterOperator.EQ, str(entity_id))]
+        )
+
+        # Assert
+        assert lower.right.value == created - timedelta(hours=24)
+        assert upper.right.value == created + timedelta(hours=24)
+
+    def test_range_filters_give_one_sided_bounds(self, event_model):
+        """Un filtro id:gt solo debe dar la cota inferior"""
+        # Act
+        bounds = partition_bounds(event_model, [("id", FilterOperator.GT, uuid7())])
+
+        # Assert
+        assert len(bounds) == 1
+        assert bounds[0].operator.__name__ == "ge"
+
+    def test_no_bounds_for_other_fields_or_unpartitioned_models(self, event_model):
+        """No debe añadir condiciones si no se filtra por id o no hay particiones"""
+        # Act & Assert
+        assert partition_bounds(event_model, [("name", FilterOperator.EQ, "x")]) == []
+        assert partition_bounds_for_ids(Hero, [uuid7()]) == []
+
+    def test_filter_strategy_adds_bounds(self, event_model):
+        """La estrategia de filtrado debe emitir las cotas en la consulta"""
+        # Arrange
+        strategy = GenericFilterStrategy(event_model)
+        filter_model = SimpleNamespace(
+            filters=[(EventField.ID, FilterOperator.EQ, str(uuid7()))]
+        )
+
+        # Act
+        query = str(strategy.apply(select(event_model), filter_model))
+
+        # Assert
+        assert "created_at >=" in query
+        assert "created_at <=" in query
@@ -0,0 +1,215 @@
+import json
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import select
+
+from app.db import query_guard as query_guard_module
+from app.db.query_guard import QueryEstimate, QueryGuard, explain_sql, parse_plan
+from app.exceptions.query import QueryTooExpensiveException
+from app.models.orm.hero import Hero, HeroFilter, HeroSort
+
+QUERY = select(Hero).order_by(Hero.secret_name).limit(20)
+
+
+def postgres_session(cost: float, rows: int) -> Mock:
+    """Sesión de PostgreSQL simulada cuyo EXPLAIN devuelve el coste indicado"""
+    plan = [{"Plan": {"Node Type": "Limit", "Total Cost": cost, "Plan Rows": rows}}]
+    session = Mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.begin_nested.return_value = nullcontext()
+    connection = session.connection.return_value
+    connection.dialect = postgresql.dialect()
+    connection.exec_driver_sql.return_value.scalar_one.return_value = plan
+    return session
+
+
+@pytest.fixture(name="guard")
+def guard_fixture(monkeypatch):
+    """Guarda con límites pequeños y conocidos"""
+    monkeypatch.setattr(query_guard_module.config, "query_max_filter_terms", 2)
+    monkeypatch.setattr(query_guard_module.config, "query_max_sort_terms", 1)
+    monkeypatch.setattr(query_guard_module.config, "query_max_in_list", 3)
+    monkeypatch.setattr(query_guard_module.config, "query_max_offset", 100)
+    monkeypatch.setattr(query_guard_module.config, "query_max_cost", 1_000)
+    return QueryGuard(cache_size=2)
+
+
+class TestStaticLimits:
+    """Tests para los límites que no necesitan EXPLAIN"""
+
+    @pytest.mark.parametrize(
+        "filter_str, sort_str, offset, reason",
+        [
+            ("age:gt:1,age:lt:9,name:like:a", None, 0, "3 filter terms"),
+            ("age:in:1;2;3;4", None, 0, "4 values in 'age:in'"),
+            (None, "age:asc,name:asc", 0, "2 sort terms"),
+            (None, None, 101, "offset 101 exceeds 100"),
+        ],
+    )
+    def test_rejects_over_limit(self, guard, filter_str, sort_str, offset, reason):
+        """Debe rechazar con el motivo en el mensaje"""
+        # Arrange
+        session = Mock()
+
+        # Act & Assert
+        with pytest.raises(QueryTooExpensiveException, match=reason) as exc_info:
+            guard.check_page(
+                session,
+                Hero,
+                HeroFilter.from_string(filter_str),
+                HeroSort.from_string(sort_str),
+                offset,
+                QUERY,
+            )
+        assert exc_info.value.status_code == 400
+        session.connection.assert_not_called()
+
+    def test_skips_explain_outside_postgres(self, guard, session):
+        """En SQLite solo aplica los límites estáticos"""
+        # Act
+        guard.check_page(session, Hero, HeroFilter.from_string(None), None, 0, QUERY)
+
+        # Assert
+        assert guard.explains == 0
+
+
+class TestCostEstimate:
+    """Tests para el rechazo por coste estimado con EXPLAIN"""
+
+    def test_rejects_expensive_page(self, guard):
+        """Debe rechazar la página con la estimación en el mensaje"""
+        # Arrange
+        session = postgres_session(cost=250_000, rows=20)
+
+        # Act & Assert
+        with pytest.raises(QueryTooExpensiveException, match="estimated cost 250,000"):
+            guard.check_page(
+                session, Hero, None, HeroSort.from_string("secret_name:asc"), 0, QUERY
+            )
+
+    def test_estimates_once_per_shape(self, guard):
+        """Debe reutilizar la estimación para filtros con la misma forma"""
+        # Arrange
+        session = postgres_session(cost=10, rows=20)
+
+        # Act
+        for age in (18, 30, 65):
+            guard.check_page(
+                session, Hero, HeroFilter.from_string(f"age:gt:{age}"), None, 0, QUERY
+            )
+        guard.check_page(
+            session, Hero, HeroFilter.from_string("age:lt:5"), None, 0, QUERY
+        )
+
+        # Assert
+        assert guard.explains == 2
+        assert guard.cache_hits == 2
+
+    def test_evicts_least_recent_shapes(self, guard):
+        """Debe respetar el tamaño de la caché"""
+        # Arrange
+        session = postgres_session(cost=10, rows=20)
+
+        # Act
+        for offset in (0, 1, 2, 4):
+            guard.check_page(session, Hero, None, None, offset, QUERY)
+
+        # Assert
+        assert guard.metrics()["cached_shapes"] == 2
+
+    def test_failed_explain_does_not_block(self, guard):
+        """Si EXPLAIN falla la consulta no se rechaza"""
+        # Arrange
+        session = postgres_session(cost=10, rows=20)
+        session.connection().exec_driver_sql().scalar_one.return_value = []
+
+        # Act & Assert (no debe lanzar excepción)
+        guard.check_page(session, Hero, None, None, 0, QUERY)
+
+    def test_estimated_count_when_expensive(self, guard):
+        """Debe sustituir el COUNT caro por las filas estimadas"""
+        # Act
+        expensive = guard.estimated_count(
+            postgres_session(cost=5_000, rows=1_234_567), Hero, None, QUERY
+        )
+        cheap = guard.estimated_count(
+            postgres_session(cost=50, rows=10),
+            Hero,
+            HeroFilter.from_string("age:gt:1"),
+            QUERY,
+        )
+
+        # Assert
+        assert expensive == 1_234_567
+        assert cheap is None
+
+    def test_cost_limit_zero_disables_explain(self, guard, monkeypatch):
+        """Con QUERY_MAX_COST=0 no debe ejecutar EXPLAIN"""
+        # Arrange
+        monkeypatch.setattr(query_guard_module.config, "query_max_cost", 0)
+        session = postgres_session(cost=5_000_000, rows=20)
+
+        # Act
+        guard.check_page(session, Hero, None, None, 0, QUERY)
+
+        # Assert
+        session.connection.assert_not_called()
+
+
+class TestExplain:
+    """Tests para la sentencia EXPLAIN y su salida"""
+
+    def test_compiles_for_postgres(self):
+        """Debe anteponer EXPLAIN (FORMAT JSON) a la consulta"""
+        # Act
+        sql, params = explain_sql(QUERY, postgresql.dialect())
+
+        # Assert
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT hero.id")
+        assert "LIMIT %(param_1)s" in sql
+        assert params == {"param_1": 20}
+
+    def test_processes_parameters_like_the_query(self):
+        """Debe convertir los parámetros con el procesador de su tipo"""
+        # Arrange
+        entity_id = uuid4()
+        query = select(Hero).where(Hero.id == entity_id, Hero.age.in_([1, 2]))
+
+        # Act
+        sql, params = explain_sql(query, sqlite.dialect())
+
+        # Assert
+        assert "hero.age IN (?, ?)" in sql
+        assert params == (entity_id.hex, 1, 2)
+
+    def test_parse_plan_from_text(self):
+        """Debe leer el coste y las filas del nodo raíz"""
+        # Arrange
+        plan = json.dumps([{"Plan": {"Total Cost": 12.5, "Plan Rows": 40}}])
+
+        # Act & Assert
+        assert parse_plan(plan) == QueryEstimate(cost=12.5, rows=40)
+
+
+class TestRepositoryGuard:
+    """Tests de la guarda desde BaseRepository"""
+
+    def test_count_uses_estimate(self, hero_repository, monkeypatch):
+        """count debe devolver la estimación si contar es demasiado caro"""
+        # Arrange
+        monkeypatch.setattr(
+            query_guard_module.query_guard,
+            "estimated_count",
+            lambda *args: 1_000_000,
+        )
+
+        # Act & Assert
+        assert hero_repository.count() == 1_000_000
+        assert hero_repository.get_filtered_rows_with_count(
+            SimpleNamespace(filters=[]), 0, 10
+        ) == ([], 1_000_000)
@@ -0,0 +1,198 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import SingletonThreadPool
+from sqlmodel import func, select
+
+from app.db.database import Database
+from app.db.sqlite_profile import RoutingSession, SQLiteProfile, WALCheckpointer
+from app.models.orm.hero import Hero
+from app.repositories.hero_repository import HeroRepository
+
+
+@pytest.fixture(name="profiled_database")
+def profiled_database_fixture(tmp_path):
+    """Archivo SQLite con el perfil de producción y tres lectores"""
+    database = Database(
+        f"sqlite:///{tmp_path / 'heroes.db'}",
+        pool_size=3,
+        sqlite_profile=SQLiteProfile(busy_timeout_ms=2000, mmap_size_mb=64),
+    )
+    database.create_db_and_tables()
+    yield database
+    database.dispose()
+
+
+def pragma(engine, name: str):
+    with engine.connect() as connection:
+        return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+class TestSQLiteConnections:
+    """Tests para los motores y PRAGMAs del perfil SQLite"""
+
+    def test_pragmas_are_applied_to_every_connection(self, profiled_database):
+        """Debe activar WAL, synchronous=NORMAL, busy_timeout y mmap"""
+        # Arrange
+        engines = [profiled_database.engine, profiled_database.read_engine]
+
+        # Act
+        settings = [
+            [pragma(engine, name) for name in ("journal_mode", "synchronous")]
+            + [pragma(engine, name) for name in ("busy_timeout", "mmap_size")]
+            for engine in engines
+        ]
+
+        # Assert
+        assert settings == [["wal", 1, 2000, 64 * 1024 * 1024]] * 2
+
+    def test_single_writer_and_read_only_readers(self, profiled_database):
+        """Debe usar una conexión de escritura y pool_size lectores de solo lectura"""
+        # Act & Assert
+        assert profiled_database.engine.pool.size() == 1
+        assert profiled_database.read_engine.pool.size() == 3
+        assert pragma(profiled_database.engine, "query_only") == 0
+        assert pragma(profiled_database.read_engine, "query_only") == 1
+
+    def test_reader_rejects_writes(self, profiled_database):
+        """Debe fallar una escritura enviada al motor de lectura"""
+        # Act & Assert
+        with pytest.raises(OperationalError, match="readonly"):
+            with profiled_database.read_engine.begin() as connection:
+                connection.execute(
+                    text(
+                        "INSERT INTO hero (id, name, secret_name) VALUES (1, 'a', 'b')"
+                    )
+                )
+
+    def test_in_memory_database_ignores_profile(self):
+        """Debe usar un único motor para SQLite en memoria"""
+        # Arrange
+        database = Database("sqlite://", sqlite_profile=SQLiteProfile())
+
+        # Act & Assert
+        assert database.sqlite_profile is None
+        assert database.read_engine is database.engine
+        assert isinstance(database.engine.pool, SingletonThreadPool)
+        assert type(database.new_session()) is not RoutingSession
+
+
+class TestRoutingSession:
+    """Tests para el reparto de consultas entre escritor y lectores"""
+
+    def test_reads_use_reader_and_flush_uses_writer(self, profiled_database):
+        """Debe leer de los lectores y escribir con el escritor"""
+        # Arrange
+        session = profiled_database.new_session()
+
+        # Act
+        read_bind = session.get_bind(clause=select(Hero))
+        session.add(Hero(name="Hero", secret_name="s"))
+        session.flush()
+
+        # Assert
+        assert read_bind is profiled_database.read_engine
+        assert session.connection().engine is profiled_database.engine
+        session.close()
+
+    def test_flush_without_changes_keeps_reader(self, profiled_database):
+        """Un flush sin cambios pendientes no debe pasar al escritor"""
+        # Arrange
+        session = profiled_database.new_session()
+
+        # Act
+        session.flush()
+
+        # Assert
+        assert session.get_bind(clause=select(Hero)) is profiled_database.read_engine
+        session.close()
+
+    def test_transaction_reads_its_own_writes(self, profiled_database):
+        """Debe leer del escritor tras escribir hasta terminar la transacción"""
+        # Arrange
+        session = profiled_database.new_session()
+        session.add(Hero(name="Pending", secret_name="s"))
+
+        # Act
+        pending_count = session.exec(select(func.count(Hero.id))).one()
+        bind_in_transaction = session.get_bind(clause=select(Hero))
+        session.commit()
+        bind_after_commit = session.get_bind(clause=select(Hero))
+
+        # Assert
+        assert pending_count == 1
+        assert bind_in_transaction is profiled_database.engine
+        assert bind_after_commit is profiled_database.read_engine
+        session.close()
+
+    def test_savepoint_end_keeps_reading_from_writer(self, profiled_database):
+        """Terminar un savepoint no debe devolver las lecturas a los lectores"""
+        # Arrange
+        session = profiled_database.new_session()
+        session.add(Hero(name="Pending", secret_name="s"))
+        session.flush()
+
+        # Act
+        with session.begin_nested():
+            pass
+        bind_after_savepoint = session.get_bind(clause=select(Hero))
+        session.rollback()
+        bind_after_rollback = session.get_bind(clause=select(Hero))
+
+        # Assert
+        assert bind_after_savepoint is profiled_database.engine
+        assert bind_after_rollback is profiled_database.read_engine
+        session.close()
+
+    def test_repository_writes_go_to_writer(self, profiled_database):
+        """Debe crear, insertar en bloque y borrar a través del escritor"""
+        # Arrange
+        session = profiled_database.new_session()
+        repository = HeroRepository(session)
+
+        # Act
+        hero = repository.create(Hero(name="Created", secret_name="s"))
+        repository.bulk_insert([{"name": "Bulk", "secret_name": "s"}])
+        repository.delete(hero)
+
+        # Assert
+        assert [h.name for h in session.exec(select(Hero)).all()] == ["Bulk"]
+        session.close()
+
+
+class TestWALCheckpointer:
+    """Tests para el mantenimiento periódico del WAL"""
+
+    def test_checkpoint_copies_wal_pages(self, profiled_database):
+        """Debe copiar a la base las páginas del WAL"""
+        # Arrange
+        checkpointer = WALCheckpointer(profiled_database.engine, interval=60)
+        with profiled_database.new_session() as session:
+            HeroRepository(session).bulk_insert(
+                [{"name": f"Hero {i}", "secret_name": "s"} for i in range(100)]
+            )
+
+        # Act
+        busy, wal_pages, checkpointed = checkpointer.checkpoint()
+
+        # Assert
+        assert busy == 0
+        assert wal_pages > 0
+        assert checkpointed == wal_pages
+        assert checkpointer.metrics()["checkpoints"] == 1
+
+    def test_stop_truncates_wal(self, profiled_database, tmp_path):
+        """Debe vaciar el WAL y optimizar al parar"""
+        # Arrange
+        checkpointer = WALCheckpointer(profiled_database.engine, interval=0.01)
+        checkpointer.start()
+        with profiled_database.new_session() as session:
+            session.add(Hero(name="Hero", secret_name="s"))
+            session.commit()
+
+        # Act
+        checkpointer.stop()
+
+        # Assert
+        assert (tmp_path / "heroes.db-wal").stat().st_size == 0
+        assert checkpointer.metrics()["optimizations"] == 1
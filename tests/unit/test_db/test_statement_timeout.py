@@ -0,0 +1,109 @@
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from app.db.statement_timeout import (
+    QueryDeadline,
+    is_statement_timeout,
+    query_deadline,
+)
+
+SLOW_QUERY = text(
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c "
+    "WHERE x < 100000000) SELECT count(*) FROM c"
+)
+
+
+@pytest.fixture(name="deadline")
+def deadline_fixture():
+    """Fija un plazo de 50 ms para las consultas del test"""
+    token = query_deadline.set(QueryDeadline(timeout=0.05))
+    yield
+    query_deadline.reset(token)
+
+
+class TestQueryDeadline:
+    """Tests para el cálculo del plazo de las consultas"""
+
+    def test_server_timeout_only(self):
+        """Debe usar el timeout del servidor si el cliente no envía plazo"""
+        # Arrange
+        deadline = QueryDeadline(timeout=2)
+
+        # Act & Assert
+        assert 1900 <= deadline.remaining_ms() <= 2000
+        assert deadline.client_bound is False
+
+    def test_client_budget_shrinks_timeout(self):
+        """Debe reducir el plazo al presupuesto del cliente"""
+        # Arrange
+        deadline = QueryDeadline(timeout=5, client_budget=0.5)
+
+        # Act & Assert
+        assert deadline.remaining_ms() <= 500
+        assert deadline.client_bound is True
+
+    def test_no_limit(self):
+        """No debe limitar sin timeout ni plazo del cliente"""
+        # Act & Assert
+        assert QueryDeadline(timeout=None).remaining_ms() is None
+
+    def test_expired_deadline_never_returns_zero(self):
+        """Debe devolver al menos 1 ms (0 desactiva el límite en Postgres)"""
+        # Arrange
+        deadline = QueryDeadline(timeout=5, client_budget=0)
+
+        # Act & Assert
+        assert deadline.remaining_ms() == 1
+
+
+class TestIsStatementTimeout:
+    """Tests para reconocer consultas canceladas por plazo"""
+
+    def test_postgres_query_canceled(self):
+        """Debe reconocer el SQLSTATE 57014 de Postgres (psycopg2)"""
+        # Arrange
+        exc = DBAPIError("SELECT 1", {}, Mock(spec=["pgcode"], pgcode="57014"))
+
+        # Act & Assert
+        assert is_statement_timeout(exc)
+
+    def test_psycopg3_query_canceled(self):
+        """Debe reconocer el SQLSTATE 57014 de psycopg3"""
+        # Arrange
+        exc = DBAPIError("SELECT 1", {}, Mock(spec=["sqlstate"], sqlstate="57014"))
+
+        # Act & Assert
+        assert is_statement_timeout(exc)
+
+    def test_other_errors(self):
+        """No debe confundir otros errores de base de datos"""
+        # Arrange
+        exc = DBAPIError("SELECT 1", {}, sqlite3.OperationalError("locked"))
+
+        # Act & Assert
+        assert not is_statement_timeout(exc)
+
+
+class TestSqliteStatementTimeout:
+    """Tests para el límite con progress handler en SQLite"""
+
+    def test_interrupts_slow_query(self, session, deadline):
+        """Debe interrumpir la consulta que supera el plazo"""
+        # Act
+        with pytest.raises(OperationalError) as exc_info:
+            session.exec(SLOW_QUERY)
+
+        # Assert
+        assert is_statement_timeout(exc_info.value)
+
+    def test_no_limit_outside_requests(self, session):
+        """No debe limitar las consultas sin plazo"""
+        # Act
+        result = session.exec(text("SELECT 1")).one()
+
+        # Assert
+        assert result == (1,)
@@ -0,0 +1,233 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import SQLModel, Session, create_engine, func, select
+
+from app.db import write_coalescer
+from app.db.statement_timeout import QueryDeadline, query_deadline
+from app.db.write_coalescer import WriteCoalescer, get_write_coalescer
+from app.exceptions.database import StatementTimeoutException
+from app.models.orm.hero import Hero
+from app.repositories.hero_repository import HeroRepository
+
+
+@pytest.fixture(name="file_engine")
+def file_engine_fixture(tmp_path):
+    """Motor SQLite en fichero (QueuePool) compartible entre hilos"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'heroes.db'}")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+class LeaderInterrupted(BaseException):
+    """Interrupción que _flush no captura (como una cancelación)"""
+
+
+def create_concurrently(coalescer, engine, heroes: list[Hero]) -> list:
+    """Crea cada héroe desde su propio hilo y devuelve resultados o errores"""
+    results: list = [None] * len(heroes)
+    start = threading.Barrier(len(heroes))
+
+    def create(index: int):
+        start.wait()
+        try:
+            results[index] = coalescer.create(engine, heroes[index])
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=create, args=(i,)) for i in range(len(heroes))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestWriteCoalescer:
+    """Tests para el agrupador de altas (group commit)"""
+
+    def test_concurrent_creates_share_one_transaction(self, file_engine):
+        """Debe insertar las altas concurrentes en un solo lote"""
+        # Arrange
+        coalescer = WriteCoalescer(max_batch=8, max_delay=5)
+        heroes = [Hero(name=f"Hero {i}", secret_name="s") for i in range(8)]
+
+        # Act
+        results = create_concurrently(coalescer, file_engine, heroes)
+
+        # Assert
+        assert results == heroes
+        assert all(hero.created_at is not None for hero in results)
+        assert coalescer.metrics()["batches"] == 1
+        with Session(file_engine) as session:
+            assert session.exec(select(func.count(Hero.id))).one() == 8
+
+    def test_waits_at_most_max_delay(self, file_engine):
+        """Un alta sola no debe esperar más que el plazo del lote"""
+        # Arrange
+        coalescer = WriteCoalescer(max_batch=64, max_delay=0.001)
+        hero = Hero(name="Spider-Man", secret_name="Peter")
+
+        # Act
+        result = coalescer.create(file_engine, hero)
+
+        # Assert
+        assert result.id == hero.id
+        assert coalescer.metrics() == {
+            "batches": 1,
+            "rows": 1,
+            "avg_batch_size": 1.0,
+            "fallbacks": 0,
+        }
+
+    def test_failed_rows_only_fail_their_caller(self, file_engine):
+        """Debe reintentar fila a fila y devolver a cada llamante su error"""
+        # Arrange
+        existing = Hero(name="Existing", secret_name="s")
+        with Session(file_engine, expire_on_commit=False) as session:
+            session.add(existing)
+            session.commit()
+        coalescer = WriteCoalescer(max_batch=3, max_delay=5)
+        duplicate = Hero(id=existing.id, name="Duplicate", secret_name="s")
+        heroes = [
+            Hero(name="A", secret_name="s"),
+            duplicate,
+            Hero(name="B", secret_name="s"),
+        ]
+
+        # Act
+        results = create_concurrently(coalescer, file_engine, heroes)
+
+        # Assert
+        assert isinstance(results[1], IntegrityError)
+        assert [results[0], results[2]] == [heroes[0], heroes[2]]
+        assert coalescer.metrics()["fallbacks"] == 1
+        with Session(file_engine) as session:
+            assert session.exec(select(func.count(Hero.id))).one() == 3
+
+    # El hilo del líder termina con la interrupción, como haría en producción
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_followers_fail_if_leader_exits_without_commit(
+        self, file_engine, monkeypatch
+    ):
+        """No debe dejar esperando a los llamantes si el líder se interrumpe"""
+        # Arrange
+        coalescer = WriteCoalescer(max_batch=2, max_delay=5)
+
+        def interrupted(engine, entities):
+            raise LeaderInterrupted()
+
+        monkeypatch.setattr(coalescer, "_insert", interrupted)
+        heroes = [Hero(name=f"Hero {i}", secret_name="s") for i in range(2)]
+
+        # Act
+        results = create_concurrently(coalescer, file_engine, heroes)
+
+        # Assert
+        assert [type(result) for result in results if result is not None] == [
+            RuntimeError
+        ]
+
+    def test_follower_waits_at_most_its_request_deadline(self, file_engine):
+        """Debe responder con timeout al agotar el plazo de la petición"""
+        # Arrange
+        coalescer = WriteCoalescer(max_batch=3, max_delay=0.3)
+        leader = threading.Thread(
+            target=coalescer.create,
+            args=(file_engine, Hero(name="Leader", secret_name="s")),
+        )
+        leader.start()
+        time.sleep(0.05)
+        token = query_deadline.set(QueryDeadline(timeout=0.05))
+
+        # Act & Assert
+        try:
+            with pytest.raises(StatementTimeoutException):
+                coalescer.create(file_engine, Hero(name="Follower", secret_name="s"))
+        finally:
+            query_deadline.reset(token)
+            leader.join()
+        # La fila del llamante que agotó su plazo sale del lote
+        with Session(file_engine) as session:
+            assert session.exec(select(Hero.name)).all() == ["Leader"]
+
+    def test_follower_past_deadline_waits_for_flush_in_progress(
+        self, file_engine, monkeypatch
+    ):
+        """No debe responder con timeout por una fila que el líder ya inserta"""
+        # Arrange
+        coalescer = WriteCoalescer(max_batch=2, max_delay=5)
+        insert = coalescer._insert
+        flushing = threading.Event()
+
+        def slow_insert(engine, entities):
+            flushing.set()
+            time.sleep(0.2)
+            insert(engine, entities)
+
+        monkeypatch.setattr(coalescer, "_insert", slow_insert)
+        leader = threading.Thread(
+            target=coalescer.create,
+            args=(file_engine, Hero(name="Leader", secret_name="s")),
+        )
+        leader.start()
+        time.sleep(0.05)
+        token = query_deadline.set(QueryDeadline(timeout=0.05))
+
+        # Act
+        try:
+            follower = coalescer.create(
+                file_engine, Hero(name="Follower", secret_name="s")
+            )
+        finally:
+            query_deadline.reset(token)
+            leader.join()
+
+        # Assert
+        assert flushing.is_set()
+        assert follower.id is not None
+        with Session(file_engine) as session:
+            assert session.exec(select(func.count(Hero.id))).one() == 2
+
+
+class TestGetWriteCoalescer:
+    """Tests para la elección de la ruta agrupada en el repositorio"""
+
+    def test_disabled_by_default(self, file_engine):
+        """No debe agrupar si WRITE_COALESCING está desactivado"""
+        # Arrange & Act
+        with Session(file_engine) as session:
+            # Assert
+            assert get_write_coalescer(session) is None
+
+    def test_skips_in_memory_and_dirty_sessions(
+        self, monkeypatch, session, file_engine
+    ):
+        """No debe agrupar con una conexión compartida ni con cambios pendientes"""
+        # Arrange
+        monkeypatch.setattr(write_coalescer.config, "write_coalescing", True)
+
+        # Act & Assert
+        assert get_write_coalescer(session) is None
+        with Session(file_engine) as file_session:
+            assert get_write_coalescer(file_session) is not None
+            file_session.add(Hero(name="Pending", secret_name="s"))
+            assert get_write_coalescer(file_session) is None
+
+    def test_repository_create_uses_coalescer(self, monkeypatch, file_engine):
+        """El alta del repositorio debe pasar por el agrupador si está activo"""
+        # Arrange
+        monkeypatch.setattr(write_coalescer.config, "write_coalescing", True)
+        rows_before = write_coalescer._coalescer.rows
+
+        # Act
+        with Session(file_engine) as session:
+            hero = HeroRepository(session).create(Hero(name="Thor", secret_name="s"))
+
+        # Assert
+        assert write_coalescer._coalescer.rows == rows_before + 1
+        with Session(file_engine) as session:
+            assert session.get(Hero, hero.id).name == "Thor"
@@ -0,0 +1,172 @@
+import anyio
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+from app.middleware.admission import AdmissionGroup, AdmissionRejected
+
+
+class TestAdmissionGroup:
+    """Tests para el límite de concurrencia con cola acotada"""
+
+    def test_admits_up_to_limit(self):
+        """Debe admitir sin esperar hasta el límite"""
+
+        # Arrange
+        async def main():
+            group = AdmissionGroup(limit=2, queue_size=0, queue_timeout=1)
+            await group.acquire()
+            await group.acquire()
+            return group
+
+        # Act
+        group = anyio.run(main)
+
+        # Assert
+        assert group.in_flight == 2
+        assert group.admitted == 2
+
+    def test_rejects_when_queue_is_full(self):
+        """Debe rechazar al instante si la cola está llena"""
+
+        # Arrange
+        async def main():
+            group = AdmissionGroup(limit=1, queue_size=0, queue_timeout=2)
+            await group.acquire()
+            with pytest.raises(AdmissionRejected) as exc_info:
+                await group.acquire()
+            return group, exc_info.value
+
+        # Act
+        group, rejection = anyio.run(main)
+
+        # Assert
+        assert group.rejected == 1
+        assert rejection.retry_after == 2
+
+    def test_queued_request_is_admitted_on_release(self):
+        """Debe pasar el hueco liberado a la primera petición en cola"""
+        # Arrange
+        order = []
+
+        async def waiter(group):
+            await group.acquire()
+            order.append("queued")
+
+        async def main():
+            group = AdmissionGroup(limit=1, queue_size=10, queue_timeout=1)
+            await group.acquire()
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(waiter, group)
+                await anyio.sleep(0.01)
+                order.append("release")
+                group.release(0.01)
+            return group
+
+        # Act
+        group = anyio.run(main)
+
+        # Assert
+        assert order == ["release", "queued"]
+        assert group.in_flight == 1
+
+    def test_queued_request_times_out(self):
+        """Debe rechazar la petición que supera el plazo de la cola"""
+
+        # Arrange
+        async def main():
+            group = AdmissionGroup(limit=1, queue_size=10, queue_timeout=0.02)
+            await group.acquire()
+            with pytest.raises(AdmissionRejected):
+                await group.acquire()
+            return group
+
+        # Act
+        group = anyio.run(main)
+
+        # Assert
+        assert group.metrics()["queued"] == 0
+        assert group.rejected == 1
+
+    def test_rejects_when_estimated_wait_exceeds_deadline(self):
+        """Debe rechazar sin encolar si la espera estimada supera el plazo"""
+
+        # Arrange
+        async def main():
+            group = AdmissionGroup(limit=1, queue_size=10, queue_timeout=0.5)
+            await group.acquire()
+            group.release(2.0)
+            await group.acquire()
+            with pytest.raises(AdmissionRejected) as exc_info:
+                await group.acquire()
+            return exc_info.value
+
+        # Act
+        rejection = anyio.run(main)
+
+        # Assert
+        assert rejection.retry_after == pytest.approx(2.0)
+
+
+class TestAdaptiveLimit:
+    """Tests para el ajuste AIMD del límite"""
+
+    def test_decreases_limit_when_latency_exceeds_target(self):
+        """Debe reducir el límite de forma multiplicativa"""
+        # Arrange
+        group = AdmissionGroup(
+            limit=10, queue_size=0, queue_timeout=1, adaptive=True, target_latency=0.1
+        )
+        group.in_flight = 1
+
+        # Act
+        group.release(0.5)
+
+        # Assert
+        assert group.limit == pytest.approx(9)
+
+    def test_increases_limit_additively_up_to_max(self):
+        """Debe recuperar el límite poco a poco sin superar el máximo"""
+        # Arrange
+        group = AdmissionGroup(
+            limit=4, queue_size=0, queue_timeout=1, adaptive=True, target_latency=0.1
+        )
+        group.limit = 2
+        group.in_flight = 3
+
+        # Act
+        for _ in range(3):
+            group.release(0.01)
+
+        # Assert
+        assert 3 <= group.limit <= 4
+
+    def test_decrease_never_drops_below_one(self):
+        """Debe mantener el límite en al menos una petición"""
+        # Arrange
+        group = AdmissionGroup(
+            limit=1,
+            queue_size=0,
+            queue_timeout=1,
+            adaptive=True,
+            target_latency=0.1,
+            min_limit=0,
+        )
+        group.in_flight = 1
+
+        # Act
+        group.release(0.5)
+
+        # Assert
+        assert group.limit == 1
+        assert group.estimated_wait(0) == pytest.approx(0.5)
+
+
+class TestAdmissionLimitsSetting:
+    """Tests para la validación de ADMISSION_LIMITS"""
+
+    def test_rejects_limits_below_one(self):
+        """Debe rechazar grupos que no admiten ninguna petición"""
+        # Act & Assert
+        with pytest.raises(ValidationError, match="ADMISSION_LIMITS"):
+            Settings(ADMISSION_LIMITS={"/test": 0})
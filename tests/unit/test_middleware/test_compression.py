@@ -0,0 +1,56 @@
+from app.middleware.compression import is_compressible, negotiate_encoding
+
+
+class TestNegotiateEncoding:
+    """Tests para la negociación de Accept-Encoding"""
+
+    def test_prefers_server_order_on_equal_q(self):
+        """Debe usar la preferencia del servidor si el cliente no la indica"""
+        # Act
+        encoding = negotiate_encoding("gzip, br, zstd", ["zstd", "br", "gzip"])
+
+        # Assert
+        assert encoding == "zstd"
+
+    def test_respects_client_q_values(self):
+        """Debe elegir la codificación con mayor q"""
+        # Act
+        encoding = negotiate_encoding("zstd;q=0.5, gzip", ["zstd", "gzip"])
+
+        # Assert
+        assert encoding == "gzip"
+
+    def test_skips_unavailable_and_refused_encodings(self):
+        """Debe ignorar lo no disponible y lo rechazado con q=0"""
+        # Act
+        encoding = negotiate_encoding("br, gzip;q=0", ["gzip"])
+
+        # Assert
+        assert encoding is None
+
+    def test_wildcard(self):
+        """Debe aceptar cualquier codificación con *"""
+        # Act & Assert
+        assert negotiate_encoding("*", ["gzip"]) == "gzip"
+
+    def test_identity_only(self):
+        """No debe comprimir si el cliente solo acepta identity"""
+        # Act & Assert
+        assert negotiate_encoding("identity", ["gzip"]) is None
+
+
+class TestIsCompressible:
+    """Tests para los tipos de contenido comprimibles"""
+
+    def test_json_and_text_are_compressible(self):
+        """Debe comprimir JSON y texto"""
+        # Act & Assert
+        assert is_compressible("application/json")
+        assert is_compressible("text/csv; charset=utf-8")
+        assert is_compressible("application/problem+json")
+
+    def test_binary_is_not_compressible(self):
+        """No debe comprimir formatos ya comprimidos"""
+        # Act & Assert
+        assert not is_compressible("image/png")
+        assert not is_compressible("")
@@ -0,0 +1,296 @@
+import time
+
+import pytest
+
+from app.core.change_stream import ChangeEvent, broadcaster
+from app.db import columnar_replica
+from app.exceptions.query import QueryTooExpensiveException
+from app.models.orm.hero import Hero, HeroFilter, HeroSort
+from app.repositories.base_repository import BaseRepository
+from app.repositories.columnar_replica_repository import ColumnarReplicaRepository
+from app.repositories.hero_repository import HeroRepository
+
+# Dependencia opcional: sin numpy no hay réplica columnar
+pytest.importorskip("numpy")
+
+HeroReplicaRepository = ColumnarReplicaRepository.for_model(Hero, default_sort="name")
+
+
+@pytest.fixture(autouse=True)
+def fresh_replicas(monkeypatch):
+    """Cada test parte sin réplicas cargadas"""
+    monkeypatch.setattr(columnar_replica, "_replicas", {})
+
+
+@pytest.fixture
+def heroes(session):
+    """Héroes con edades repetidas y sin edad"""
+    HeroRepository(session).bulk_insert(
+        [
+            {
+                "name": f"Hero {i % 10}",
+                "age": None if i % 7 == 0 else i % 30,
+                "secret_name": f"Secret {i}",
+            }
+            for i in range(200)
+        ]
+    )
+
+
+class TestColumnarReplicaParity:
+    """Tests de equivalencia con las consultas de BaseRepository"""
+
+    @pytest.mark.parametrize(
+        "filter_str",
+        [
+            None,
+            "age:ge:10",
+            "age:is_null",
+            "name:like:ero 1",
+            "age:in:1;2;3",
+            "age:in:1.7;2",
+            "name:in:Hero 11;Hero 2",
+            "age:not_in:1;2",
+            "age:between:5;9,name:ne:Hero 3",
+            "age:eq:abc",
+            "created_at:ge:now-1h",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "sort_str", [None, "age:desc", "age:asc,name:desc", "created_at:desc"]
+    )
+    def test_page_and_total_match_database(self, session, heroes, filter_str, sort_str):
+        """Debe devolver las mismas filas, en el mismo orden, y el mismo total"""
+        # Arrange
+        hero_filter = HeroFilter.from_string(filter_str)
+        hero_sort = HeroSort.from_string(sort_str)
+        keys = [term.split(":")[0] for term in (sort_str or "name").split(",")]
+
+        # Act
+        expected, expected_total = HeroRepository(session).get_filtered_rows_with_count(
+            hero_filter, 0, 200, hero_sort
+        )
+        rows, total = HeroReplicaRepository(session).get_filtered_rows_with_count(
+            hero_filter, 0, 200, hero_sort
+        )
+
+        # Assert
+        assert total == expected_total
+        assert {row.id for row in rows} == {row.id for row in expected}
+        assert [tuple(getattr(row, key) for key in keys) for row in rows] == [
+            tuple(getattr(row, key) for key in keys) for row in expected
+        ]
+
+    def test_rows_have_the_same_fields_and_types(self, session, heroes):
+        """Debe devolver filas con los mismos campos y valores que Core"""
+        # Arrange
+        hero_sort = HeroSort.from_string("secret_name:asc")
+
+        # Act
+        expected = HeroRepository(session).get_filtered_rows(None, 0, 1, hero_sort)
+        rows = HeroReplicaRepository(session).get_filtered_rows(None, 0, 1, hero_sort)
+
+        # Assert
+        assert rows[0]._asdict() == expected[0]._asdict()
+
+    def test_nulls_sort_first_ascending_in_sqlite(self, session, heroes):
+        """Debe ordenar los NULL como la base de datos de origen"""
+        # Act
+        rows = HeroReplicaRepository(session).get_filtered_rows(
+            None, 0, 200, HeroSort.from_string("age:asc")
+        )
+
+        # Assert
+        assert rows[0].age is None
+        assert rows[-1].age == 29
+
+
+class TestColumnarColumn:
+    """Tests de los operadores de una columna"""
+
+    def test_isin_does_not_truncate_longer_strings(self):
+        """Un texto más largo que los de la columna no debe coincidir con su prefijo"""
+        # Arrange
+        column = columnar_replica.ColumnarColumn("str", ["Deadpond", "Rusty-Man"])
+
+        # Act
+        matches = column.isin(["Rusty-Man-Impostor"])
+
+        # Assert
+        assert matches.tolist() == [False, False]
+
+    def test_isin_ignores_decimals_in_int_columns(self):
+        """1.7 no debe coincidir con 1 en una columna de enteros"""
+        # Arrange
+        column = columnar_replica.ColumnarColumn("int", [1, 2, 3])
+
+        # Act
+        matches = column.isin([1.7, 3.0])
+
+        # Assert
+        assert matches.tolist() == [False, False, True]
+
+
+class TestColumnarReplicaPagination:
+    """Tests de paginación y conteo"""
+
+    def test_page_reports_next_page(self, session, heroes):
+        """Debe indicar si hay página siguiente sin contar"""
+        # Arrange
+        repository = HeroReplicaRepository(session)
+        hero_filter = HeroFilter.from_string("age:eq:3")
+
+        # Act
+        first, first_has_next = repository.get_filtered_rows_page(hero_filter, 0, 5)
+        last, last_has_next = repository.get_filtered_rows_page(hero_filter, 5, 5)
+
+        # Assert
+        assert (len(first), first_has_next) == (5, True)
+        assert (len(last), last_has_next) == (1, False)
+
+    def test_count(self, session, heroes):
+        """Debe contar las filas filtradas"""
+        # Arrange
+        repository = HeroReplicaRepository(session)
+
+        # Act & Assert
+        assert repository.count() == 200
+        assert repository.count(HeroFilter.from_string("age:is_null")) == 29
+
+    def test_get_filtered_returns_entities_in_order(self, session, heroes):
+        """Debe devolver entidades ORM en el orden de la réplica"""
+        # Act
+        entities = HeroReplicaRepository(session).get_filtered(
+            HeroFilter.from_string("age:eq:3"), 0, 3, HeroSort.from_string("age:asc")
+        )
+
+        # Assert
+        assert all(isinstance(entity, Hero) for entity in entities)
+        assert [entity.age for entity in entities] == [3, 3, 3]
+
+    def test_static_limits_still_apply(self, session, heroes, monkeypatch):
+        """Debe rechazar listas IN por encima de QUERY_MAX_IN_LIST"""
+        # Arrange
+        monkeypatch.setattr(columnar_replica.config, "query_max_in_list", 2)
+
+        # Act & Assert
+        with pytest.raises(QueryTooExpensiveException):
+            HeroReplicaRepository(session).count(HeroFilter.from_string("age:in:1;2;3"))
+
+    @pytest.mark.parametrize(
+        "sort_str, offset, setting",
+        [
+            ("age:asc,name:asc", 0, "query_max_sort_terms"),
+            (None, 101, "query_max_offset"),
+        ],
+    )
+    def test_page_limits_still_apply(
+        self, session, heroes, monkeypatch, sort_str, offset, setting
+    ):
+        """Debe rechazar los mismos OFFSET y criterios de orden que la base"""
+        # Arrange
+        monkeypatch.setattr(columnar_replica.config, "query_max_sort_terms", 1)
+        monkeypatch.setattr(columnar_replica.config, "query_max_offset", 100)
+
+        # Act & Assert
+        with pytest.raises(QueryTooExpensiveException):
+            HeroReplicaRepository(session).get_filtered_rows(
+                None, offset, 10, HeroSort.from_string(sort_str)
+            )
+
+    def test_text_sorts_by_code_point(self, session):
+        """Debe ordenar los textos por punto de código"""
+        # Arrange
+        HeroRepository(session).bulk_insert(
+            [{"name": name, "secret_name": "s"} for name in ("adam", "Zed", "Éric")]
+        )
+
+        # Act
+        rows = HeroReplicaRepository(session).get_filtered_rows(None, 0, 10)
+
+        # Assert
+        assert [row.name for row in rows] == ["Zed", "adam", "Éric"]
+
+    def test_generic_base_is_not_registered_for_warmup(self):
+        """No debe registrar la base genérica, que necesita el modelo"""
+        # Act & Assert
+        assert ColumnarReplicaRepository not in BaseRepository.registry
+        assert HeroReplicaRepository in BaseRepository.registry
+
+    def test_for_model_reuses_the_class(self):
+        """Llamar de nuevo a for_model no debe crear ni registrar otra clase"""
+        # Arrange
+        registered = len(BaseRepository.registry)
+
+        # Act
+        repository_class = ColumnarReplicaRepository.for_model(
+            Hero, default_sort="name"
+        )
+        generic_class = BaseRepository.for_model(Hero, default_sort="name")
+
+        # Assert
+        assert repository_class is HeroReplicaRepository
+        assert generic_class is not HeroReplicaRepository
+        assert generic_class is BaseRepository.for_model(Hero, default_sort="name")
+        assert len(BaseRepository.registry) <= registered + 1
+
+
+class TestColumnarReplicaRefresh:
+    """Tests de recarga de la réplica tras cambios"""
+
+    def test_writes_reload_replica_on_next_read(self, session, heroes):
+        """Debe ver las altas y los cambios hechos con el repositorio"""
+        # Arrange
+        repository = HeroReplicaRepository(session)
+        by_name = HeroFilter.from_string("name:eq:Replica")
+        assert repository.count(by_name) == 0
+
+        # Act
+        hero = repository.create(Hero(name="Replica", age=1, secret_name="s"))
+        created = repository.count(by_name)
+        repository.update_patch(hero.id, {"name": "Renamed"})
+        renamed = repository.count(by_name)
+
+        # Assert
+        assert (created, renamed) == (1, 0)
+        assert repository.replica.refreshes == 3
+
+    def test_reads_reuse_snapshot_without_changes(self, session, heroes):
+        """No debe recargar mientras no haya cambios"""
+        # Arrange
+        repository = HeroReplicaRepository(session)
+
+        # Act
+        for _ in range(3):
+            repository.get_filtered_rows_with_count(None, 0, 10)
+
+        # Assert
+        assert repository.replica.refreshes == 1
+
+    def test_remote_change_event_invalidates(self, session, heroes):
+        """Debe recargar al recibir un cambio de otro worker"""
+        # Arrange
+        repository = HeroReplicaRepository(session)
+        repository.count()
+        event = ChangeEvent("created", "Hero", "h1", None, origin="other-worker")
+
+        # Act
+        broadcaster.receive(event)
+        repository.count()
+
+        # Assert
+        assert repository.replica.refreshes == 2
+
+    def test_max_age_forces_reload(self, session, heroes):
+        """Debe recargar pasado COLUMNAR_REPLICA_MAX_AGE aunque no vea cambios"""
+        # Arrange
+        repository = HeroReplicaRepository(session)
+        repository.count()
+        repository.replica.max_age = 0.01
+
+        # Act
+        time.sleep(0.02)
+        repository.count()
+
+        # Assert
+        assert repository.replica.refreshes == 2
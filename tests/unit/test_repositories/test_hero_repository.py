@@ -1,4 +1,12 @@
+import threading
+import pytest
+from sqlalchemy import Column, MetaData, String, Table, event
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, SQLModel, create_engine
+from app.db.copy import _copy_statement, _copy_type_name, _with_python_defaults
+from app.db.entity_loader import EntityLoader, ENTITY_LOADER_KEY
 from app.models.orm.hero import Hero
+from app.repositories.hero_repository import HeroRepository
 from uuid import uuid4
 
 
@@ -53,6 +61,135 @@ class TestHeroRepositoryGetById:
         assert result is None
 
 
+class TestHeroRepositoryGetMany:
+    """Tests para obtener varios héroes por ID"""
+
+    def test_get_many_returns_existing_heroes(self, hero_repository, multiple_heroes):
+        """Debe retornar los héroes solicitados indexados por id"""
+        # Arrange
+        ids = [hero.id for hero in multiple_heroes[:2]]
+
+        # Act
+        result = hero_repository.get_many(ids)
+
+        # Assert
+        assert set(result.keys()) == set(ids)
+        assert result[ids[0]].name == multiple_heroes[0].name
+
+    def test_get_many_skips_missing_ids(self, hero_repository, hero_in_db):
+        """Debe omitir los ids que no existen"""
+        # Arrange
+        missing_id = uuid4()
+
+        # Act
+        result = hero_repository.get_many([hero_in_db.id, missing_id])
+
+        # Assert
+        assert list(result.keys()) == [hero_in_db.id]
+
+    def test_get_many_chunks_large_id_lists(
+        self, hero_repository, multiple_heroes, session, monkeypatch
+    ):
+        """Debe dividir la consulta en bloques de IN_CHUNK_SIZE ids"""
+        # Arrange
+        monkeypatch.setattr(hero_repository, "IN_CHUNK_SIZE", 3)
+        ids = [hero.id for hero in multiple_heroes] + [uuid4() for _ in range(3)]
+        session.expire_all()
+        executed = []
+        original_exec = session.exec
+        monkeypatch.setattr(
+            session,
+            "exec",
+            lambda query: executed.append(query) or original_exec(query),
+        )
+
+        # Act
+        result = hero_repository.get_many(ids)
+
+        # Assert
+        assert len(result) == 4
+        assert len(executed) == 3
+
+    def test_get_many_reuses_loaded_entities(
+        self, hero_repository, hero_in_db, session, monkeypatch
+    ):
+        """Debe reutilizar las entidades ya cargadas en la sesión sin consultar"""
+        # Arrange
+        monkeypatch.setattr(
+            session, "exec", lambda query: pytest.fail("Unexpected query")
+        )
+
+        # Act
+        result = hero_repository.get_many([hero_in_db.id])
+
+        # Assert
+        assert result[hero_in_db.id] is hero_in_db
+
+
+class TestHeroRepositoryEntityLoader:
+    """Tests para el uso del cargador de la petición en el repositorio"""
+
+    def test_prefetch_coalesces_get_by_id(
+        self, hero_repository, multiple_heroes, session, monkeypatch
+    ):
+        """Debe resolver varios get_by_id encolados con una sola consulta"""
+        # Arrange
+        loader = EntityLoader()
+        session.info[ENTITY_LOADER_KEY] = loader
+        ids = [hero.id for hero in multiple_heroes]
+        session.expire_all()
+        executed = []
+        original_exec = session.exec
+        monkeypatch.setattr(
+            session,
+            "exec",
+            lambda query: executed.append(query) or original_exec(query),
+        )
+
+        # Act
+        hero_repository.prefetch(ids)
+        heroes = [hero_repository.get_by_id(hero_id) for hero_id in ids * 2]
+
+        # Assert
+        assert [hero.id for hero in heroes] == ids * 2
+        assert len(executed) == 1
+        # Sin el cargador, 4 consultas: la segunda vuelta ya está en la sesión
+        assert (loader.queries_baseline, loader.queries_saved) == (4, 3)
+        session.info.pop(ENTITY_LOADER_KEY)
+
+    def test_get_many_counts_chunk_queries(
+        self, hero_repository, multiple_heroes, session, monkeypatch
+    ):
+        """Debe anotar cada consulta por bloque y no contarlas como ahorradas"""
+        # Arrange
+        loader = EntityLoader()
+        session.info[ENTITY_LOADER_KEY] = loader
+        monkeypatch.setattr(HeroRepository, "IN_CHUNK_SIZE", 2)
+        ids = [hero.id for hero in multiple_heroes]
+        session.expire_all()
+
+        # Act
+        result = hero_repository.get_many(ids)
+
+        # Assert
+        assert len(result) == 4
+        assert (loader.queries_executed, loader.queries_saved) == (2, 0)
+        session.info.pop(ENTITY_LOADER_KEY)
+
+    def test_delete_forgets_memoized_entity(self, hero_repository, hero_in_db, session):
+        """Debe dejar de devolver la entidad borrada"""
+        # Arrange
+        session.info[ENTITY_LOADER_KEY] = EntityLoader()
+        hero_repository.get_by_id(hero_in_db.id)
+
+        # Act
+        hero_repository.delete(hero_in_db)
+
+        # Assert
+        assert hero_repository.get_by_id(hero_in_db.id) is None
+        session.info.pop(ENTITY_LOADER_KEY)
+
+
 class TestHeroRepositoryGetAll:
     """Tests para obtener todos los héroes"""
 
@@ -152,6 +289,176 @@ class TestHeroRepositoryGetFiltered:
         assert names == sorted(names)
 
 
+class TestHeroRepositoryGetFilteredRows:
+    """Tests para el listado de solo lectura sin hidratación ORM"""
+
+    def test_get_filtered_rows_matches_orm_results(
+        self, hero_repository, multiple_heroes, hero_filter_age_gt, hero_sort_name_asc
+    ):
+        """Debe devolver las mismas filas y en el mismo orden que get_filtered"""
+        # Act
+        rows = hero_repository.get_filtered_rows(
+            hero_filter_age_gt, sort=hero_sort_name_asc
+        )
+        entities = hero_repository.get_filtered(
+            hero_filter_age_gt, sort=hero_sort_name_asc
+        )
+
+        # Assert
+        assert [row.id for row in rows] == [hero.id for hero in entities]
+        assert [row.name for row in rows] == [hero.name for hero in entities]
+
+    def test_get_filtered_rows_returns_plain_rows(
+        self, hero_repository, multiple_heroes, session
+    ):
+        """Debe devolver filas ligeras sin registrar entidades en la sesión"""
+        # Arrange
+        session.expunge_all()
+
+        # Act
+        rows = hero_repository.get_filtered_rows(None, offset=0, limit=2)
+
+        # Assert
+        assert len(rows) == 2
+        assert not any(isinstance(row, Hero) for row in rows)
+        assert set(rows[0]._asdict()) >= {"id", "name", "age", "secret_name"}
+        assert len(session.identity_map) == 0
+
+
+class TestHeroRepositoryGetFilteredRowsPage:
+    """Tests para la página sin COUNT (limit + 1)"""
+
+    def test_page_with_next(self, hero_repository, multiple_heroes):
+        """Debe devolver limit filas e indicar que hay más"""
+        # Act
+        rows, has_next = hero_repository.get_filtered_rows_page(None, 0, 3)
+
+        # Assert
+        assert len(rows) == 3
+        assert has_next is True
+
+    def test_last_page(self, hero_repository, multiple_heroes):
+        """Debe indicar que no hay más en la última página"""
+        # Act
+        rows, has_next = hero_repository.get_filtered_rows_page(None, 2, 2)
+
+        # Assert
+        assert len(rows) == 2
+        assert has_next is False
+
+
+class TestHeroRepositoryGetFilteredRowsWithCount:
+    """Tests para la página con total (COUNT en paralelo si se puede)"""
+
+    def test_sequential_on_shared_connection(
+        self, hero_repository, multiple_heroes, hero_filter_age_gt
+    ):
+        """Debe devolver página y total sin paralelizar en SQLite en memoria"""
+        # Act
+        rows, total = hero_repository.get_filtered_rows_with_count(
+            hero_filter_age_gt, 0, 2
+        )
+
+        # Assert
+        assert len(rows) == 2
+        assert total == 3
+
+    def test_concurrent_count_on_pooled_engine(self, tmp_path, hero_filter_age_gt):
+        """Debe lanzar el COUNT en otra conexión cuando el pool lo permite"""
+        # Arrange
+        engine = create_engine(f"sqlite:///{tmp_path / 'heroes.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add_all(
+                Hero(name=f"Hero {i}", age=i * 10, secret_name="S") for i in range(6)
+            )
+            session.commit()
+
+            repository = HeroRepository(session)
+            threads = []
+            event.listen(
+                engine,
+                "before_cursor_execute",
+                lambda *args: threads.append(threading.current_thread().name),
+            )
+
+            # Act
+            rows, total = repository.get_filtered_rows_with_count(
+                hero_filter_age_gt, 0, 1
+            )
+
+        # Assert
+        assert len(rows) == 1
+        assert total == 2
+        assert any(name.startswith("parallel-query") for name in threads)
+        engine.dispose()
+
+
+class TestHeroRepositoryBulkInsert:
+    """Tests para la inserción en bloque"""
+
+    def test_bulk_insert_uses_server_defaults(self, hero_repository):
+        """Debe insertar las filas y rellenar las columnas omitidas"""
+        # Arrange
+        rows = [
+            {"id": uuid4(), "name": f"Hero {i}", "age": i, "secret_name": "S"}
+            for i in range(3)
+        ]
+
+        # Act
+        inserted = hero_repository.bulk_insert(rows)
+
+        # Assert
+        assert inserted == 3
+        assert hero_repository.count() == 3
+        hero = hero_repository.get_by_id(rows[0]["id"])
+        assert hero.created_at is not None
+
+    def test_bulk_insert_empty(self, hero_repository):
+        """Debe aceptar una lista vacía"""
+        # Act & Assert
+        assert hero_repository.bulk_insert([]) == 0
+
+    def test_copy_column_types(self):
+        """Debe resolver los tipos de Postgres para COPY binario"""
+        # Act
+        types = {c.name: _copy_type_name(c) for c in Hero.__table__.columns}
+
+        # Assert
+        assert types == {
+            "id": "uuid",
+            "created_at": "timestamp without time zone",
+            "updated_at": "timestamp without time zone",
+            "name": "varchar",
+            "age": "integer",
+            "secret_name": "varchar",
+        }
+
+    def test_copy_fills_python_defaults(self):
+        """Debe generar el id de las filas sin id, que el servidor no rellena"""
+        # Arrange
+        rows = [{"name": "A", "secret_name": "a"}, {"name": "B", "secret_name": "b"}]
+
+        # Act
+        filled = _with_python_defaults(Hero.__table__, rows)
+
+        # Assert
+        assert [set(row) for row in filled] == [{"name", "secret_name", "id"}] * 2
+        assert filled[0]["id"] != filled[1]["id"]
+        assert "id" not in rows[0]
+
+    def test_copy_statement_quotes_identifiers(self):
+        """Debe entrecomillar tabla y columnas con el dialecto"""
+        # Arrange
+        table = Table("order", MetaData(), Column("user", String), schema="Sales")
+
+        # Act
+        statement = _copy_statement(postgresql.dialect(), table, list(table.columns))
+
+        # Assert
+        assert statement == ('COPY "Sales"."order" ("user") FROM STDIN (FORMAT BINARY)')
+
+
 class TestHeroRepositoryCount:
     """Tests para contar héroes"""
 
@@ -71,6 +71,57 @@ class TestHeroServiceGetById:
             hero_service.get_hero_by_id(999)
 
 
+class TestHeroServiceGetByIds:
+    """Tests para obtener varios héroes por ID"""
+
+    def test_get_heroes_by_ids_keeps_request_order(self, hero_service, mock_repository):
+        """Debe retornar los héroes en el orden solicitado y los ids no encontrados"""
+        # Arrange
+        first = Hero(id=1, name="First", age=25, secret_name="Test")
+        second = Hero(id=2, name="Second", age=30, secret_name="Test")
+        mock_repository.get_by_id.side_effect = {1: first, 2: second}.get
+
+        # Act
+        heroes, missing = hero_service.get_heroes_by_ids([2, 3, 1, 2])
+
+        # Assert
+        assert heroes == [second, first]
+        assert missing == [3]
+        mock_repository.prefetch.assert_called_once_with([2, 3, 1])
+
+
+class TestHeroServiceGetRowsFiltered:
+    """Tests para el listado de solo lectura"""
+
+    def test_get_hero_rows_filtered_delegates_to_repository(
+        self, hero_service, mock_repository
+    ):
+        """Debe pasar filtros, paginación y orden al repositorio"""
+        # Arrange
+        mock_repository.get_filtered_rows.return_value = []
+
+        # Act
+        result = hero_service.get_hero_rows_filtered(None, offset=10, limit=5)
+
+        # Assert
+        assert result == []
+        mock_repository.get_filtered_rows.assert_called_once_with(None, 10, 5, None)
+
+    def test_get_hero_rows_page_delegates_to_repository(
+        self, hero_service, mock_repository
+    ):
+        """Debe devolver la página y si hay siguiente sin contar"""
+        # Arrange
+        mock_repository.get_filtered_rows_page.return_value = ([], False)
+
+        # Act
+        result = hero_service.get_hero_rows_page(None, offset=0, limit=5)
+
+        # Assert
+        assert result == ([], False)
+        mock_repository.count.assert_not_called()
+
+
 class TestHeroServiceRetire:
     """Tests para retirar héroes"""
 
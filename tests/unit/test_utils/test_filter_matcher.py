@@ -0,0 +1,98 @@
+from app.models.orm.hero import HeroFilter
+from app.utils.filters.filter_matcher import FilterMatcher
+
+HERO = {
+    "id": "0190a5c2-7e1f-7000-8000-000000000001",
+    "name": "Spider-Man",
+    "age": 25,
+    "secret_name": "Peter Parker",
+    "created_at": "2025-01-15T10:30:00.123000",
+}
+
+
+class TestFilterMatcher:
+    """Tests para la evaluación de filtros en memoria"""
+
+    def test_empty_filter_matches(self):
+        """Debe coincidir cualquier entidad si no hay filtros"""
+        # Act & Assert
+        assert FilterMatcher.matches(HeroFilter.from_string(None), HERO)
+
+    def test_comparison_operators(self):
+        """Debe aplicar los operadores de comparación como la consulta SQL"""
+        # Arrange
+        cases = {
+            "age:eq:25": True,
+            "age:ne:25": False,
+            "age:gt:18": True,
+            "age:ge:25": True,
+            "age:lt:25": False,
+            "age:le:30": True,
+        }
+
+        # Act & Assert
+        for filter_str, expected in cases.items():
+            filter_model = HeroFilter.from_string(filter_str)
+            assert FilterMatcher.matches(filter_model, HERO) is expected, filter_str
+
+    def test_like_is_case_insensitive_contains(self):
+        """Debe comportarse como ILIKE '%valor%'"""
+        # Act & Assert
+        assert FilterMatcher.matches(HeroFilter.from_string("name:like:spider"), HERO)
+        assert not FilterMatcher.matches(HeroFilter.from_string("name:like:iron"), HERO)
+
+    def test_in_and_not_in(self):
+        """Debe comprobar la pertenencia a la lista"""
+        # Act & Assert
+        assert FilterMatcher.matches(
+            HeroFilter.from_string("name:in:Thor;Spider-Man"), HERO
+        )
+        assert not FilterMatcher.matches(
+            HeroFilter.from_string("name:not_in:Thor;Spider-Man"), HERO
+        )
+
+    def test_null_semantics_match_sql(self):
+        """Las comparaciones con NULL no deben coincidir, salvo is_null"""
+        # Arrange
+        hero = {**HERO, "age": None}
+
+        # Act & Assert
+        assert FilterMatcher.matches(HeroFilter.from_string("age:is_null:"), hero)
+        assert not FilterMatcher.matches(HeroFilter.from_string("age:ne:25"), hero)
+        assert not FilterMatcher.matches(HeroFilter.from_string("age:not_in:1;2"), hero)
+
+    def test_all_conditions_must_match(self):
+        """Debe combinar los filtros con AND"""
+        # Act & Assert
+        assert FilterMatcher.matches(
+            HeroFilter.from_string("age:gt:18,name:like:Spider"), HERO
+        )
+        assert not FilterMatcher.matches(
+            HeroFilter.from_string("age:gt:30,name:like:Spider"), HERO
+        )
+
+    def test_compares_serialized_values_as_text(self):
+        """Debe comparar como texto los valores serializados (p. ej. UUID)"""
+        # Arrange
+        filter_model = HeroFilter.from_string(f"id:eq:{HERO['id']}")
+
+        # Act & Assert
+        assert FilterMatcher.matches(filter_model, HERO)
+
+    def test_between_is_inclusive(self):
+        """between debe incluir ambos extremos"""
+        # Act & Assert
+        assert FilterMatcher.matches(HeroFilter.from_string("age:between:25;30"), HERO)
+        assert not FilterMatcher.matches(
+            HeroFilter.from_string("age:between:26;30"), HERO
+        )
+
+    def test_compares_serialized_dates_as_dates(self):
+        """Debe comparar como fechas los datetime serializados a ISO"""
+        # Act & Assert
+        assert FilterMatcher.matches(
+            HeroFilter.from_string("created_at:between:2025-01-15;2025-01-16"), HERO
+        )
+        assert not FilterMatcher.matches(
+            HeroFilter.from_string("created_at:gt:2025-01-15T10:31:00Z"), HERO
+        )
@@ -1,4 +1,5 @@
 import pytest
+from datetime import datetime
 from app.utils.filters.filter_parser import FilterParser
 from app.enums.filter import FilterOperator
 from app.exceptions.filters import InvalidFilterFormatException
@@ -266,3 +267,24 @@ class TestFilterParser:
         assert result[0] == (mock_filter_field.NAME, FilterOperator.LIKE, "john")
         assert result[1] == (mock_filter_field.ID, FilterOperator.IN, [1, 2, 3])
         assert result[2] == (mock_filter_field.AGE, FilterOperator.GE, 18)
+
+    def test_parse_datetime_fields_only(self, mock_filter_field):
+        """Solo los campos de fecha deben convertir sus valores a datetime"""
+        # Act
+        result = FilterParser.parse(
+            "name:eq:Now,id:ge:2025-01-31", mock_filter_field, frozenset({"id"})
+        )
+
+        # Assert
+        assert result[0] == (mock_filter_field.NAME, FilterOperator.EQ, "Now")
+        assert result[1] == (
+            mock_filter_field.ID,
+            FilterOperator.GE,
+            datetime(2025, 1, 31),
+        )
+
+    def test_parse_invalid_datetime_raises_exception(self, mock_filter_field):
+        """Debe rechazar un valor que no es fecha en un campo de fecha"""
+        # Act & Assert
+        with pytest.raises(InvalidFilterFormatException):
+            FilterParser.parse("id:ge:yesterday", mock_filter_field, frozenset({"id"}))
@@ -1,4 +1,5 @@
 import pytest
+from datetime import datetime
 from enum import Enum
 from app.utils.filters.filter_validator import FilterValidator, FilterValidationError
 from app.enums.filter import FilterOperator
@@ -159,6 +160,40 @@ class TestFilterValidator:
         # Act & Assert (no debe lanzar excepción)
         FilterValidator.validate_filter_tuple(filter_tuple)
 
+    def test_validate_filter_tuple_gt_with_datetime(self, mock_filter_field):
+        """Debe validar correctamente GT con una fecha"""
+        # Arrange
+        filter_tuple = (mock_filter_field.AGE, FilterOperator.GT, datetime(2025, 1, 1))
+
+        # Act & Assert (no debe lanzar excepción)
+        FilterValidator.validate_filter_tuple(filter_tuple)
+
+    def test_validate_filter_tuple_between(self, mock_filter_field):
+        """Debe validar BETWEEN con dos extremos numéricos"""
+        # Arrange
+        filter_tuple = (mock_filter_field.AGE, FilterOperator.BETWEEN, [18, 65])
+
+        # Act & Assert (no debe lanzar excepción)
+        FilterValidator.validate_filter_tuple(filter_tuple)
+
+    def test_validate_filter_tuple_between_requires_two_values(self, mock_filter_field):
+        """Debe lanzar error si BETWEEN no tiene exactamente dos valores"""
+        # Arrange
+        invalid_tuple = (mock_filter_field.AGE, FilterOperator.BETWEEN, [18])
+
+        # Act & Assert
+        with pytest.raises(FilterValidationError, match="requires two values"):
+            FilterValidator.validate_filter_tuple(invalid_tuple)
+
+    def test_validate_filter_tuple_between_with_string(self, mock_filter_field):
+        """Debe lanzar error si un extremo de BETWEEN es un string"""
+        # Arrange
+        invalid_tuple = (mock_filter_field.AGE, FilterOperator.BETWEEN, [18, "x"])
+
+        # Act & Assert
+        with pytest.raises(FilterValidationError, match="requires numeric value"):
+            FilterValidator.validate_filter_tuple(invalid_tuple)
+
     def test_validate_filter_tuple_eq_with_string(self, mock_filter_field):
         """Debe validar correctamente EQ con cualquier tipo de valor"""
         # Arrange
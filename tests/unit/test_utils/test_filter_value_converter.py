@@ -1,3 +1,5 @@
+import pytest
+from datetime import datetime, timedelta, timezone
 from app.utils.filters.filter_value_converter import FilterValueConverter
 from app.enums.filter import FilterOperator
 
@@ -211,3 +213,75 @@ class TestFilterValueConverter:
         # Assert
         assert result == 0.0
         assert isinstance(result, float)
+
+    def test_convert_iso_date(self):
+        """Debe convertir una fecha ISO 8601 a datetime en un campo de fecha"""
+        # Act
+        result = FilterValueConverter.convert("2025-01-31", FilterOperator.GE, True)
+
+        # Assert
+        assert result == datetime(2025, 1, 31)
+
+    def test_convert_iso_datetime_with_zone_to_utc(self):
+        """Debe pasar a UTC sin zona las fechas con zona horaria"""
+        # Act
+        result = FilterValueConverter.convert(
+            "2025-01-31T10:00:00+02:00", FilterOperator.LT, True
+        )
+
+        # Assert
+        assert result == datetime(2025, 1, 31, 8, 0)
+        assert result.tzinfo is None
+
+    def test_convert_relative_datetime(self):
+        """Debe convertir now-1h en el instante UTC de hace una hora"""
+        # Arrange
+        expected = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=1)
+
+        # Act
+        result = FilterValueConverter.convert("now-1h", FilterOperator.GE, True)
+
+        # Assert
+        assert abs(result - expected) < timedelta(seconds=5)
+
+    def test_convert_invalid_date_stays_string(self):
+        """Una cadena con forma de fecha pero inválida debe quedar como string"""
+        # Act
+        result = FilterValueConverter.convert("2025-13-45", FilterOperator.EQ)
+
+        # Assert
+        assert result == "2025-13-45"
+
+    def test_convert_between_to_list(self):
+        """Debe convertir los dos extremos de between en un campo de fecha"""
+        # Act
+        result = FilterValueConverter.convert(
+            "2025-01-01;2025-02-01", FilterOperator.BETWEEN, True
+        )
+
+        # Assert
+        assert result == [datetime(2025, 1, 1), datetime(2025, 2, 1)]
+
+    def test_dates_stay_strings_outside_datetime_fields(self):
+        """Fuera de los campos de fecha, 'Now' o una fecha deben quedar como texto"""
+        # Act
+        now = FilterValueConverter.convert("Now", FilterOperator.EQ)
+        date = FilterValueConverter.convert("2024-01-01", FilterOperator.EQ)
+
+        # Assert
+        assert now == "Now"
+        assert date == "2024-01-01"
+
+    def test_like_never_converts_to_datetime(self):
+        """LIKE busca texto también en un campo de fecha"""
+        # Act
+        result = FilterValueConverter.convert("2024-01-01", FilterOperator.LIKE, True)
+
+        # Assert
+        assert result == "2024-01-01"
+
+    def test_invalid_value_for_datetime_field_raises(self):
+        """Un valor que no es fecha en un campo de fecha debe rechazarse"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            FilterValueConverter.convert("2025-13-45", FilterOperator.GE, True)
@@ -0,0 +1,50 @@
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from app.utils.uuid7 import uuid7, uuid7_datetime
+
+
+class TestUUID7:
+    """Tests para el generador de UUIDv7"""
+
+    def test_uuid7_has_version_and_variant(self):
+        """Debe generar UUIDs versión 7 con variante RFC 4122"""
+        # Act
+        value = uuid7()
+
+        # Assert
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_uuid7_embeds_current_timestamp(self):
+        """Debe contener el timestamp en milisegundos en los 48 bits altos"""
+        # Arrange
+        before = time.time_ns() // 1_000_000
+
+        # Act
+        value = uuid7()
+
+        # Assert
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after + 1
+
+    def test_uuid7_is_monotonic(self):
+        """Debe generar ids crecientes aunque coincidan en el mismo milisegundo"""
+        # Act
+        values = [uuid7() for _ in range(10_000)]
+
+        # Assert
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+
+    def test_uuid7_datetime_returns_creation_time(self):
+        """Debe devolver el instante UTC codificado en el UUIDv7"""
+        # Arrange
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        # Act
+        created = uuid7_datetime(uuid7())
+
+        # Assert
+        assert abs(created - now) < timedelta(seconds=1)
+        assert uuid7_datetime(uuid4()) is None